@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from logging import getLogger
+from os import cpu_count
+from typing import Iterator, Optional, Set
+
+
+logger = getLogger("aoc21")
+
+
+def can_pin() -> bool:
+    """
+    Check whether processes can be pinned to CPUs on this platform.
+    """
+
+    import os
+
+    return hasattr(os, "sched_setaffinity")
+
+
+def available_cpus() -> Set[int]:
+    """
+    Get the CPUs this process is allowed to run on.
+    """
+
+    if not can_pin():
+        return set(range(cpu_count() or 1))
+
+    from os import sched_getaffinity
+
+    return sched_getaffinity(0)
+
+
+def default_cpu() -> int:
+    """
+    Choose a CPU to pin benchmarks to.
+
+    The last available CPU is used as the first usually handles more interrupts.
+    """
+
+    return max(available_cpus())
+
+
+@contextmanager
+def pinned(cpu: Optional[int] = None) -> Iterator[int]:
+    """
+    Pin this process to a single CPU while the context is active, so the scheduler
+    does not migrate it between CPUs with different caches and frequencies.
+
+    Processes started in the context inherit the affinity.
+
+    :param cpu: The CPU to run on, or None to choose one.
+    :return: The CPU pinned to.
+    """
+
+    cpu = default_cpu() if cpu is None else cpu
+
+    if not can_pin():
+        logger.warning("Pinning to a CPU is not supported on this platform.")
+        yield cpu
+        return
+
+    from os import sched_getaffinity, sched_setaffinity
+
+    previous = sched_getaffinity(0)
+    sched_setaffinity(0, {cpu})
+    logger.info("Pinned to CPU %d.", cpu)
+    try:
+        yield cpu
+    finally:
+        sched_setaffinity(0, previous)
@@ -0,0 +1,124 @@
+from functools import partial
+from io import BytesIO, TextIOWrapper
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, List, NamedTuple, Sequence, TextIO
+
+from aoc21.inputs import read_input_file
+from aoc21.problem import Problem
+from aoc21.solution import Solution
+
+
+logger = getLogger("aoc21")
+
+
+class FileResult(NamedTuple):
+    path: Path
+    size_bytes: int
+    parse_s: float
+    solutions: List[Solution]
+
+    @property
+    def elapsed_s(self) -> float:
+        return self.parse_s + sum(s.elapsed_s for s in self.solutions)
+
+
+class Throughput(NamedTuple):
+    files: int
+    size_bytes: int
+    wall_s: float
+
+    @property
+    def files_per_s(self) -> float:
+        return self.files / self.wall_s if self.wall_s else 0.0
+
+    @property
+    def bytes_per_s(self) -> float:
+        return self.size_bytes / self.wall_s if self.wall_s else 0.0
+
+
+def find_inputs(directory: Path) -> List[Path]:
+    """
+    Find the input files in a directory, ignoring hidden files and subdirectories.
+
+    :param directory: The directory to search.
+    :return: The files, sorted by name.
+    """
+
+    if not directory.is_dir():
+        raise ValueError(f"{directory} is not a directory.")
+
+    return sorted(
+        p for p in directory.iterdir() if p.is_file() and not p.name.startswith(".")
+    )
+
+
+def solve_file(problems: Sequence[Problem], path: Path) -> FileResult:
+    """
+    Solve problems for one day using an input file instead of the puzzle input.
+
+    :param problems: The problems for each part of a day, which must be split into
+    parse and solve phases.
+    :param path: The input file, which is parsed once for all of the problems.
+    :return: The solutions for the file. If parsing fails, every solution has the
+    exception.
+    """
+
+    return _solve(problems, path, path.stat().st_size, partial(read_input_file, path))
+
+
+def solve_data(problems: Sequence[Problem], path: Path, data: bytes) -> FileResult:
+    """
+    Solve problems for one day using the contents of an input file, which was read
+    elsewhere such as by a process sending it to a remote worker.
+
+    :param problems: The problems for each part of a day, which must be split into
+    parse and solve phases.
+    :param path: The input file the data was read from.
+    :param data: The contents of the file.
+    :return: The solutions for the file. If parsing fails, every solution has the
+    exception.
+    """
+
+    def read(parse: Callable[[TextIO], Any]) -> Any:
+        with TextIOWrapper(BytesIO(data), encoding="utf-8") as f:
+            return parse(f)
+
+    return _solve(problems, path, len(data), read)
+
+
+def _solve(
+    problems: Sequence[Problem],
+    path: Path,
+    size_bytes: int,
+    read: Callable[[Callable[[TextIO], Any]], Any],
+) -> FileResult:
+    if any(not p.has_phases for p in problems):
+        raise ValueError("Problems must have separate parse and solve phases.")
+
+    start = perf_counter()
+    try:
+        data = read(problems[0].parse)
+    except Exception as e:
+        logger.error("Failed to parse %s.", path, exc_info=e)
+        parse_s = perf_counter() - start
+        solutions = [Solution(p, None, e, 0.0, 0) for p in problems]
+        return FileResult(path, size_bytes, parse_s, solutions)
+
+    parse_s = perf_counter() - start
+
+    solutions = []
+    for problem in problems:
+        start = perf_counter()
+        try:
+            value, exception = problem.solve(data), None
+        except Exception as e:
+            logger.error("Part %d failed for %s.", problem.part, path, exc_info=e)
+            value, exception = None, e
+        solve_s = perf_counter() - start
+        solutions.append(
+            Solution(problem, value, exception, solve_s, 1, solve_s=solve_s)
+        )
+
+    return FileResult(path, size_bytes, parse_s, solutions)
@@ -0,0 +1,10 @@
+"""
+Input generators and a suite measuring how solve times scale with input size.
+"""
+
+
+# Defaults for the scaling suite, kept here so the command line can use them without
+# importing the suite.
+DEFAULT_FACTOR = 10
+DEFAULT_STEPS = 3
+DEFAULT_TIMEOUT = 10.0
@@ -0,0 +1,332 @@
+from math import isqrt
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Generator(NamedTuple):
+    """
+    Generates inputs for a day in the same format as the puzzle input.
+    """
+
+    generate: Callable[[Random, int], str]
+    # The size of the puzzle input, which generated inputs are scaled from.
+    size: int
+    # What the size counts.
+    unit: str
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """
+    Generate an input for a day.
+
+    The same day, size and seed always generate the same input.
+
+    :param day: The day.
+    :param size: The size of the input, in the units of the day's generator.
+    :param seed: Selects one of the inputs with the same size.
+    :return: The contents of the input file.
+    """
+
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"No generator for day {day}.") from None
+    if size < 1:
+        raise ValueError("Size must be positive.")
+
+    return generator.generate(Random(f"{seed}:{day}:{size}"), size)
+
+
+def _lines(lines: Sequence[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _sonar_depths(rng: Random, size: int) -> str:
+    # Depths mostly increase, with some noise.
+    depths = []
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(str(depth))
+
+    return _lines(depths)
+
+
+def _commands(rng: Random, size: int) -> str:
+    commands = rng.choices(("forward", "down", "up"), weights=(4, 3, 2), k=size)
+    return _lines([f"{c} {rng.randint(1, 9)}" for c in commands])
+
+
+def _diagnostic(rng: Random, size: int) -> str:
+    # Numbers with the same leading bits always differ in the next bit, so finding the
+    # ratings never discards every number. Zero is not a valid number.
+    width = max(12, size.bit_length() + 1)
+    numbers: List[int] = []
+
+    def fill(prefix: int, bits: int, count: int):
+        if count == 1:
+            numbers.append(prefix << bits | rng.randrange(prefix == 0, 1 << bits))
+            return
+
+        half = 1 << bits - 1
+        zeros = half - (prefix == 0)
+        ones = round(count * rng.uniform(0.3, 0.7))
+        ones = min(max(ones, 1, count - zeros), half, count - 1)
+        fill(prefix << 1, bits - 1, count - ones)
+        fill(prefix << 1 | 1, bits - 1, ones)
+
+    fill(0, width, size)
+    rng.shuffle(numbers)
+
+    return _lines([f"{n:0{width}b}" for n in numbers])
+
+
+def _bingo(rng: Random, size: int) -> str:
+    numbers = list(range(100))
+    boards = []
+    for _ in range(size):
+        board = rng.sample(numbers, 25)
+        rows = (board[i : i + 5] for i in range(0, 25, 5))
+        boards.append("\n".join(" ".join(f"{n:2}" for n in row) for row in rows))
+
+    # Every number is drawn, so every board wins eventually.
+    rng.shuffle(numbers)
+    drawn = ",".join(map(str, numbers))
+
+    return "\n\n".join([drawn, *boards]) + "\n"
+
+
+def _vent_lines(rng: Random, size: int) -> str:
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        # Lines are horizontal, vertical or diagonal at 45 degrees.
+        dx, dy = rng.choice(((1, 0), (0, 1), (1, 1), (1, -1)))
+        if rng.random() < 0.5:
+            dx, dy = -dx, -dy
+        length = rng.randint(1, 500)
+        if dx:
+            length = min(length, x1 if dx < 0 else 999 - x1)
+        if dy:
+            length = min(length, y1 if dy < 0 else 999 - y1)
+        x2, y2 = x1 + dx * length, y1 + dy * length
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return _lines(lines)
+
+
+def _lanternfish(rng: Random, size: int) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+def _crabs(rng: Random, size: int) -> str:
+    # Most crabs are close to the lower positions, like the puzzle input.
+    positions = (min(1999, int(rng.expovariate(1 / 400))) for _ in range(size))
+    return ",".join(map(str, positions)) + "\n"
+
+
+# The segments lit for each digit on a seven-segment display.
+_DIGITS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+def _seven_segment(rng: Random, size: int) -> str:
+    def pattern(digit: str) -> str:
+        wired = [wires[ord(s) - ord("a")] for s in digit]
+        rng.shuffle(wired)
+        return "".join(wired)
+
+    entries = []
+    for _ in range(size):
+        wires = rng.sample("abcdefg", 7)
+        signals = [pattern(d) for d in rng.sample(_DIGITS, 10)]
+        outputs = [pattern(d) for d in rng.choices(_DIGITS, k=4)]
+        entries.append(f"{' '.join(signals)} | {' '.join(outputs)}")
+
+    return _lines(entries)
+
+
+def _side(size: int) -> int:
+    # Grids are square, with the size being the number of cells.
+    return max(1, isqrt(size))
+
+
+def _basin_centres(rng: Random, side: int) -> List[Optional[int]]:
+    # Split a row or column into basins separated by walls, where each position gets
+    # the centre of its basin, or None for walls.
+    centres: List[Optional[int]] = []
+    while len(centres) < side:
+        width = rng.randint(4, 11)
+        centres.extend([len(centres) + rng.randrange(width)] * width)
+        centres.append(None)
+
+    return centres[:side]
+
+
+def _heightmap(rng: Random, size: int) -> str:
+    # Basins are separated by walls of height 9 and slope down to a single low point,
+    # like the puzzle input. Random heights would join most of the map into a single
+    # basin with many low points.
+    side = _side(size)
+    columns, rows = _basin_centres(rng, side), _basin_centres(rng, side)
+
+    def height(x: int, y: int) -> str:
+        cx, cy = columns[x], rows[y]
+        if cx is None or cy is None:
+            return "9"
+        return str(min(8, abs(x - cx) + abs(y - cy)))
+
+    return _lines(["".join(height(x, y) for x in range(side)) for y in range(side)])
+
+
+def _octopuses(rng: Random, size: int) -> str:
+    # Random energy levels rarely synchronise, so they are kept within a narrow
+    # range, which synchronises within a few dozen steps.
+    side = _side(size)
+    rows = ("".join(rng.choices("23456", k=side)) for _ in range(side))
+    return _lines(list(rows))
+
+
+_PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def _chunks(rng: Random, size: int) -> str:
+    # The middle completion score is only defined for an odd number of incomplete
+    # lines, so about half of the lines are corrupted to leave an odd number.
+    incomplete = size // 2 | 1
+    corrupted_lines = [i >= incomplete for i in range(size)]
+    rng.shuffle(corrupted_lines)
+
+    lines = []
+    for corrupted in corrupted_lines:
+        stack: List[str] = []
+        line = []
+        length = rng.randint(80, 110)
+        while len(line) < length:
+            if stack and rng.random() < 0.45:
+                line.append(_PAIRS[stack.pop()])
+            else:
+                opening = rng.choice("([{<")
+                stack.append(opening)
+                line.append(opening)
+
+        if corrupted:
+            # Close a chunk with the wrong character, and carry on after it.
+            expected = _PAIRS[stack[-1]] if stack else None
+            line.append(rng.choice([c for c in _PAIRS.values() if c != expected]))
+            line.extend(rng.choices("([{<)]}>", k=rng.randint(0, 10)))
+        elif not stack:
+            # Incomplete lines must leave at least one chunk open.
+            line.append(rng.choice("([{<"))
+
+        lines.append("".join(line))
+
+    return _lines(lines)
+
+
+def _names(count: int, letters: str) -> List[str]:
+    # Two letter names, like the puzzle input, then longer names if they run out.
+    names: List[str] = []
+    length = 2
+    while len(names) < count:
+        for i in range(len(letters) ** length):
+            name = ""
+            for _ in range(length):
+                i, j = divmod(i, len(letters))
+                name += letters[j]
+            if name not in ("start", "end"):
+                names.append(name)
+        length += 1
+
+    return names[:count]
+
+
+def _cave_graph(rng: Random, size: int) -> str:
+    # The size is the number of small caves. Big caves are never connected to each
+    # other, as there would be infinitely many paths between them.
+    small = rng.sample(_names(size + 10, ascii_lowercase), size)
+    big = rng.sample(_names(size + 10, ascii_uppercase), max(1, size // 2))
+    connections = set()
+
+    def connect(a: str, b: str):
+        if a != b:
+            connections.add((a, b) if rng.random() < 0.5 else (b, a))
+
+    for cave in big:
+        for other in rng.sample(small, min(len(small), rng.randint(2, 4))):
+            connect(cave, other)
+    for cave in small:
+        connect(cave, rng.choice(small))
+    for cave in rng.sample(small + big, min(size, 3)):
+        connect("start", cave)
+    for cave in rng.sample(small + big, min(size, 3)):
+        connect(cave, "end")
+
+    return _lines([f"{a}-{b}" for a, b in sorted(connections)])
+
+
+def _folds(rng: Random, size: int) -> str:
+    # Fold the same way as the puzzle input, from 1311 by 895 down to 40 by 6. Each
+    # fold is along the middle of the paper.
+    width, height = 40, 6
+    folds: List[Tuple[str, int]] = []
+    for axis in "xyxyxyxyxyyy":
+        if axis == "x":
+            folds.append((axis, width))
+            width = 2 * width + 1
+        else:
+            folds.append((axis, height))
+            height = 2 * height + 1
+    folds.reverse()
+
+    # Place dots on the folded paper, then unfold them randomly so none lie on a fold.
+    dots = []
+    for _ in range(size):
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, line in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * line - x
+                else:
+                    y = 2 * line - y
+        dots.append(f"{x},{y}")
+
+    instructions = [f"fold along {axis}={line}" for axis, line in folds]
+    return _lines(dots + [""] + instructions)
+
+
+def _polymer(rng: Random, size: int) -> str:
+    # Rules are needed for every pair of elements, like the puzzle input.
+    elements = rng.sample(ascii_uppercase, 10)
+    template = "".join(rng.choices(elements, k=size))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    return _lines([template, ""] + rules)
+
+
+GENERATORS: Dict[int, Generator] = {
+    1: Generator(_sonar_depths, 2000, "depths"),
+    2: Generator(_commands, 1000, "commands"),
+    3: Generator(_diagnostic, 1000, "numbers"),
+    4: Generator(_bingo, 100, "boards"),
+    5: Generator(_vent_lines, 500, "lines"),
+    6: Generator(_lanternfish, 300, "fish"),
+    7: Generator(_crabs, 1000, "crabs"),
+    8: Generator(_seven_segment, 200, "entries"),
+    9: Generator(_heightmap, 10000, "cells"),
+    10: Generator(_chunks, 100, "lines"),
+    11: Generator(_octopuses, 100, "cells"),
+    12: Generator(_cave_graph, 6, "small caves"),
+    13: Generator(_folds, 900, "dots"),
+    14: Generator(_polymer, 20, "elements"),
+}
@@ -0,0 +1,182 @@
+from functools import partial
+from logging import getLogger
+from math import fsum, log
+from pathlib import Path
+from timeit import Timer
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from aoc21.bench import DEFAULT_TIMEOUT
+from aoc21.inputs import read_input_file
+from aoc21.limits import Limits, Timeout, can_limit_time, limited
+from aoc21.problem import Problem
+
+
+# Solves faster than this are repeated to get a more precise time.
+MIN_TIME = 0.2
+REPEAT = 3
+
+logger = getLogger("aoc21")
+
+
+class Measurement(NamedTuple):
+    size: int
+    # The time to parse and solve an input of the size.
+    elapsed_s: float
+
+
+class Scaling(NamedTuple):
+    """
+    How the time taken to solve a problem grows with the size of its input.
+    """
+
+    problem: Problem
+    unit: str
+    measurements: List[Measurement]
+    # Why larger sizes were not measured, or None if every size was.
+    stopped: Optional[str] = None
+    # Whether the solver raised an exception.
+    failed: bool = False
+
+    @property
+    def exponent(self) -> Optional[float]:
+        """
+        The empirical complexity exponent, where the time taken is roughly
+        proportional to the size raised to the exponent.
+        """
+
+        return fit_exponent(self.measurements)
+
+
+def scaled_sizes(size: int, factor: float, steps: int) -> List[int]:
+    """
+    Get a geometric range of sizes.
+
+    :param size: The first size.
+    :param factor: The ratio between consecutive sizes.
+    :param steps: The number of sizes.
+    :return: The sizes, smallest first.
+    """
+
+    if factor <= 1:
+        raise ValueError("Factor must be greater than 1.")
+
+    return [max(1, round(size * factor**i)) for i in range(steps)]
+
+
+def fit_exponent(measurements: Sequence[Measurement]) -> Optional[float]:
+    """
+    Fit a power law to measurements with least squares on a log-log scale.
+
+    :param measurements: The measurements.
+    :return: The exponent of the power law, or None if there are fewer than two
+    distinct sizes.
+    """
+
+    points = [(log(m.size), log(m.elapsed_s)) for m in measurements if m.elapsed_s > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = fsum(x for x, _ in points) / len(points)
+    mean_y = fsum(y for _, y in points) / len(points)
+    covariance = fsum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = fsum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def measure_scaling(
+    problem: Problem,
+    sizes: Sequence[int],
+    directory: Path,
+    seed: int = 0,
+    timeout_s: Optional[float] = DEFAULT_TIMEOUT,
+) -> Scaling:
+    """
+    Time solving a problem with generated inputs of increasing sizes.
+
+    Sizes stop being measured once solving one takes longer than the timeout or
+    raises an exception, or once the time measured so far predicts the next size
+    would take longer than the timeout.
+
+    :param problem: The problem, which must have separate parse and solve phases.
+    :param sizes: The sizes to measure, smallest first.
+    :param directory: Where to write the generated input files.
+    :param seed: Selects the generated inputs.
+    :param timeout_s: The longest time to spend solving one input, or None to wait
+    for every size.
+    :return: The measurements.
+    """
+
+    from aoc21.bench.generators import GENERATORS, generate
+
+    generator = GENERATORS[problem.day]
+    scaling = Scaling(problem, generator.unit, [])
+    if not problem.has_phases:
+        return scaling._replace(stopped="Cannot be given other inputs")
+
+    for size in sizes:
+        predicted = _predict(scaling.measurements, size)
+        if timeout_s is not None and predicted > timeout_s:
+            return scaling._replace(stopped=f"Predicted to time out at {size}")
+
+        path = directory / f"day{problem.day:02}-{size}.txt"
+        if not path.exists():
+            path.write_text(generate(problem.day, size, seed), encoding="utf-8")
+
+        solve = partial(_solve, problem, path)
+        try:
+            elapsed_s = _time(solve, timeout_s)
+        except Timeout:
+            return scaling._replace(stopped=f"Timed out at {size}")
+        except Exception as e:
+            logger.error("Failed to solve %s.", path, exc_info=e)
+            return scaling._replace(
+                stopped=f"{e.__class__.__name__} at {size}", failed=True
+            )
+
+        logger.info(
+            "Solved day %d, part %d with %d %s.",
+            problem.day,
+            problem.part,
+            size,
+            generator.unit,
+        )
+        scaling.measurements.append(Measurement(size, elapsed_s))
+
+    return scaling
+
+
+def _predict(measurements: Sequence[Measurement], size: int) -> float:
+    if not measurements:
+        return 0.0
+
+    # Assume solvers are at least linear, as the input has to be read.
+    exponent = max(1.0, fit_exponent(measurements) or 1.0)
+    last = measurements[-1]
+    return last.elapsed_s * (size / last.size) ** exponent
+
+
+def _solve(problem: Problem, path: Path) -> object:
+    return problem.solve(read_input_file(path, problem.parse))
+
+
+def _time(solve: Callable[[], object], timeout_s: Optional[float]) -> float:
+    timer = Timer(solve)
+    # Without timeouts, sizes are still skipped once predicted to take too long.
+    limits = Limits(timeout_s=timeout_s if can_limit_time() else None)
+    with limited(limits):
+        elapsed_s = timer.timeit(number=1)
+
+    if elapsed_s >= MIN_TIME:
+        return elapsed_s
+
+    # Fast solves are repeated enough times to be timed precisely. Each timing is
+    # limited on its own, as together they can take longer than the timeout.
+    with limited(limits):
+        number, _ = timer.autorange()
+    times = []
+    for _ in range(REPEAT):
+        with limited(limits):
+            times.append(timer.timeit(number))
+
+    return min(times) / number
@@ -0,0 +1,111 @@
+from logging import getLogger
+from time import perf_counter
+from timeit import Timer
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from aoc21.stats import relative_interval_width
+
+
+GC_MODES = ("disabled", "enabled", "both")
+STABLE_WARMUP = 3
+
+logger = getLogger("aoc21")
+
+
+class BenchmarkSettings(NamedTuple):
+    """
+    Settings for repeating benchmarks.
+
+    With a fixed number of repeats, each timer is repeated exactly that many times.
+    Adaptive benchmarks repeat at least that many times, continuing until the
+    confidence interval of the median is narrow enough or the time budget runs out.
+
+    Like timeit, the garbage collector is disabled while timing by default. It can be
+    enabled instead, or benchmarks can be repeated both ways to show its cost.
+
+    Stable benchmarks solve one problem at a time pinned to a single CPU, warm up
+    before sampling and subtract the overhead of the timer calling the solver, so
+    results can be compared between runs.
+    """
+
+    repeat: int = 5
+    adaptive: bool = False
+    target: float = 0.05
+    budget_s: float = 10.0
+    max_repeat: int = 1000
+    gc: str = "disabled"
+    stable: bool = False
+    cpu: Optional[int] = None
+    warmup: int = 0
+
+
+def warm_up(timers: Sequence[Timer], runs: int, repeat: int):
+    """
+    Run timers without recording the times, so caches and allocators are warm before
+    sampling.
+    """
+
+    for _ in range(repeat):
+        for t in timers:
+            t.timeit(runs)
+
+
+def timer_overhead(runs: int, repeat: int = 5) -> float:
+    """
+    Measure the time per run taken by a timer calling a function which does nothing.
+
+    :param runs: The number of runs for each repeat, which should be the same as for
+    the timers the overhead is subtracted from.
+    :param repeat: The number of repeats, of which the fastest is used.
+    :return: The overhead in seconds.
+    """
+
+    timer = Timer(_nothing)
+    return min(timer.timeit(runs) / runs for _ in range(repeat))
+
+
+def sample(
+    timers: Sequence[Timer], runs: int, settings: BenchmarkSettings
+) -> List[Tuple[float, ...]]:
+    """
+    Repeatedly time a sequence of timers.
+
+    :param timers: Timers for each phase being benchmarked.
+    :param runs: The number of runs for each repeat.
+    :param settings: Controls how many times the timers are repeated.
+    :return: A list with the time per run of each timer for every repeat.
+    """
+
+    if settings.repeat < 1:
+        raise ValueError("Expected at least one repeat.")
+
+    samples: List[Tuple[float, ...]] = []
+    start = perf_counter()
+
+    while True:
+        samples.append(tuple(t.timeit(runs) / runs for t in timers))
+
+        if len(samples) < settings.repeat:
+            continue
+        if not settings.adaptive or len(samples) >= settings.max_repeat:
+            break
+
+        width = relative_interval_width([sum(s) for s in samples])
+        if width <= settings.target:
+            logger.debug(
+                "Median within %.1f%% after %d repeats.", width * 100, len(samples)
+            )
+            break
+        if perf_counter() - start >= settings.budget_s:
+            logger.info(
+                "Time budget ran out after %d repeats with interval width %.1f%%.",
+                len(samples),
+                width * 100,
+            )
+            break
+
+    return samples
+
+
+def _nothing():
+    pass
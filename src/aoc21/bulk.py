@@ -0,0 +1,63 @@
+from typing import IO, List, Tuple
+
+
+# Maps the ASCII digits to the values 0 to 9, so iterating over translated bytes gives
+# the digits as integers.
+_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def read_buffer(f: IO) -> bytes:
+    """
+    Read the raw contents of an input file without decoding them.
+
+    The whole file is read at once, so the helpers below can parse it with bytes
+    methods instead of decoding and splitting it line by line.
+
+    :param f: The file, which must not have been read from. Text files are read through
+    their underlying binary buffer when they have one.
+    :return: The contents of the file.
+    """
+
+    data = getattr(f, "buffer", f).read()
+    # Files opened in text mode without a buffer, such as StringIO.
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def split_ints(data: bytes, sep: bytes = b",") -> Tuple[int, ...]:
+    """
+    Parse integers separated by a delimiter, such as '3,4,3,1,2'.
+    """
+
+    # Integers can be parsed directly from bytes, ignoring surrounding whitespace.
+    return tuple(map(int, data.split(sep)))
+
+
+def ints(data: bytes) -> Tuple[int, ...]:
+    """
+    Parse integers separated by any whitespace, including line breaks.
+    """
+
+    return tuple(map(int, data.split()))
+
+
+def digit_grid(data: bytes) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Parse lines of single digits, such as '2199943210', into rows of integers.
+    """
+
+    rows = data.split()
+    for row in rows:
+        if not row.isdigit():
+            raise ValueError(f"Expected a line of digits, got {row!r}.")
+
+    # Split before translating, as the digit 9 would become a tab.
+    return tuple(tuple(row.translate(_DIGITS)) for row in rows)
+
+
+def split_blocks(data: bytes) -> List[bytes]:
+    """
+    Split the contents of an input file into blocks separated by empty lines.
+    """
+
+    data = data.replace(b"\r\n", b"\n").strip(b"\n")
+    return [b for b in data.split(b"\n\n") if b.strip()]
@@ -0,0 +1,199 @@
+from ast import Import, ImportFrom, parse, walk
+from functools import lru_cache
+from hashlib import sha256
+from importlib.util import find_spec
+from logging import getLogger
+from os import environ, replace, utime
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional, Tuple
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+logger = getLogger("aoc21")
+
+
+class DiskCache:
+    """
+    Stores pickled values as files in a directory.
+
+    Once the total size of the files exceeds the limit, the least recently used files
+    are removed. Each file's modification time is updated when it is read so it can be
+    used to find the least recently used files.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory: Path = Path(directory)
+        self.max_bytes: int = max_bytes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.directory)!r}, {self.max_bytes})"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Get a value from the cache.
+
+        :param key: The key for the value.
+        :return: A tuple of whether the value was found, and the value itself.
+        """
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            value = loads(data)
+        except FileNotFoundError:
+            return False, None
+        except Exception as e:
+            # The file could be truncated or refer to a class that no longer exists.
+            logger.warning("Discarding unreadable cache file %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return False, None
+
+        utime(path)
+        return True, value
+
+    def put(self, key: str, value: Any):
+        """
+        Add a value to the cache, removing older values if the cache is too large.
+
+        :param key: The key for the value.
+        :param value: A value which can be pickled.
+        """
+
+        data = dumps(value, protocol=HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            logger.info("Not caching %s as it is larger than the cache.", key)
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so other processes never read a partially
+        # written file.
+        with NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        replace(f.name, self._path(key))
+
+        self._evict()
+
+    def clear(self):
+        """
+        Remove all values from the cache.
+        """
+
+        for path in self._files():
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def _files(self):
+        return self.directory.glob("*.pickle")
+
+    def _evict(self):
+        files = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        # Remove the least recently used files first.
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            logger.debug("Evicting cache file %s.", path)
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def default_cache_directory() -> Path:
+    """
+    Get the directory to store cached data in if not otherwise specified.
+    """
+
+    base = environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "aoc21"
+
+
+def digest(data: bytes) -> str:
+    """
+    Get the hexadecimal SHA-256 digest of some data.
+    """
+
+    return sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def module_digest(name: str) -> str:
+    """
+    Get the digest of a module's source so cached values can be discarded when the
+    module is changed.
+
+    :param name: The qualified name of the module.
+    :return: The digest of the module's source file.
+    """
+
+    spec = find_spec(name)
+    if spec is None or spec.origin is None:
+        raise ValueError(f"Cannot find source for module {name!r}.")
+
+    return digest(Path(spec.origin).read_bytes())
+
+
+@lru_cache(maxsize=None)
+def dependencies(name: str) -> Tuple[str, ...]:
+    """
+    Find the modules a module imports from its own package, directly or through other
+    modules, including imports inside functions.
+
+    :param name: The qualified name of the module.
+    :return: The names of the module and its dependencies, sorted.
+    """
+
+    package = name.partition(".")[0]
+    found = set()
+    pending = [name]
+    while pending:
+        module = pending.pop()
+        if module in found:
+            continue
+
+        spec = find_spec(module)
+        if spec is None or spec.origin is None:
+            raise ValueError(f"Cannot find source for module {module!r}.")
+        found.add(module)
+
+        for node in walk(parse(Path(spec.origin).read_bytes(), spec.origin)):
+            if isinstance(node, Import):
+                imported = [alias.name for alias in node.names]
+            elif isinstance(node, ImportFrom) and node.level == 0 and node.module:
+                imported = [node.module]
+            else:
+                continue
+            pending.extend(i for i in imported if i.partition(".")[0] == package)
+
+    return tuple(sorted(found))
+
+
+def source_digest(name: str) -> str:
+    """
+    Get the digest of the source of a module and every module it depends on in its
+    package, so cached values can be discarded when shared helpers are changed.
+
+    :param name: The qualified name of the module.
+    :return: The combined digest of the source files.
+    """
+
+    return combine_digests(*(f"{m}:{module_digest(m)}" for m in dependencies(name)))
+
+
+def combine_digests(*parts: Optional[str]) -> str:
+    """
+    Combine digests and other key components into a single digest.
+    """
+
+    return digest("\0".join(p or "" for p in parts).encode())
@@ -1,48 +1,85 @@
-from aoc21.days import (
-    day01,
-    day02,
-    day03,
-    day04,
-    day05,
-    day06,
-    day07,
-    day08,
-    day09,
-    day10,
-    day11,
-    day12,
-    day13,
-    day14,
-)
+from importlib import import_module
+from typing import Collection, Dict, List, Optional
+
 from aoc21.problem import Problem
 
-PROBLEMS = [
-    Problem(1, 1, day01.part1),
-    Problem(1, 2, day01.part2),
-    Problem(2, 1, day02.part1),
-    Problem(2, 2, day02.part2),
-    Problem(3, 1, day03.part1),
-    Problem(3, 2, day03.part2),
-    Problem(4, 1, day04.part1),
-    Problem(4, 2, day04.part2),
-    Problem(5, 1, day05.part1),
-    Problem(5, 2, day05.part2),
-    Problem(6, 1, day06.part1),
-    Problem(6, 2, day06.part2),
-    Problem(7, 1, day07.part1),
-    Problem(7, 2, day07.part2),
-    Problem(8, 1, day08.part1),
-    Problem(8, 2, day08.part2),
-    Problem(9, 1, day09.part1),
-    Problem(9, 2, day09.part2),
-    Problem(10, 1, day10.part1),
-    Problem(10, 2, day10.part2),
-    Problem(11, 1, day11.part1),
-    Problem(11, 2, day11.part2),
-    Problem(12, 1, day12.part1),
-    Problem(12, 2, day12.part2),
-    Problem(13, 1, day13.part1),
-    Problem(13, 2, day13.part2),
-    Problem(14, 1, day14.part1),
-    Problem(14, 2, day14.part2),
-]
+
+# Day modules are only imported once problems for that day are needed, so running a
+# single day does not pay for importing all of them.
+DAYS: Dict[int, str] = {
+    1: "aoc21.days.day01",
+    2: "aoc21.days.day02",
+    3: "aoc21.days.day03",
+    4: "aoc21.days.day04",
+    5: "aoc21.days.day05",
+    6: "aoc21.days.day06",
+    7: "aoc21.days.day07",
+    8: "aoc21.days.day08",
+    9: "aoc21.days.day09",
+    10: "aoc21.days.day10",
+    11: "aoc21.days.day11",
+    12: "aoc21.days.day12",
+    13: "aoc21.days.day13",
+    14: "aoc21.days.day14",
+}
+
+
+# Days with inputs parsed into arrays of integers, which can be shared with worker
+# processes through shared memory instead of each parsing them.
+ARRAY_INPUTS = frozenset({1, 3, 6, 7, 9, 11})
+
+
+def load_problems(day: int) -> List[Problem]:
+    """
+    Import the module for a day and get its problems.
+
+    :param day: The day.
+    :return: The problems for each part of the day, in order.
+    """
+
+    try:
+        name = DAYS[day]
+    except KeyError:
+        raise ValueError(f"No solutions for day {day}.") from None
+
+    module = import_module(name)
+    problems = []
+    part = 1
+    while hasattr(module, f"part{part}"):
+        problems.append(
+            Problem(
+                day,
+                part,
+                getattr(module, f"part{part}"),
+                getattr(module, "parse", None),
+                getattr(module, f"solve{part}", None),
+            )
+        )
+        part += 1
+
+    return problems
+
+
+def get_problems(days: Optional[Collection[int]] = None) -> List[Problem]:
+    """
+    Get problems for a selection of days, only importing the modules needed.
+
+    :param days: Days to get problems for, or None to get problems for every day.
+    Days without solutions are ignored.
+    :return: The problems, ordered by day and part.
+    """
+
+    problems = []
+    for day in sorted(DAYS):
+        if days is None or day in days:
+            problems.extend(load_problems(day))
+
+    return problems
+
+
+def __getattr__(name: str):
+    # Keep the full list of problems available without importing every day up front.
+    if name == "PROBLEMS":
+        return get_problems()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
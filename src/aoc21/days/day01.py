@@ -1,22 +1,31 @@
-from importlib.resources import open_text
-from typing import Iterable, List
+from typing import Iterable, Sequence, TextIO, Tuple
 
 from more_itertools import windowed
 
+from aoc21.bulk import ints, read_buffer
+from aoc21.inputs import load_input
 
-def _get_measurements() -> List[int]:
-    with open_text("aoc21.days", "day01.txt") as f:
-        return [int(line.strip()) for line in f]
+
+def parse(f: TextIO) -> Tuple[int, ...]:
+    return ints(read_buffer(f))
 
 
 def _count_increases(data: Iterable[int]) -> int:
     return sum(1 for (i, j) in windowed(data, 2) if i < j)
 
 
+def solve1(measurements: Sequence[int]) -> object:
+    return _count_increases(measurements)
+
+
+def solve2(measurements: Sequence[int]) -> object:
+    windows = map(sum, windowed(measurements, 3))
+    return _count_increases(windows)
+
+
 def part1() -> object:
-    return _count_increases(_get_measurements())
+    return solve1(load_input(1, parse))
 
 
 def part2() -> object:
-    windows = map(sum, windowed(_get_measurements(), 3))
-    return _count_increases(windows)
+    return solve2(load_input(1, parse))
@@ -1,6 +1,7 @@
 from enum import Enum
-from importlib.resources import open_text
-from typing import Iterable, List, NamedTuple, Tuple
+from typing import Iterable, NamedTuple, Sequence, TextIO, Tuple
+
+from aoc21.inputs import load_input
 
 
 class CommandType(Enum):
@@ -24,9 +25,8 @@ class Command(NamedTuple):
             ) from e
 
 
-def _get_commands() -> List[Command]:
-    with open_text("aoc21.days", "day02.txt") as f:
-        return list(map(Command.parse, f))
+def parse(f: TextIO) -> Tuple[Command, ...]:
+    return tuple(map(Command.parse, f))
 
 
 def apply_commands(commands: Iterable[Command]) -> Tuple[int, int]:
@@ -60,13 +60,21 @@ def apply_commands_with_aim(commands: Iterable[Command]) -> Tuple[int, int]:
     return horizontal, vertical
 
 
-def part1() -> object:
-    horizontal, vertical = apply_commands(_get_commands())
+def solve1(commands: Sequence[Command]) -> object:
+    horizontal, vertical = apply_commands(commands)
 
     return horizontal * vertical
 
 
-def part2() -> object:
-    horizontal, vertical = apply_commands_with_aim(_get_commands())
+def solve2(commands: Sequence[Command]) -> object:
+    horizontal, vertical = apply_commands_with_aim(commands)
 
     return horizontal * vertical
+
+
+def part1() -> object:
+    return solve1(load_input(2, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(2, parse))
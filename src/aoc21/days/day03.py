@@ -1,7 +1,9 @@
 from enum import Enum
-from importlib.resources import open_text
 from math import floor, log2
-from typing import Sequence, Tuple, List
+from typing import Sequence, TextIO, Tuple
+
+from aoc21.bulk import read_buffer
+from aoc21.inputs import load_input
 
 
 class Rating(Enum):
@@ -65,21 +67,26 @@ def find_rating(numbers: Sequence[int], rating: Rating) -> int:
     return remaining[0]
 
 
-def _get_binary_numbers() -> List[int]:
-    with open_text("aoc21.days", "day03.txt") as f:
-        return [int(line.strip(), 2) for line in f]
+def parse(f: TextIO) -> Tuple[int, ...]:
+    return tuple(int(line, 2) for line in read_buffer(f).split())
 
 
-def part1() -> object:
-    numbers = _get_binary_numbers()
+def solve1(numbers: Sequence[int]) -> object:
     gamma, epsilon = find_gamma_epsilon(numbers)
 
     return gamma * epsilon
 
 
-def part2() -> object:
-    numbers = _get_binary_numbers()
+def solve2(numbers: Sequence[int]) -> object:
     oxygen = find_rating(numbers, Rating.OXYGEN)
     carbon_dioxide = find_rating(numbers, Rating.CARBON_DIOXIDE)
 
     return oxygen * carbon_dioxide
+
+
+def part1() -> object:
+    return solve1(load_input(3, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(3, parse))
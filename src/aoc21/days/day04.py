@@ -1,7 +1,9 @@
-from importlib.resources import open_text
 from itertools import chain
 from math import isqrt
-from typing import Iterable, List, NamedTuple, Sequence
+from typing import Iterable, List, NamedTuple, Sequence, TextIO
+
+from aoc21.bulk import ints, read_buffer, split_blocks, split_ints
+from aoc21.inputs import load_input
 
 
 class BoardScore(NamedTuple):
@@ -74,48 +76,24 @@ class BoardGame(NamedTuple):
         return board.draw_until_complete(self.numbers)
 
 
-def _split_on_empty(iterable: Iterable[str]) -> Iterable[Sequence[str]]:
-    iterator = iter(iterable)
-
-    while True:
-        sequence = []
-
-        for value in iterator:
-            if value:
-                sequence.append(value)
-            else:
-                # Ran into empty string; continue after yielding sequence.
-                yield sequence
-                break
-        else:
-            # Iterator has been exhausted; stop after yielding sequence.
-            yield sequence
-            return
-
-
-def _create_board(group: Sequence[str]) -> Board:
-    integers = map(int, chain.from_iterable(map(str.split, group)))
-    return Board(integers)
-
+def parse(f: TextIO) -> BoardGame:
+    # The first block is a sequence of integers separated by commas, and the rest are
+    # boards.
+    numbers, *boards = split_blocks(read_buffer(f))
+    return BoardGame(split_ints(numbers), tuple(Board(ints(b)) for b in boards))
 
-def _create_board_game() -> BoardGame:
-    with open_text("aoc21.days", "day04.txt") as f:
-        lines = map(str.strip, f)
 
-        # Read the first line as a sequence of integers separated by commas.
-        numbers = list(map(int, next(lines).split(",")))
-        # Skip the next line, which is expected to be empty.
-        next(lines)
+def solve1(game: BoardGame) -> object:
+    return game.first_game_to_win().score
 
-        # Read the rest of lines as boards, separated by empty lines.
-        boards = list(map(_create_board, _split_on_empty(lines)))
 
-        return BoardGame(numbers, boards)
+def solve2(game: BoardGame) -> object:
+    return game.last_game_to_win().score
 
 
 def part1() -> object:
-    return _create_board_game().first_game_to_win().score
+    return solve1(load_input(4, parse))
 
 
 def part2() -> object:
-    return _create_board_game().last_game_to_win().score
+    return solve2(load_input(4, parse))
@@ -1,6 +1,7 @@
 from collections import Counter
-from importlib.resources import open_text
-from typing import NamedTuple, Iterable, List
+from typing import NamedTuple, Iterable, Sequence, TextIO, Tuple
+
+from aoc21.inputs import load_input
 
 
 class Position(NamedTuple):
@@ -70,9 +71,8 @@ def _inclusive_range(start: int, end: int) -> Iterable[int]:
         return range(start, end - 1, -1)
 
 
-def _get_data() -> List[Line]:
-    with open_text("aoc21.days", "day05.txt") as f:
-        return list(map(Line.parse, f))
+def parse(f: TextIO) -> Tuple[Line, ...]:
+    return tuple(map(Line.parse, f))
 
 
 def _count_overlaps(lines: Iterable[Line]) -> int:
@@ -83,9 +83,17 @@ def _count_overlaps(lines: Iterable[Line]) -> int:
     return sum(1 for c in occupied.values() if c > 1)
 
 
+def solve1(lines: Sequence[Line]) -> object:
+    return _count_overlaps(filter(Line.is_horizontal_or_vertical, lines))
+
+
+def solve2(lines: Sequence[Line]) -> object:
+    return _count_overlaps(lines)
+
+
 def part1() -> object:
-    return _count_overlaps(filter(Line.is_horizontal_or_vertical, _get_data()))
+    return solve1(load_input(5, parse))
 
 
 def part2() -> object:
-    return _count_overlaps(_get_data())
+    return solve2(load_input(5, parse))
@@ -1,5 +1,7 @@
-from importlib.resources import open_text
-from typing import Iterable, List
+from typing import Iterable, List, Sequence, TextIO, Tuple
+
+from aoc21.bulk import read_buffer, split_ints
+from aoc21.inputs import load_input
 
 
 class School:
@@ -29,21 +31,29 @@ class School:
         self._timers[8] = timer_0
 
 
-def _get_school() -> School:
-    with open_text("aoc21.days", "day06.txt") as f:
-        # Expect one line.
-        return School(map(int, f.readline().split(",")))
+def parse(f: TextIO) -> Tuple[int, ...]:
+    # Expect one line.
+    return split_ints(read_buffer(f))
 
 
-def part1() -> object:
-    school = _get_school()
+def solve1(timers: Sequence[int]) -> object:
+    # The school is changed by stepping through days, so create a new one each time.
+    school = School(timers)
     school.step(80)
 
     return school.size
 
 
-def part2() -> object:
-    school = _get_school()
+def solve2(timers: Sequence[int]) -> object:
+    school = School(timers)
     school.step(256)
 
     return school.size
+
+
+def part1() -> object:
+    return solve1(load_input(6, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(6, parse))
@@ -1,5 +1,7 @@
-from importlib.resources import open_text
-from typing import Callable, Iterable, List, Tuple
+from typing import Callable, Iterable, Sequence, TextIO, Tuple
+
+from aoc21.bulk import read_buffer, split_ints
+from aoc21.inputs import load_input
 
 
 def find_minimum_sum_distances(
@@ -36,19 +38,26 @@ def _triangular(x: int) -> int:
     return x * (x + 1) // 2
 
 
-def _get_positions() -> List[int]:
-    with open_text("aoc21.days", "day07.txt") as f:
-        # Expect all numbers on a single line.
-        return list(map(int, f.readline().split(",")))
+def parse(f: TextIO) -> Tuple[int, ...]:
+    # Expect all numbers on a single line.
+    return split_ints(read_buffer(f))
 
 
-def part1() -> object:
-    _, required = find_minimum_sum_distances(sum_constant, _get_positions())
+def solve1(positions: Sequence[int]) -> object:
+    _, required = find_minimum_sum_distances(sum_constant, positions)
 
     return required
 
 
-def part2() -> object:
-    _, required = find_minimum_sum_distances(sum_increasing, _get_positions())
+def solve2(positions: Sequence[int]) -> object:
+    _, required = find_minimum_sum_distances(sum_increasing, positions)
 
     return required
+
+
+def part1() -> object:
+    return solve1(load_input(7, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(7, parse))
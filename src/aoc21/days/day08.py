@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from enum import Flag
-from importlib.resources import open_text
 from itertools import islice
-from typing import Dict, List, Mapping
+from typing import Dict, List, Mapping, Sequence, TextIO, Tuple
+
+from aoc21.inputs import load_input
 
 
 class Segment(Flag):
@@ -118,16 +119,23 @@ class Entry:
         return {s: d for d, s in digits.items()}
 
 
-def _get_entries() -> List[Entry]:
-    with open_text("aoc21.days", "day08.txt") as f:
-        return list(map(Entry.parse, f))
+def parse(f: TextIO) -> Tuple[Entry, ...]:
+    return tuple(map(Entry.parse, f))
 
 
-def part1() -> object:
+def solve1(entries: Sequence[Entry]) -> object:
     # The digits 1, 4, 7 and 8 have 2, 4, 3 and 7 segments respectively.
     unique = (2, 3, 4, 7)
-    return sum(1 for e in _get_entries() for d in e.digits if len(d) in unique)
+    return sum(1 for e in entries for d in e.digits if len(d) in unique)
+
+
+def solve2(entries: Sequence[Entry]) -> object:
+    return sum(map(Entry.decode, entries))
+
+
+def part1() -> object:
+    return solve1(load_input(8, parse))
 
 
 def part2() -> object:
-    return sum(map(Entry.decode, _get_entries()))
+    return solve2(load_input(8, parse))
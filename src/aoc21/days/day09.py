@@ -1,7 +1,20 @@
 from collections import deque
-from importlib.resources import open_text
 from itertools import islice
-from typing import Iterable, Mapping, Iterator, NamedTuple, Set, Deque, List
+from typing import (
+    Iterable,
+    Mapping,
+    Iterator,
+    NamedTuple,
+    Set,
+    Deque,
+    List,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from aoc21.bulk import digit_grid, read_buffer
+from aoc21.inputs import load_input
 
 
 class Point(NamedTuple):
@@ -86,9 +99,9 @@ class HeightMap(Mapping[Point, int]):
         return found
 
 
-def _get_heightmap() -> HeightMap:
-    with open_text("aoc21.days", "day09.txt") as f:
-        return HeightMap.parse(f.read())
+def parse(f: TextIO) -> Tuple[Tuple[int, ...], ...]:
+    # Keep the parsed input as plain rows of integers so it can be shared.
+    return digit_grid(read_buffer(f))
 
 
 def _product(numbers: Iterable[int]) -> int:
@@ -99,12 +112,20 @@ def _product(numbers: Iterable[int]) -> int:
     return product
 
 
-def part1() -> object:
-    height_map = _get_heightmap()
+def solve1(heights: Sequence[Sequence[int]]) -> object:
+    height_map = HeightMap(heights)
     return sum(map(height_map.get_risk_level, height_map.find_low_points()))
 
 
-def part2() -> object:
-    height_map = _get_heightmap()
+def solve2(heights: Sequence[Sequence[int]]) -> object:
+    height_map = HeightMap(heights)
     basins = sorted(height_map.find_basins(), key=len, reverse=True)
     return _product(map(len, islice(basins, 3)))
+
+
+def part1() -> object:
+    return solve1(load_input(9, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(9, parse))
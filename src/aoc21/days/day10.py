@@ -1,7 +1,8 @@
 from collections import deque
 from dataclasses import dataclass
-from importlib.resources import open_text
-from typing import Deque, Iterable, List, Optional
+from typing import Deque, Iterable, Optional, Sequence, TextIO, Tuple
+
+from aoc21.inputs import load_input
 
 
 PAIRS = {
@@ -71,20 +72,26 @@ def _median(integers: Iterable[int]) -> int:
     return ordered[len(ordered) // 2]
 
 
-def _read_chunks() -> List[str]:
-    with open_text("aoc21.days", "day10.txt") as f:
-        return list(map(str.strip, f))
+def parse(f: TextIO) -> Tuple[str, ...]:
+    return tuple(map(str.strip, f))
+
 
+def solve1(lines: Sequence[str]) -> object:
+    return sum(map(ParseResult.get_illegal_score, map(_parse_chunks, lines)))
 
-def _parse_all_chunks() -> List[ParseResult]:
-    return map(_parse_chunks, _read_chunks())
+
+def solve2(lines: Sequence[str]) -> object:
+    return _median(
+        map(
+            ParseResult.complete,
+            filter(ParseResult.is_valid, map(_parse_chunks, lines)),
+        )
+    )
 
 
 def part1() -> object:
-    return sum(map(ParseResult.get_illegal_score, _parse_all_chunks()))
+    return solve1(load_input(10, parse))
 
 
 def part2() -> object:
-    return _median(
-        map(ParseResult.complete, filter(ParseResult.is_valid, _parse_all_chunks()))
-    )
+    return solve2(load_input(10, parse))
@@ -1,7 +1,19 @@
 from collections import deque
-from importlib.resources import open_text
 from itertools import count
-from typing import NamedTuple, Iterable, List, Iterator, Mapping, Set, Deque
+from typing import (
+    NamedTuple,
+    Iterable,
+    List,
+    Iterator,
+    Mapping,
+    Deque,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from aoc21.bulk import digit_grid, read_buffer
+from aoc21.inputs import load_input
 
 
 class Point(NamedTuple):
@@ -103,18 +115,22 @@ class OctopusGrid(Mapping[Point, int]):
         self._grid[point.y][point.x] = 0
 
 
-def _read_row(s: str) -> Iterable[int]:
-    return map(int, s.strip())
+def parse(f: TextIO) -> Tuple[Tuple[int, ...], ...]:
+    return digit_grid(read_buffer(f))
 
 
-def _read_grid() -> OctopusGrid:
-    with open_text("aoc21.days", "day11.txt") as f:
-        return OctopusGrid(map(_read_row, f))
+def solve1(levels: Sequence[Sequence[int]]) -> object:
+    # The grid is changed by stepping through, so create a new one each time.
+    return OctopusGrid(levels).step(100)
+
+
+def solve2(levels: Sequence[Sequence[int]]) -> object:
+    return OctopusGrid(levels).step_until_all_flash()
 
 
 def part1() -> object:
-    return _read_grid().step(100)
+    return solve1(load_input(11, parse))
 
 
 def part2() -> object:
-    return _read_grid().step_until_all_flash()
+    return solve2(load_input(11, parse))
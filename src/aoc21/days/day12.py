@@ -1,5 +1,4 @@
 from collections import defaultdict, Counter
-from importlib.resources import open_text
 from itertools import chain
 from typing import (
     Tuple,
@@ -10,8 +9,11 @@ from typing import (
     Dict,
     NamedTuple,
     Optional,
+    TextIO,
 )
 
+from aoc21.inputs import load_input
+
 
 class Visited(NamedTuple):
     last: str
@@ -95,9 +97,8 @@ def _parse_connection(s: str) -> Tuple[str, str]:
     return start, end
 
 
-def _create_cavern() -> Cavern:
-    with open_text("aoc21.days", "day12.txt") as f:
-        return Cavern(map(_parse_connection, f))
+def parse(f: TextIO) -> Cavern:
+    return Cavern(map(_parse_connection, f))
 
 
 def _path_has_small_cave(path: Sequence[str]) -> bool:
@@ -105,9 +106,17 @@ def _path_has_small_cave(path: Sequence[str]) -> bool:
     return any(path[i].islower() for i in range(1, len(path) - 1))
 
 
+def solve1(cavern: Cavern) -> object:
+    return cavern.count_paths(visit_once=True)
+
+
+def solve2(cavern: Cavern) -> object:
+    return cavern.count_paths(visit_once=False)
+
+
 def part1() -> object:
-    return _create_cavern().count_paths(visit_once=True)
+    return solve1(load_input(12, parse))
 
 
 def part2() -> object:
-    return _create_cavern().count_paths(visit_once=False)
+    return solve2(load_input(12, parse))
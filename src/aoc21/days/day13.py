@@ -1,8 +1,18 @@
 from enum import Enum
-from importlib.resources import open_text
 from logging import getLogger
 from os import linesep
-from typing import AbstractSet, Iterable, Iterator, List, NamedTuple, Set, Tuple
+from typing import (
+    AbstractSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from aoc21.inputs import load_input
 
 
 logger = getLogger("aoc21.days.day13")
@@ -102,32 +112,31 @@ class Paper(AbstractSet[Dot]):
         return Paper(dots)
 
 
-def _read_paper_and_instructions() -> Tuple[Paper, List[FoldInstruction]]:
-    with open_text("aoc21.days", "day13.txt") as f:
-        lines = iter(f)
-        dots = []
-        instructions = []
+PaperAndInstructions = Tuple[Paper, Tuple[FoldInstruction, ...]]
 
-        for line in lines:
-            if not line.strip():
-                break
-            dots.append(Dot.parse(line))
 
-        paper = Paper(dots)
+def parse(f: TextIO) -> PaperAndInstructions:
+    lines = iter(f)
+    dots = []
 
-        for line in lines:
-            instructions.append(FoldInstruction.parse(line))
+    for line in lines:
+        if not line.strip():
+            break
+        dots.append(Dot.parse(line))
 
-        return paper, instructions
+    paper = Paper(dots)
+    instructions = tuple(map(FoldInstruction.parse, lines))
 
+    return paper, instructions
 
-def part1() -> object:
-    paper, instructions = _read_paper_and_instructions()
+
+def solve1(paper_and_instructions: PaperAndInstructions) -> object:
+    paper, instructions = paper_and_instructions
     return len(paper.fold(instructions[0]))
 
 
-def part2() -> object:
-    paper, instructions = _read_paper_and_instructions()
+def solve2(paper_and_instructions: PaperAndInstructions) -> object:
+    paper, instructions = paper_and_instructions
 
     folded = paper
     for i in instructions:
@@ -137,3 +146,11 @@ def part2() -> object:
     logger.info("Output from folding:\n%s", folded.to_string())
 
     return "HZLEHJRK"
+
+
+def part1() -> object:
+    return solve1(load_input(13, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(13, parse))
@@ -1,9 +1,10 @@
 from collections import Counter
-from importlib.resources import open_text
-from typing import Dict, Iterable, NamedTuple, Tuple
+from typing import Dict, Iterable, NamedTuple, TextIO, Tuple
 
 from more_itertools import windowed
 
+from aoc21.inputs import load_input
+
 
 class Pair(NamedTuple):
     left: str
@@ -78,31 +79,41 @@ class RuleSet:
         return new
 
 
-def _read_template_and_rules() -> Tuple[str, RuleSet]:
-    with open_text("aoc21.days", "day14.txt") as f:
-        lines = iter(f)
+TemplateAndRules = Tuple[str, RuleSet]
 
-        # Expect template on first line.
-        template = next(lines).strip()
 
-        # Expect an empty line after template.
-        next(lines)
+def parse(f: TextIO) -> TemplateAndRules:
+    lines = iter(f)
 
-        # Rest of lines are the insertion rules.
-        rules = RuleSet(map(Rule.parse, lines))
+    # Expect template on first line.
+    template = next(lines).strip()
 
-        return template, rules
+    # Expect an empty line after template.
+    next(lines)
 
+    # Rest of lines are the insertion rules.
+    rules = RuleSet(map(Rule.parse, lines))
 
-def part1() -> object:
-    template, rules = _read_template_and_rules()
+    return template, rules
+
+
+def solve1(template_and_rules: TemplateAndRules) -> object:
+    template, rules = template_and_rules
     counted = rules.apply_with_count(template, 10)
 
     return max(counted.values()) - min(counted.values())
 
 
-def part2() -> object:
-    template, rules = _read_template_and_rules()
+def solve2(template_and_rules: TemplateAndRules) -> object:
+    template, rules = template_and_rules
     counted = rules.apply_with_count(template, 40)
 
     return max(counted.values()) - min(counted.values())
+
+
+def part1() -> object:
+    return solve1(load_input(14, parse))
+
+
+def part2() -> object:
+    return solve2(load_input(14, parse))
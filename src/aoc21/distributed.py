@@ -0,0 +1,257 @@
+from logging import getLogger
+from queue import Empty, Queue
+from socket import create_connection
+from socketserver import StreamRequestHandler, TCPServer
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+from aoc21.worker import encode_frame, read_frame
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Address = Tuple[str, int]
+
+DEFAULT_HEARTBEAT = 1.0
+DEFAULT_RETRIES = 2
+# Workers are considered lost after missing this many heartbeats in a row.
+MISSED_HEARTBEATS = 3
+
+_HEARTBEAT = "heartbeat"
+_RESULT = "result"
+_ERROR = "error"
+
+logger = getLogger("aoc21")
+
+
+class WorkerLost(Exception):
+    """
+    Raised when a remote worker disconnects or stops sending heartbeats.
+    """
+
+
+class RemoteError(Exception):
+    """
+    Raised when a function called by a remote worker raises an exception.
+    """
+
+
+def parse_address(value: str) -> Address:
+    """
+    Parse an address given as HOST:PORT.
+    """
+
+    host, sep, port = value.rpartition(":")
+    if not sep or not host:
+        raise ValueError(f"Expected HOST:PORT, got {value!r}.")
+
+    try:
+        return host.strip("[]"), int(port)
+    except ValueError:
+        raise ValueError(f"Invalid port {port!r}.") from None
+
+
+def create_server(address: Address) -> TCPServer:
+    """
+    Create a server for remote workers, which calls functions sent by coordinators.
+
+    Each connection is handled by its own forked process where possible, so a
+    coordinator can use more than one CPU on a host by connecting more than once.
+    Functions and results are pickled, so the server must only be reachable from
+    trusted hosts.
+
+    :param address: The host and port to listen on.
+    :return: The server, which handles connections once it serves forever.
+    """
+
+    try:
+        from socketserver import ForkingMixIn as ConcurrencyMixIn
+    except ImportError:
+        from socketserver import ThreadingMixIn as ConcurrencyMixIn
+
+    class WorkerServer(ConcurrencyMixIn, TCPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    return WorkerServer(address, _WorkerHandler)
+
+
+def distribute(
+    func: Callable[[Any], R],
+    items: Sequence[T],
+    addresses: Sequence[Address],
+    failed: Callable[[T, Exception], R],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence[Any] = (),
+    prepare: Optional[Callable[[T], Any]] = None,
+    retries: int = DEFAULT_RETRIES,
+    heartbeat_s: float = DEFAULT_HEARTBEAT,
+) -> Iterator[Tuple[int, R]]:
+    """
+    Call a function for each item with remote workers, yielding results as soon as
+    they are available.
+
+    Each address gets one connection, which takes the next item once it has finished
+    the last one. Items being handled by a worker which disconnects or misses
+    heartbeats are retried with the other workers.
+
+    :param func: The function to call, which must be importable by the workers.
+    :param items: The items to call the function with.
+    :param addresses: The host and port of each worker. Addresses can be repeated to
+    open more than one connection to a worker.
+    :param failed: Gets the result for an item which could not be handled, either
+    because the function raised an exception or because the retries ran out.
+    :param initializer: Called by the worker for each connection before any items.
+    :param initargs: Arguments for the initializer.
+    :param prepare: Converts an item to the argument sent to the worker, or None to
+    send the item itself.
+    :param retries: The number of times an item is retried after losing a worker.
+    :param heartbeat_s: The time in seconds between heartbeats sent by workers.
+    :return: The index of each item and its result, in the order they finish.
+    """
+
+    pending: "Queue[Tuple[int, int]]" = Queue()
+    for index in range(len(items)):
+        pending.put((index, 0))
+    results: "Queue[Tuple[int, R]]" = Queue()
+    done = Event()
+
+    def work(address: Address):
+        try:
+            connection = _Connection(address, heartbeat_s)
+        except OSError as e:
+            logger.warning("Cannot connect to worker %s:%d: %s", *address, e)
+            return
+
+        with connection:
+            try:
+                connection.send((initializer, tuple(initargs), heartbeat_s))
+            except OSError as e:
+                logger.warning("Lost worker %s:%d: %s", *address, e)
+                return
+
+            while not done.is_set():
+                try:
+                    index, attempts = pending.get(timeout=0.1)
+                except Empty:
+                    continue
+
+                item = items[index]
+                try:
+                    result = connection.call(func, prepare(item) if prepare else item)
+                except RemoteError as e:
+                    results.put((index, failed(item, e)))
+                except (OSError, EOFError, WorkerLost) as e:
+                    logger.warning("Lost worker %s:%d: %s", *address, e)
+                    if attempts < retries:
+                        pending.put((index, attempts + 1))
+                    else:
+                        error = WorkerLost(f"Gave up after {attempts + 1} attempts.")
+                        results.put((index, failed(item, error)))
+                    return
+                else:
+                    results.put((index, result))
+
+    threads = [Thread(target=work, args=(a,), daemon=True) for a in addresses]
+    for thread in threads:
+        thread.start()
+
+    received = 0
+    try:
+        while received < len(items):
+            try:
+                yield results.get(timeout=0.1)
+                received += 1
+            except Empty:
+                if not any(t.is_alive() for t in threads):
+                    break
+
+        # Every worker has been lost, so fail anything not already finished.
+        while not results.empty():
+            yield results.get()
+        while not pending.empty():
+            index, _ = pending.get()
+            yield index, failed(items[index], WorkerLost("No workers are left."))
+
+        done.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        # Workers still handling an item when stopped early disconnect once it is done.
+        done.set()
+
+
+class _Connection:
+    def __init__(self, address: Address, heartbeat_s: float):
+        timeout = heartbeat_s * MISSED_HEARTBEATS
+        self._socket = create_connection(address, timeout=timeout)
+        self._reader = self._socket.makefile("rb")
+
+    def __enter__(self) -> "_Connection":
+        return self
+
+    def __exit__(self, *exc_info):
+        self._reader.close()
+        self._socket.close()
+
+    def send(self, value: Any):
+        self._socket.sendall(encode_frame(value))
+
+    def call(self, func: Callable[[Any], Any], arg: Any) -> Any:
+        self.send((func, arg))
+        while True:
+            # Reads time out if the worker misses too many heartbeats.
+            kind, value = read_frame(self._reader)
+            if kind == _RESULT:
+                return value
+            elif kind == _ERROR:
+                raise RemoteError(value)
+
+
+class _WorkerHandler(StreamRequestHandler):
+    def handle(self):
+        logger.info("Connected to %s:%d.", *self.client_address[:2])
+        lock = Lock()
+        stopped = Event()
+
+        def send(value: Any):
+            with lock:
+                self.wfile.write(encode_frame(value))
+                self.wfile.flush()
+
+        def beat(interval: float):
+            while not stopped.wait(interval):
+                try:
+                    send((_HEARTBEAT, None))
+                except OSError:
+                    return
+
+        try:
+            initializer, initargs, heartbeat_s = read_frame(self.rfile)
+        except EOFError:
+            return
+
+        Thread(target=beat, args=(heartbeat_s,), daemon=True).start()
+        try:
+            if initializer is not None:
+                initializer(*initargs)
+
+            while True:
+                try:
+                    func, arg = read_frame(self.rfile)
+                except EOFError:
+                    break
+
+                try:
+                    reply = _RESULT, func(arg)
+                except Exception as e:
+                    logger.error("Failed to call %r.", func, exc_info=e)
+                    reply = _ERROR, f"{type(e).__name__}: {e}"
+                send(reply)
+        except OSError as e:
+            logger.warning("Lost connection to %s:%d: %s", *self.client_address[:2], e)
+        finally:
+            stopped.set()
+
+        logger.info("Disconnected from %s:%d.", *self.client_address[:2])
@@ -0,0 +1,75 @@
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Sequence
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+EXECUTORS = ("process", "thread", "inline")
+START_METHODS = ("fork", "forkserver", "spawn")
+
+logger = getLogger("aoc21")
+
+
+class ExecutorSettings(NamedTuple):
+    """
+    Controls how problems are solved in parallel.
+
+    Processes avoid contention for the GIL, threads avoid the cost of starting
+    processes and sending problems and solutions between them, and inline solves
+    everything in this process in sequence.
+    """
+
+    kind: str = "process"
+    start_method: Optional[str] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.kind != "inline"
+
+
+def create_executor(
+    settings: ExecutorSettings,
+    workers: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence[Any] = (),
+    preload: Sequence[str] = (),
+) -> "Executor":
+    """
+    Create a pool to solve problems in parallel.
+
+    :param settings: The kind of pool and how to start processes.
+    :param workers: The number of processes or threads.
+    :param initializer: Called in each new process. Threads share the state of this
+    process so do not need it.
+    :param initargs: Arguments for the initializer.
+    :param preload: Modules for the fork server to import before starting processes,
+    so each process does not import them again.
+    :return: The pool.
+    """
+
+    if settings.kind == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(workers, thread_name_prefix="aoc21")
+    elif settings.kind != "process":
+        raise ValueError(f"Unexpected executor: {settings.kind!r}.")
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    context = get_context(settings.start_method)
+    if context.get_start_method() == "forkserver" and preload:
+        context.set_forkserver_preload(list(preload))
+
+    logger.info(
+        "Starting %d processes with the %s start method.",
+        workers,
+        context.get_start_method(),
+    )
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=tuple(initargs),
+    )
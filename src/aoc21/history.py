@@ -0,0 +1,178 @@
+from datetime import datetime, timezone
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from aoc21.solution import Solution
+
+
+DEFAULT_THRESHOLD = 0.1
+
+logger = getLogger("aoc21")
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline_min_s: float
+    current_min_s: float
+    baseline_median_s: float
+    current_median_s: float
+    regressed: bool
+
+
+def problem_name(solution: Solution) -> str:
+    return f"{solution.problem.day}.{solution.problem.part}"
+
+
+def git_revision() -> Optional[str]:
+    """
+    Get the current git revision of the source tree, if it is in a repository.
+    """
+
+    from subprocess import DEVNULL, CalledProcessError, check_output
+
+    try:
+        output = check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=DEVNULL,
+            text=True,
+        )
+    except (OSError, CalledProcessError):
+        return None
+
+    return output.strip() or None
+
+
+def create_record(solutions: Iterable[Solution]) -> Dict[str, Any]:
+    """
+    Create a record of a benchmark run.
+
+    :param solutions: The benchmarked solutions. Any which failed are left out.
+    :return: A record which can be serialised as JSON.
+    """
+
+    from platform import python_implementation, python_version
+
+    problems = {}
+    for s in solutions:
+        if s.exception is not None or s.cached:
+            continue
+        problems[problem_name(s)] = {
+            "min_s": s.elapsed_s,
+            "median_s": s.median_s,
+            "mean_s": s.mean_s,
+            "stddev_s": s.stddev_s,
+            "p95_s": s.p95_s,
+            "parse_s": s.parse_s,
+            "solve_s": s.solve_s,
+            "runs": s.runs,
+            "samples_s": list(s.samples_s),
+            "with_gc_s": s.with_gc_s,
+            "overhead_s": s.overhead_s,
+            "cpu_user_s": s.cpu_user_s,
+            "cpu_sys_s": s.cpu_sys_s,
+            "gc_collections": list(s.gc_collections),
+            "gc_s": s.gc_s,
+            "peak_bytes": s.peak_bytes,
+            "rss_bytes": s.rss_bytes,
+        }
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": f"{python_implementation()} {python_version()}",
+        "problems": problems,
+    }
+
+
+def append_record(path: Path, record: Dict[str, Any]):
+    """
+    Append a benchmark record to a history file with one JSON record on each line.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(dumps(record, sort_keys=True))
+        f.write("\n")
+
+
+def read_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read all benchmark records from a history file, oldest first.
+    """
+
+    try:
+        f = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+
+    with f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except ValueError:
+                logger.warning("Skipping invalid record %s:%d.", path, number)
+
+
+def find_baseline(path: Path, revision: Optional[str] = None) -> Optional[Dict]:
+    """
+    Find the benchmark record to compare against.
+
+    :param path: The history file.
+    :param revision: Use the latest record with a git revision starting with this, or
+    None to use the latest record.
+    :return: The record, or None if there is no matching record.
+    """
+
+    baseline = None
+    for record in read_records(path):
+        found = record.get("revision") or ""
+        if revision is None or (revision and found.startswith(revision)):
+            baseline = record
+
+    return baseline
+
+
+def compare(
+    baseline: Dict[str, Any],
+    solutions: Iterable[Solution],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Compare benchmarked solutions against a baseline record.
+
+    :param baseline: The benchmark record to compare against.
+    :param solutions: The benchmarked solutions.
+    :param threshold: The fraction the minimum or median time can increase by before
+    a solution is considered to have regressed.
+    :return: Comparisons for each problem found in both the baseline and solutions.
+    """
+
+    problems = baseline.get("problems", {})
+    comparisons = []
+
+    for s in solutions:
+        name = problem_name(s)
+        previous = problems.get(name)
+        if previous is None or s.exception is not None or s.cached:
+            continue
+
+        regressed = s.elapsed_s > previous["min_s"] * (1 + threshold) or (
+            s.median_s > previous["median_s"] * (1 + threshold)
+        )
+        comparisons.append(
+            Comparison(
+                name,
+                previous["min_s"],
+                s.elapsed_s,
+                previous["median_s"],
+                s.median_s,
+                regressed,
+            )
+        )
+
+    return comparisons
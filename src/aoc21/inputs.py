@@ -0,0 +1,310 @@
+from collections import OrderedDict
+from importlib.resources import files, open_text, read_binary
+from io import BytesIO, TextIOWrapper
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+
+from aoc21.cache import DiskCache, combine_digests, digest, source_digest
+
+
+T = TypeVar("T")
+
+logger = getLogger("aoc21")
+
+
+class InputCache:
+    """
+    Least recently used cache of parsed inputs, keyed by day and input source.
+
+    Parsed values are shared by every caller, so parsers are expected to return
+    immutable structures (tuples, frozen sets or objects that are never modified) and
+    solvers must copy anything they intend to change.
+    """
+
+    def __init__(self, max_size: int = 32):
+        if max_size < 1:
+            raise ValueError("The cache must be able to hold at least one input.")
+
+        self._max_size: int = max_size
+        self._entries: "OrderedDict[Tuple[int, Hashable], Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, day: int, source: Hashable, load: Callable[[], T]) -> T:
+        """
+        Get the parsed input for a day and source, loading it if required.
+
+        :param day: The day the input belongs to.
+        :param source: Identifies where the input was read from.
+        :param load: Called to read and parse the input if it is not cached.
+        :return: The parsed input.
+        """
+
+        key = (day, source)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = load()
+        self.put(day, source, value)
+        return value
+
+    def put(self, day: int, source: Hashable, value: Any):
+        """
+        Add a parsed input for a day and source, replacing any already cached.
+        """
+
+        key = (day, source)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            # Evict the least recently used inputs once the cache is full.
+            while len(self._entries) > self._max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Evicted input for day %d (%s).", *evicted)
+
+    def invalidate(self, day: Optional[int] = None, source: Hashable = None):
+        """
+        Remove parsed inputs from the cache.
+
+        :param day: The day to remove inputs for, or None to clear every day.
+        :param source: The source to remove, or None to remove all sources for the day.
+        """
+
+        with self._lock:
+            if day is None:
+                self._entries.clear()
+                return
+
+            for key in list(self._entries):
+                if key[0] == day and (source is None or key[1] == source):
+                    del self._entries[key]
+
+
+INPUT_CACHE = InputCache()
+
+_disk_cache: Optional[DiskCache] = None
+_input_paths: Dict[int, Path] = {}
+# Contents of inputs sent from other machines, and digests identifying them.
+_input_data: Dict[int, Tuple[bytes, str]] = {}
+
+
+def input_resource(day: int) -> str:
+    """
+    Get the name of the resource holding the puzzle input for a day.
+    """
+
+    return f"day{day:02d}.txt"
+
+
+def input_digest(day: int) -> str:
+    """
+    Get the digest of the puzzle input for a day.
+    """
+
+    return digest(_read_bytes(day))
+
+
+def input_file(day: int) -> Optional[Path]:
+    """
+    Get the file the puzzle input for a day is read from, or None if the packaged
+    input is not a file on disk.
+    """
+
+    if day in _input_data:
+        return None
+
+    path = _input_paths.get(day)
+    if path is not None:
+        return path
+
+    resource = files("aoc21.days") / input_resource(day)
+    return resource if isinstance(resource, Path) else None
+
+
+def read_input(day: int, parse: Callable[[TextIO], T]) -> T:
+    """
+    Read and parse the puzzle input for a day without using the cache.
+
+    :param day: The day to read input for.
+    :param parse: Parses the opened input file.
+    :return: The parsed input.
+    """
+
+    if day in _input_data:
+        data, _ = _input_data[day]
+        with TextIOWrapper(BytesIO(data), encoding="utf-8") as f:
+            return parse(f)
+
+    path = _input_paths.get(day)
+    if path is not None:
+        return read_input_file(path, parse)
+
+    with open_text("aoc21.days", input_resource(day)) as f:
+        return parse(f)
+
+
+def read_input_file(path: Path, parse: Callable[[TextIO], T]) -> T:
+    """
+    Read and parse an input from a file without using the cache.
+
+    :param path: The file to read.
+    :param parse: Parses the opened input file.
+    :return: The parsed input.
+    """
+
+    with path.open(encoding="utf-8") as f:
+        return parse(f)
+
+
+def load_input(day: int, parse: Callable[[TextIO], T]) -> T:
+    """
+    Get the parsed puzzle input for a day, only reading and parsing it once for each
+    process.
+
+    :param day: The day to read input for.
+    :param parse: Parses the opened input file.
+    :return: The parsed input, which must not be modified.
+    """
+
+    return INPUT_CACHE.get(day, _input_source(day), lambda: _load(day, parse))
+
+
+def input_loaded(day: int) -> bool:
+    """
+    Check whether the parsed puzzle input for a day is already cached in this process.
+    """
+
+    return (day, _input_source(day)) in INPUT_CACHE
+
+
+def set_input(day: int, value: Any):
+    """
+    Use an input parsed elsewhere for a day instead of reading and parsing it again.
+
+    :param day: The day the input belongs to.
+    :param value: The parsed input, which must not be modified.
+    """
+
+    INPUT_CACHE.put(day, _input_source(day), value)
+
+
+def get_input_paths() -> Dict[int, Path]:
+    """
+    Get the files used instead of the packaged puzzle inputs, keyed by day.
+    """
+
+    return dict(_input_paths)
+
+
+def set_input_paths(paths: Mapping[int, Path]):
+    """
+    Set files to read instead of the packaged puzzle inputs for some days. Days not
+    included use the packaged inputs again.
+    """
+
+    _input_paths.clear()
+    _input_paths.update(paths)
+
+
+def set_input_data(data: Mapping[int, bytes]):
+    """
+    Set the contents of inputs to use instead of input files or the packaged puzzle
+    inputs for some days, such as input files read on another machine. Days not
+    included use input files or the packaged inputs again.
+    """
+
+    _input_data.clear()
+    _input_data.update((day, (d, digest(d))) for day, d in data.items())
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Get the on-disk cache used for parsed inputs, if enabled.
+    """
+
+    return _disk_cache
+
+
+def set_disk_cache(cache: Optional[DiskCache]):
+    """
+    Set the on-disk cache used for parsed inputs so they can be reused by other
+    processes, or None to always parse inputs.
+    """
+
+    global _disk_cache
+    _disk_cache = cache
+
+
+def _load(day: int, parse: Callable[[TextIO], T]) -> T:
+    cache = _disk_cache
+    if cache is None:
+        return read_input(day, parse)
+
+    data = _read_bytes(day)
+    # Parsed inputs are only valid for the same input and the same parser.
+    key = combine_digests(
+        digest(data),
+        source_digest(parse.__module__),
+        parse.__qualname__,
+    )
+
+    found, value = cache.get(key)
+    if found:
+        logger.debug("Loaded parsed input for day %d from cache.", day)
+        return value
+
+    with TextIOWrapper(BytesIO(data), encoding="utf-8") as f:
+        value = parse(f)
+
+    cache.put(key, value)
+    return value
+
+
+def invalidate_input(day: Optional[int] = None):
+    """
+    Discard cached inputs so they will be read and parsed again.
+
+    :param day: The day to discard the input for, or None to discard all inputs.
+    """
+
+    INPUT_CACHE.invalidate(day)
+
+
+def _input_source(day: int) -> str:
+    if day in _input_data:
+        _, data_digest = _input_data[day]
+        return f"data:{data_digest}"
+
+    path = _input_paths.get(day)
+    return str(path) if path is not None else input_resource(day)
+
+
+def _read_bytes(day: int) -> bytes:
+    if day in _input_data:
+        data, _ = _input_data[day]
+        return data
+
+    path = _input_paths.get(day)
+    if path is not None:
+        return path.read_bytes()
+
+    return read_binary("aoc21.days", input_resource(day))
@@ -0,0 +1,111 @@
+from contextlib import ExitStack, contextmanager
+from logging import getLogger
+from threading import current_thread, main_thread
+from typing import Iterator, NamedTuple, Optional
+
+from aoc21.memory import virtual_size
+
+
+logger = getLogger("aoc21")
+
+
+class Timeout(TimeoutError):
+    """
+    Raised when a solver takes longer than allowed.
+    """
+
+
+class Limits(NamedTuple):
+    """
+    Resources each problem is allowed to use.
+    """
+
+    timeout_s: Optional[float] = None
+    max_bytes: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout_s is not None or self.max_bytes is not None
+
+
+def can_limit_time() -> bool:
+    """
+    Check whether timeouts can be enforced on this platform.
+    """
+
+    import signal
+
+    return hasattr(signal, "setitimer")
+
+
+def can_limit_memory() -> bool:
+    """
+    Check whether memory limits can be enforced on this platform.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return False
+
+    return hasattr(resource, "RLIMIT_AS")
+
+
+@contextmanager
+def limited(limits: Limits) -> Iterator[None]:
+    """
+    Enforce limits on the code run in the context.
+
+    A timeout raises Timeout from the code running when it expires, and exceeding the
+    memory limit raises MemoryError from the allocation which failed. Timeouts can only
+    be enforced in the main thread, and memory is limited for the whole process.
+
+    :param limits: The limits to enforce.
+    """
+
+    with ExitStack() as stack:
+        if limits.timeout_s is not None:
+            stack.enter_context(_time_limit(limits.timeout_s))
+        if limits.max_bytes is not None:
+            stack.enter_context(_memory_limit(limits.max_bytes))
+        yield
+
+
+@contextmanager
+def _time_limit(timeout_s: float) -> Iterator[None]:
+    if current_thread() is not main_thread():
+        logger.warning("Timeouts can only be enforced in the main thread.")
+        yield
+        return
+
+    from signal import ITIMER_REAL, SIGALRM, setitimer, signal
+
+    def expire(signum, frame):
+        raise Timeout(f"Took longer than {timeout_s} s.")
+
+    previous = signal(SIGALRM, expire)
+    setitimer(ITIMER_REAL, timeout_s)
+    try:
+        yield
+    finally:
+        setitimer(ITIMER_REAL, 0)
+        signal(SIGALRM, previous)
+
+
+@contextmanager
+def _memory_limit(max_bytes: int) -> Iterator[None]:
+    from resource import RLIM_INFINITY, RLIMIT_AS, getrlimit, setrlimit
+
+    soft, hard = getrlimit(RLIMIT_AS)
+    # Allow for the memory already used by this process.
+    limit = (virtual_size() or 0) + max_bytes
+    if hard != RLIM_INFINITY:
+        limit = min(limit, hard)
+    if soft != RLIM_INFINITY:
+        limit = min(limit, soft)
+
+    setrlimit(RLIMIT_AS, (limit, hard))
+    try:
+        yield
+    finally:
+        setrlimit(RLIMIT_AS, (soft, hard))
@@ -1,8 +1,26 @@
-from argparse import ArgumentParser
-from typing import Optional, Sequence
+from argparse import ArgumentParser, ArgumentTypeError
+from json import dumps
+from pathlib import Path
+from sys import argv, stderr
+from typing import TYPE_CHECKING, Any, Collection, Dict, Optional, Sequence, Tuple
 
+from aoc21.affinity import available_cpus, can_pin
+from aoc21.bench import DEFAULT_FACTOR, DEFAULT_STEPS, DEFAULT_TIMEOUT
+from aoc21.benchmark import GC_MODES, STABLE_WARMUP, BenchmarkSettings
+from aoc21.cache import DiskCache, default_cache_directory
+from aoc21.executor import EXECUTORS, START_METHODS, ExecutorSettings
+from aoc21.history import DEFAULT_THRESHOLD
+from aoc21.inputs import set_disk_cache, set_input_paths
+from aoc21.limits import Limits, can_limit_memory, can_limit_time
 from aoc21.log import setup_logging
-from aoc21.runner import run
+from aoc21.output import FORMATS
+from aoc21.runner import run, run_batch, run_scaling
+from aoc21.sampling import DEFAULT_INTERVAL
+from aoc21.solution import format_elapsed
+from aoc21.watch import DEFAULT_POLL_INTERVAL, watch
+
+if TYPE_CHECKING:
+    from aoc21.distributed import Address
 
 
 def main_fn(args: Optional[Sequence[str]] = None) -> int:
@@ -12,7 +30,25 @@ def main_fn(args: Optional[Sequence[str]] = None) -> int:
     :return: The exit code.
     """
 
-    parser = ArgumentParser(description="Run solvers for Advent of Code 2021 problems.")
+    args = argv[1:] if args is None else args
+    if args and args[0] == "serve":
+        return serve_fn(args[1:])
+    if args and args[0] == "query":
+        return query_fn(args[1:])
+    if args and args[0] == "worker":
+        return worker_fn(args[1:])
+    if args and args[0] == "scale":
+        return scale_fn(args[1:])
+
+    parser = ArgumentParser(
+        description="Run solvers for Advent of Code 2021 problems.",
+        epilog=(
+            "Run 'aoc21 serve' to start a server which keeps inputs parsed between "
+            "runs, and 'aoc21 query' to solve problems with it. Run 'aoc21 worker' to "
+            "start a remote worker for --remote, and 'aoc21 scale' to measure how "
+            "solvers scale with generated inputs."
+        ),
+    )
     parser.add_argument("days", nargs="*", type=int, help="Filter problems by days.")
     parser.add_argument(
         "-s",
@@ -21,6 +57,86 @@ def main_fn(args: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Run solvers in sequence without using multiple processes.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Number of processes or threads to use (default: one for each CPU).",
+    )
+    parser.add_argument(
+        "--executor",
+        dest="executor",
+        choices=EXECUTORS,
+        default="process",
+        help=(
+            "Run solvers in a pool of processes or threads, or inline in sequence "
+            "(default: %(default)s)."
+        ),
+    )
+    parser.add_argument(
+        "--start-method",
+        dest="start_method",
+        choices=START_METHODS,
+        default=None,
+        help="How to start worker processes (default: the platform default).",
+    )
+    parser.add_argument(
+        "--remote",
+        dest="remote",
+        type=_address,
+        action="append",
+        default=[],
+        metavar="HOST:PORT",
+        help=(
+            "Solve problems with a worker started by 'aoc21 worker' instead of local "
+            "processes. Can be given more than once, including for the same worker "
+            "to solve more than one problem at a time with it."
+        ),
+    )
+    parser.add_argument(
+        "--share-inputs",
+        dest="share_inputs",
+        action="store_true",
+        help=(
+            "Parse array-like inputs once and share them with worker processes "
+            "through shared memory."
+        ),
+    )
+    parser.add_argument(
+        "--timeout",
+        dest="timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Fail any problem which takes longer than this, including benchmarking.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        dest="max_memory",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Fail any problem which needs more memory than this.",
+    )
+    parser.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        help="Print each solution as soon as it is found, before the full table.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="output_format",
+        choices=FORMATS,
+        default="table",
+        help=(
+            "Print solutions as a table, or as JSON, CSV or NDJSON with raw values "
+            "(default: %(default)s)."
+        ),
+    )
     parser.add_argument(
         "-b",
         "--benchmark",
@@ -28,29 +144,740 @@ def main_fn(args: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Benchmark solvers in addition to running them.",
     )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=BenchmarkSettings().repeat,
+        help=(
+            "Number of times to repeat each benchmark, or the minimum number if "
+            "adaptive (default: %(default)s)."
+        ),
+    )
+    parser.add_argument(
+        "--adaptive",
+        dest="adaptive",
+        action="store_true",
+        help=(
+            "Repeat benchmarks until the confidence interval of the median is narrow "
+            "enough or the time budget runs out."
+        ),
+    )
+    parser.add_argument(
+        "--target",
+        dest="target",
+        type=float,
+        default=BenchmarkSettings().target * 100,
+        metavar="PERCENT",
+        help=(
+            "Width of the 95%% confidence interval of the median relative to the "
+            "median for adaptive benchmarks (default: %(default)s%%)."
+        ),
+    )
+    parser.add_argument(
+        "--budget",
+        dest="budget",
+        type=float,
+        default=BenchmarkSettings().budget_s,
+        metavar="SECONDS",
+        help="Time budget for each adaptive benchmark (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--stable",
+        dest="stable",
+        action="store_true",
+        help=(
+            "Benchmark one problem at a time pinned to a single CPU, warming up first "
+            "and subtracting the timer overhead, and show the run-to-run variation."
+        ),
+    )
+    parser.add_argument(
+        "--cpu",
+        dest="cpu",
+        type=int,
+        default=None,
+        help="CPU to pin stable benchmarks to (default: the last available CPU).",
+    )
+    parser.add_argument(
+        "--warmup",
+        dest="warmup",
+        type=int,
+        default=None,
+        metavar="REPEATS",
+        help=(
+            "Repeats to run before benchmarking without recording them (default: "
+            f"{STABLE_WARMUP} for stable benchmarks, otherwise 0)."
+        ),
+    )
+    parser.add_argument(
+        "--gc",
+        dest="gc",
+        choices=GC_MODES,
+        default=BenchmarkSettings().gc,
+        help=(
+            "Whether the garbage collector runs while benchmarking, or benchmark both "
+            "ways to show its cost (default: %(default)s, like timeit)."
+        ),
+    )
+    parser.add_argument(
+        "--compare",
+        dest="baseline",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REVISION",
+        help=(
+            "Compare benchmarks with the latest saved run, or the latest run for a "
+            "git revision, and fail if any solution regressed."
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD * 100,
+        metavar="PERCENT",
+        help="Increase in time considered a regression (default: %(default)s%%).",
+    )
+    parser.add_argument(
+        "--history",
+        dest="history",
+        type=Path,
+        default=None,
+        help="File to save benchmark runs to (default: benchmarks.jsonl in cache dir).",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        dest="memory",
+        action="store_true",
+        help="Measure peak memory allocated and resident set size change per solver.",
+    )
+    parser.add_argument(
+        "-u",
+        "--usage",
+        dest="usage",
+        action="store_true",
+        help="Show user and system CPU time, GC collections and GC time per solver.",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        dest="profile",
+        nargs="?",
+        type=Path,
+        const=Path("profiles"),
+        default=None,
+        metavar="DIR",
+        help=(
+            "Profile each solver with cProfile, saving statistics in a directory "
+            "(default: profiles) and printing the functions taking the most time."
+        ),
+    )
+    parser.add_argument(
+        "--top",
+        dest="top",
+        type=int,
+        default=10,
+        help="Number of functions to print for each profile (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--flamegraph",
+        dest="flamegraphs",
+        nargs="?",
+        type=Path,
+        const=Path("flamegraphs"),
+        default=None,
+        metavar="DIR",
+        help=(
+            "Sample the call stack of each solver, saving collapsed stacks for flame "
+            "graph tools in a directory (default: flamegraphs)."
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        dest="interval",
+        type=float,
+        default=DEFAULT_INTERVAL * 1e3,
+        metavar="MS",
+        help="Time between samples of the call stack (default: %(default)s ms).",
+    )
+    parser.add_argument(
+        "--input",
+        dest="inputs",
+        type=_input_path,
+        action="append",
+        default=[],
+        metavar="DAY=PATH",
+        help="Read the input for a day from a file. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--watch",
+        dest="watch",
+        type=float,
+        nargs="?",
+        const=DEFAULT_POLL_INTERVAL,
+        default=None,
+        metavar="SECONDS",
+        help=(
+            "Keep running and solve days again when their modules or inputs change, "
+            f"polling every few seconds (default: {DEFAULT_POLL_INTERVAL})."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        dest="batch",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Run the solvers for a single day over every file in a directory and "
+            "report the throughput."
+        ),
+    )
+    parser.add_argument(
+        "--cache-inputs",
+        dest="cache_inputs",
+        action="store_true",
+        help="Store parsed inputs on disk so later runs can skip parsing.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Run all solvers instead of reusing solutions from previous runs.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        type=Path,
+        default=None,
+        help="Directory for cached data (default: ~/.cache/aoc21).",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        dest="startup_profile",
+        action="store_true",
+        help="Run again with import times enabled and print the slowest imports.",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         dest="verbosity",
         action="count",
         default=0,
-        help="Set verbosity level."
+        help="Set verbosity level.",
     )
 
     namespace = parser.parse_args(args)
 
+    if namespace.startup_profile:
+        from aoc21.startup import profile_startup
+
+        return profile_startup([a for a in args if a != "--startup-profile"])
+
     days = namespace.days or None
     parallel = not namespace.sequential
     benchmark = namespace.benchmark
     verbosity = namespace.verbosity
+    cache_dir = namespace.cache_dir or default_cache_directory()
 
     if verbosity >= 2 and benchmark:
         parser.error("verbosity (-v) >= 2 is not compatible with benchmarking (-b).")
+    if namespace.baseline is not None and not benchmark:
+        parser.error("comparing (--compare) requires benchmarking (-b).")
+    if namespace.repeat < 1:
+        parser.error("repeat (-r) must be at least 1.")
+    if namespace.share_inputs and benchmark:
+        # Solvers would be timed with shared views rather than their usual inputs.
+        parser.error("sharing inputs (--share-inputs) is not compatible with -b.")
+    if namespace.timeout is not None:
+        if namespace.timeout <= 0:
+            parser.error("timeout (--timeout) must be positive.")
+        if not can_limit_time():
+            parser.error("timeouts (--timeout) are not supported on this platform.")
+    if namespace.max_memory is not None:
+        if namespace.max_memory <= 0:
+            parser.error("memory limit (--max-memory) must be positive.")
+        if not can_limit_memory():
+            parser.error("memory limits (--max-memory) are not supported here.")
+    limits = Limits(
+        namespace.timeout,
+        int(namespace.max_memory * 1e6) if namespace.max_memory is not None else None,
+    )
+    if limits.enabled and namespace.executor == "thread":
+        # Only the main thread can be interrupted and memory is shared by threads.
+        parser.error("limits are not compatible with the thread executor.")
+    if namespace.jobs is not None and namespace.jobs < 1:
+        parser.error("jobs (-j) must be at least 1.")
+    if namespace.start_method is not None and namespace.executor != "process":
+        parser.error("start method (--start-method) requires the process executor.")
+    if namespace.executor == "thread" and (namespace.memory or namespace.profile):
+        # Memory tracing and profiling can only measure one solver at a time.
+        parser.error(
+            "measuring memory (-m) and profiling (-p) are not compatible with the "
+            "thread executor."
+        )
+    if namespace.start_method is not None:
+        from multiprocessing import get_all_start_methods
+
+        if namespace.start_method not in get_all_start_methods():
+            parser.error(
+                f"start method {namespace.start_method!r} is not available on this "
+                "platform."
+            )
+    if namespace.stable and not benchmark:
+        parser.error("stable benchmarks (--stable) require benchmarking (-b).")
+    if namespace.cpu is not None:
+        if not namespace.stable:
+            parser.error("pinning to a CPU (--cpu) requires --stable.")
+        if not can_pin():
+            parser.error("pinning to a CPU (--cpu) is not supported on this platform.")
+        if namespace.cpu not in available_cpus():
+            parser.error(f"CPU {namespace.cpu} is not available.")
+    if namespace.warmup is not None and namespace.warmup < 0:
+        parser.error("warm-up repeats (--warmup) must not be negative.")
+    if namespace.remote:
+        if not parallel or namespace.executor == "inline":
+            parser.error("remote workers (--remote) require solving in parallel.")
+        if namespace.share_inputs or namespace.stable:
+            parser.error(
+                "remote workers (--remote) are not compatible with --share-inputs or "
+                "--stable."
+            )
+        if namespace.profile or namespace.flamegraphs:
+            # Workers would write profiles and stacks to their own file systems.
+            parser.error(
+                "remote workers (--remote) are not compatible with profiling (-p) or "
+                "--flamegraph."
+            )
+        if namespace.watch is not None:
+            parser.error("remote workers (--remote) are not compatible with --watch.")
+    if namespace.interval <= 0:
+        parser.error("interval (--interval) must be positive.")
+    if namespace.watch is not None:
+        if namespace.watch <= 0:
+            parser.error("poll interval (--watch) must be positive.")
+        if namespace.batch is not None:
+            parser.error("watching (--watch) is not compatible with --batch.")
+    if namespace.batch is not None:
+        if days is None or len(days) != 1:
+            parser.error("batch mode (--batch) requires exactly one day.")
+        if benchmark:
+            parser.error(
+                "batch mode (--batch) is not compatible with benchmarking (-b)."
+            )
+
+    for day, path in namespace.inputs:
+        if not path.is_file():
+            parser.error(f"input file {path} for day {day} does not exist.")
 
     setup_logging(verbosity)
-    result = run(days, parallel, benchmark)
+    set_input_paths(dict(namespace.inputs))
+    executor = ExecutorSettings(namespace.executor, namespace.start_method)
+
+    if namespace.batch is not None:
+        if not namespace.batch.is_dir():
+            parser.error(f"batch directory {namespace.batch} does not exist.")
+        result = run_batch(
+            days[0],
+            namespace.batch,
+            parallel,
+            namespace.jobs,
+            executor,
+            namespace.remote,
+        )
+        return 0 if result else 1
+
+    if namespace.cache_inputs:
+        set_disk_cache(DiskCache(cache_dir / "inputs"))
+    result_cache = DiskCache(cache_dir / "results") if namespace.use_cache else None
+
+    history = namespace.history or cache_dir / "benchmarks.jsonl"
+    warmup = namespace.warmup
+    if warmup is None:
+        warmup = STABLE_WARMUP if namespace.stable else 0
+    settings = BenchmarkSettings(
+        namespace.repeat,
+        namespace.adaptive,
+        namespace.target / 100,
+        namespace.budget,
+        gc=namespace.gc,
+        stable=namespace.stable,
+        cpu=namespace.cpu,
+        warmup=warmup,
+    )
+
+    if namespace.watch is not None:
+        # Reloaded modules and cached inputs are only used in this process.
+        parallel = False
+
+    def solve(selected: Optional[Collection[int]]) -> bool:
+        return run(
+            selected,
+            parallel,
+            benchmark,
+            result_cache,
+            history,
+            namespace.baseline,
+            namespace.threshold / 100,
+            settings,
+            cache_dir / "timings.json",
+            namespace.stream,
+            namespace.memory,
+            namespace.profile,
+            namespace.top,
+            namespace.flamegraphs,
+            namespace.interval / 1e3,
+            namespace.output_format,
+            namespace.jobs,
+            executor,
+            namespace.share_inputs,
+            limits,
+            namespace.usage,
+            namespace.remote,
+        )
+
+    if namespace.watch is None:
+        return 0 if solve(days) else 1
+
+    try:
+        watch(days, solve, namespace.watch)
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def serve_fn(args: Sequence[str]) -> int:
+    """
+    Parse arguments and run a server which solves problems on request.
+    :param args: The command line arguments after 'serve'.
+    :return: The exit code.
+    """
+
+    parser = ArgumentParser(
+        prog="aoc21 serve",
+        description=(
+            "Solve problems on request over a Unix socket, keeping inputs parsed "
+            "between requests. Connections are handled one at a time, so clients "
+            "wait while another is connected."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket",
+        type=Path,
+        default=None,
+        help="Socket to listen on (default: ~/.cache/aoc21/server.sock).",
+    )
+    parser.add_argument(
+        "--input",
+        dest="inputs",
+        type=_input_path,
+        action="append",
+        default=[],
+        metavar="DAY=PATH",
+        help="Read the input for a day from a file unless a request gives one.",
+    )
+    parser.add_argument(
+        "--no-preload",
+        dest="preload",
+        action="store_false",
+        help="Parse inputs on the first request for them instead of on startup.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="Set verbosity level.",
+    )
+
+    namespace = parser.parse_args(args)
+
+    if not _has_unix_sockets():
+        parser.error("the server requires Unix sockets, which are not supported here.")
+    for day, path in namespace.inputs:
+        if not path.is_file():
+            parser.error(f"input file {path} for day {day} does not exist.")
+
+    # Only import the server when needed as it imports the runner.
+    from aoc21.server import SolverServer, default_socket_path
+
+    setup_logging(namespace.verbosity)
+    try:
+        server = SolverServer(
+            namespace.socket or default_socket_path(), dict(namespace.inputs)
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if namespace.preload:
+        server.preload()
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def query_fn(args: Sequence[str]) -> int:
+    """
+    Parse arguments and solve problems with a running server.
+    :param args: The command line arguments after 'query'.
+    :return: The exit code.
+    """
+
+    parser = ArgumentParser(
+        prog="aoc21 query", description="Solve problems with a running server."
+    )
+    parser.add_argument("days", nargs="*", type=int, help="Days to solve.")
+    parser.add_argument(
+        "--part",
+        dest="part",
+        type=int,
+        default=None,
+        help="Only solve this part of each day.",
+    )
+    parser.add_argument(
+        "--input",
+        dest="inputs",
+        type=_input_path,
+        action="append",
+        default=[],
+        metavar="DAY=PATH",
+        help="Read the input for a day from a file. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket",
+        type=Path,
+        default=None,
+        help="Socket the server listens on (default: ~/.cache/aoc21/server.sock).",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="output_format",
+        choices=("text", "json"),
+        default="text",
+        help="Print a line for each solution, or the raw responses as JSON.",
+    )
+    parser.add_argument(
+        "--shutdown",
+        dest="shutdown",
+        action="store_true",
+        help="Stop the server after solving.",
+    )
+
+    namespace = parser.parse_args(args)
+
+    if not namespace.days and not namespace.shutdown:
+        parser.error("expected at least one day.")
+    if not _has_unix_sockets():
+        parser.error("the server requires Unix sockets, which are not supported here.")
+
+    # The server reads inputs itself, so relative paths must be made absolute.
+    inputs = {day: str(path.resolve()) for day, path in namespace.inputs}
+    requests = []
+    for day in namespace.days:
+        request = {"day": day, "part": namespace.part, "input": inputs.get(day)}
+        requests.append({k: v for k, v in request.items() if v is not None})
+    if namespace.shutdown:
+        requests.append({"command": "shutdown"})
+
+    from aoc21.server import default_socket_path, query
+
+    path = namespace.socket or default_socket_path()
+    try:
+        responses = query(path, requests)
+    except OSError as e:
+        print(f"Cannot connect to the server on {path}: {e}", file=stderr)
+        return 1
+
+    if namespace.output_format == "json":
+        print(dumps(responses, indent=2))
+
+    success = True
+    for response in responses:
+        if not response["ok"]:
+            print(f"Error: {response['error']}", file=stderr)
+            success = False
+            continue
+
+        for solution in response.get("solutions", ()):
+            if solution["exception_type"] is not None:
+                success = False
+            if namespace.output_format == "text":
+                _print_solution_dict(solution)
+
+    return 0 if success else 1
+
+
+def worker_fn(args: Sequence[str]) -> int:
+    """
+    Parse arguments and run a worker which solves problems sent by other machines.
+    :param args: The command line arguments after 'worker'.
+    :return: The exit code.
+    """
+
+    parser = ArgumentParser(
+        prog="aoc21 worker",
+        description=(
+            "Solve problems sent by 'aoc21 --remote' over TCP. Problems are pickled, "
+            "so only listen on networks where every host is trusted."
+        ),
+    )
+    parser.add_argument(
+        "--listen",
+        dest="listen",
+        type=_address,
+        required=True,
+        metavar="HOST:PORT",
+        help="Host and port to listen on, such as localhost:4021.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="Set verbosity level.",
+    )
+
+    namespace = parser.parse_args(args)
+
+    from aoc21.distributed import create_server
+
+    setup_logging(namespace.verbosity)
+    try:
+        server = create_server(namespace.listen)
+    except OSError as e:
+        parser.error(
+            f"cannot listen on {namespace.listen[0]}:{namespace.listen[1]}: {e}"
+        )
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+def scale_fn(args: Sequence[str]) -> int:
+    """
+    Parse arguments and measure how solvers scale with the size of their inputs.
+    :param args: The command line arguments after 'scale'.
+    :return: The exit code.
+    """
+
+    parser = ArgumentParser(
+        prog="aoc21 scale",
+        description=(
+            "Time solvers with generated inputs of increasing sizes, starting from the "
+            "size of the puzzle input, and fit how the time grows with the size. An "
+            "exponent of 1 is linear and 2 is quadratic."
+        ),
+    )
+    parser.add_argument("days", nargs="*", type=int, help="Filter problems by days.")
+    parser.add_argument(
+        "--factor",
+        dest="factor",
+        type=float,
+        default=DEFAULT_FACTOR,
+        help=f"Ratio between consecutive sizes (default: {DEFAULT_FACTOR}).",
+    )
+    parser.add_argument(
+        "--steps",
+        dest="steps",
+        type=int,
+        default=DEFAULT_STEPS,
+        help=f"Number of sizes to measure (default: {DEFAULT_STEPS}).",
+    )
+    parser.add_argument(
+        "--seed",
+        dest="seed",
+        type=int,
+        default=0,
+        help="Select other generated inputs of the same sizes.",
+    )
+    parser.add_argument(
+        "--timeout",
+        dest="timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        metavar="SECONDS",
+        help=(
+            "Stop measuring larger sizes once solving one takes longer than this "
+            f"(default: {DEFAULT_TIMEOUT:g})."
+        ),
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="Set verbosity level.",
+    )
+
+    namespace = parser.parse_args(args)
+
+    if namespace.factor <= 1:
+        parser.error("factor (--factor) must be greater than 1.")
+    if namespace.steps < 2:
+        parser.error("steps (--steps) must be at least 2 to fit an exponent.")
+    if namespace.timeout <= 0:
+        parser.error("timeout (--timeout) must be positive.")
+
+    setup_logging(namespace.verbosity)
+    success = run_scaling(
+        namespace.days or None,
+        namespace.factor,
+        namespace.steps,
+        namespace.seed,
+        namespace.timeout,
+    )
+
+    return 0 if success else 1
+
+
+def _print_solution_dict(solution: Dict[str, Any]):
+    name = f"{solution['day']}.{solution['part']}"
+    value = solution["exception_type"] or solution["value"]
+    print(f"{name}: {value} ({format_elapsed(solution['elapsed_s'])})")
+
+
+def _has_unix_sockets() -> bool:
+    import socket
+
+    return hasattr(socket, "AF_UNIX")
+
+
+def _address(value: str) -> "Address":
+    from aoc21.distributed import parse_address
+
+    try:
+        return parse_address(value)
+    except ValueError as e:
+        raise ArgumentTypeError(str(e)) from None
+
+
+def _input_path(value: str) -> Tuple[int, Path]:
+    day, sep, path = value.partition("=")
+    if not sep or not path:
+        raise ArgumentTypeError(f"expected DAY=PATH, got {value!r}")
 
-    return 0 if result else 1
+    try:
+        return int(day), Path(path)
+    except ValueError:
+        raise ArgumentTypeError(f"invalid day {day!r}") from None
 
 
 def main():
@@ -0,0 +1,86 @@
+from pathlib import Path
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from typing import Callable, NamedTuple, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+_STATM = Path("/proc/self/statm")
+
+
+class MemoryUsage(NamedTuple):
+    peak_bytes: int
+    rss_bytes: Optional[int]
+
+
+def current_rss() -> Optional[int]:
+    """
+    Get the resident set size of this process in bytes, if it can be found.
+    """
+
+    # The second field is the number of resident pages.
+    rss = _read_statm(1)
+    if rss is not None:
+        return rss
+
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return None
+
+    # Only the maximum resident set size is available, in kilobytes on Linux and
+    # bytes on macOS; the difference is only an approximation.
+    return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+
+def virtual_size() -> Optional[int]:
+    """
+    Get the size of the virtual address space of this process in bytes, if it can be
+    found.
+    """
+
+    # The first field is the total number of pages.
+    return _read_statm(0)
+
+
+def _read_statm(field: int) -> Optional[int]:
+    try:
+        from os import sysconf
+
+        pages = int(_STATM.read_text().split()[field])
+        return pages * sysconf("SC_PAGE_SIZE")
+    except (ImportError, OSError, ValueError, IndexError):
+        return None
+
+
+def measure_memory(func: Callable[[], T]) -> Tuple[T, MemoryUsage]:
+    """
+    Call a function while tracing memory allocations.
+
+    :param func: The function to call.
+    :return: The result of the function and its memory usage, with the peak size of
+    memory allocated by Python while it ran and the change in resident set size.
+    """
+
+    tracing = is_tracing()
+    if not tracing:
+        start()
+
+    reset_peak()
+    before_traced, _ = get_traced_memory()
+    before_rss = current_rss()
+
+    try:
+        result = func()
+        after_rss = current_rss()
+        _, peak = get_traced_memory()
+    finally:
+        if not tracing:
+            stop()
+
+    rss = (
+        after_rss - before_rss
+        if before_rss is not None and after_rss is not None
+        else None
+    )
+    return result, MemoryUsage(max(peak - before_traced, 0), rss)
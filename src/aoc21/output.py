@@ -0,0 +1,125 @@
+from csv import DictWriter
+from json import dumps
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+from aoc21.solution import Solution
+
+
+FORMATS = ("table", "json", "csv", "ndjson")
+
+# Columns written for CSV, which leaves out the individual samples.
+FIELDS = (
+    "day",
+    "part",
+    "value",
+    "exception_type",
+    "exception_message",
+    "cached",
+    "elapsed_s",
+    "parse_s",
+    "parse_cached",
+    "solve_s",
+    "runs",
+    "repeats",
+    "median_s",
+    "mean_s",
+    "stddev_s",
+    "p95_s",
+    "with_gc_s",
+    "variation",
+    "overhead_s",
+    "cpu_user_s",
+    "cpu_sys_s",
+    "gc_gen0",
+    "gc_gen1",
+    "gc_gen2",
+    "gc_s",
+    "peak_bytes",
+    "rss_bytes",
+    "profile_path",
+    "stacks_path",
+    "stack_samples",
+)
+
+
+def solution_as_dict(solution: Solution) -> Dict[str, Any]:
+    """
+    Get the fields of a solution with raw values that can be serialised as JSON.
+    """
+
+    value = solution.value
+    if value is not None and not isinstance(value, (bool, int, float, str)):
+        value = str(value)
+
+    exception = solution.exception
+    benchmarked = bool(solution.samples_s)
+    collections = solution.gc_collections or (None, None, None)
+
+    return {
+        "day": solution.problem.day,
+        "part": solution.problem.part,
+        "value": value,
+        "exception_type": type(exception).__name__ if exception else None,
+        "exception_message": str(exception) if exception else None,
+        "cached": solution.cached,
+        "elapsed_s": solution.elapsed_s,
+        "parse_s": solution.parse_s,
+        "parse_cached": solution.parse_cached,
+        "solve_s": solution.solve_s,
+        "runs": solution.runs,
+        "repeats": len(solution.samples_s),
+        "median_s": solution.median_s if benchmarked else None,
+        "mean_s": solution.mean_s if benchmarked else None,
+        "stddev_s": solution.stddev_s if benchmarked else None,
+        "p95_s": solution.p95_s if benchmarked else None,
+        "samples_s": list(solution.samples_s),
+        "with_gc_s": solution.with_gc_s,
+        "variation": solution.variation if benchmarked else None,
+        "overhead_s": solution.overhead_s,
+        "cpu_user_s": solution.cpu_user_s,
+        "cpu_sys_s": solution.cpu_sys_s,
+        "gc_gen0": collections[0],
+        "gc_gen1": collections[1],
+        "gc_gen2": collections[2],
+        "gc_s": solution.gc_s,
+        "peak_bytes": solution.peak_bytes,
+        "rss_bytes": solution.rss_bytes,
+        "profile_path": _optional_str(solution.profile_path),
+        "stacks_path": _optional_str(solution.stacks_path),
+        "stack_samples": solution.stack_samples,
+    }
+
+
+def write_json(solutions: Iterable[Solution], wall_s: float, f: TextIO):
+    """
+    Write solutions as a single JSON object along with the total time taken.
+    """
+
+    record = {"wall_s": wall_s, "solutions": list(map(solution_as_dict, solutions))}
+    f.write(dumps(record, indent=2))
+    f.write("\n")
+
+
+def write_ndjson(solution: Solution, f: TextIO):
+    """
+    Write a solution as a single line of JSON, flushing so it can be read straight
+    away.
+    """
+
+    f.write(dumps(solution_as_dict(solution)))
+    f.write("\n")
+    f.flush()
+
+
+def write_csv(solutions: Iterable[Solution], f: TextIO):
+    """
+    Write solutions as comma separated values with a header row.
+    """
+
+    writer = DictWriter(f, FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(map(solution_as_dict, solutions))
+
+
+def _optional_str(value: object) -> Optional[str]:
+    return str(value) if value is not None else None
@@ -1,13 +1,23 @@
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, TextIO
 
 
 @dataclass
 class Problem:
     """
     Represents a problem to be solved.
+
+    The solver reads, parses and solves the problem in one call. If the problem also
+    has separate parse and solve phases, these are used instead so they can be timed
+    individually.
     """
 
     day: int
     part: int
     solver: Callable[[], object]
+    parse: Optional[Callable[[TextIO], Any]] = None
+    solve: Optional[Callable[[Any], object]] = None
+
+    @property
+    def has_phases(self) -> bool:
+        return self.parse is not None and self.solve is not None
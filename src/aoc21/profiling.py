@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import Callable, List, NamedTuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Hotspot(NamedTuple):
+    function: str
+    calls: int
+    total_s: float
+    cumulative_s: float
+
+
+def profile_path(directory: Path, day: int, part: int, suffix: str) -> Path:
+    """
+    Get the path of a profile for a problem.
+    """
+
+    return directory / f"day{day:02d}-part{part}{suffix}"
+
+
+def profile_call(func: Callable[[], T], path: Path) -> T:
+    """
+    Call a function with cProfile enabled and save the statistics.
+
+    :param func: The function to profile.
+    :param path: The file to write statistics to, which can be read with pstats.
+    :return: The result of the function.
+    """
+
+    from cProfile import Profile
+
+    profile = Profile()
+    try:
+        return profile.runcall(func)
+    finally:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(path)
+
+
+def find_hotspots(path: Path, top: int = 10) -> List[Hotspot]:
+    """
+    Find the functions with the highest cumulative time in saved statistics.
+
+    :param path: The file with statistics written by cProfile.
+    :param top: The number of functions to return.
+    :return: The functions sorted by cumulative time.
+    """
+
+    from pstats import Stats
+
+    stats = Stats(str(path))
+    hotspots = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():
+        if name == "<method 'disable' of '_lsprof.Profiler' objects>":
+            continue
+        elif filename == "~":
+            # Built-in functions have no file.
+            function = name
+        else:
+            function = f"{Path(filename).name}:{line}({name})"
+        hotspots.append(Hotspot(function, calls, total, cumulative))
+
+    hotspots.sort(key=lambda h: h.cumulative_s, reverse=True)
+    return hotspots[:top]
@@ -1,18 +1,93 @@
-from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import replace
+from functools import partial
+from gc import enable
+from importlib import import_module
 from logging import getLogger
 from os import linesep
+from pathlib import Path
+from sys import stdout
 from time import perf_counter
 from timeit import Timer
-from typing import Any, Collection, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from tabulate import tabulate
-
-from aoc21.days import PROBLEMS
+from aoc21.affinity import pinned
+from aoc21.batch import FileResult, Throughput, find_inputs, solve_data, solve_file
+from aoc21.bench import DEFAULT_FACTOR, DEFAULT_STEPS, DEFAULT_TIMEOUT
+from aoc21.benchmark import BenchmarkSettings, sample, timer_overhead, warm_up
+from aoc21.cache import DiskCache, combine_digests, source_digest
+from aoc21.days import ARRAY_INPUTS, DAYS, get_problems
+from aoc21.executor import ExecutorSettings, create_executor
+from aoc21.history import (
+    DEFAULT_THRESHOLD,
+    Comparison,
+    append_record,
+    compare,
+    create_record,
+    find_baseline,
+)
+from aoc21.inputs import (
+    get_disk_cache,
+    get_input_paths,
+    input_digest,
+    input_loaded,
+    load_input,
+    read_input,
+    set_disk_cache,
+    set_input,
+    set_input_data,
+    set_input_paths,
+)
+from aoc21.limits import Limits, Timeout, limited
+from aoc21.memory import measure_memory
+from aoc21.output import write_csv, write_json, write_ndjson
 from aoc21.problem import Problem
-from aoc21.solution import Solution
+from aoc21.profiling import Hotspot, find_hotspots, profile_call, profile_path
+from aoc21.sampling import DEFAULT_INTERVAL, sample_call
+from aoc21.scheduler import (
+    default_workers,
+    group_problems,
+    ideal_makespan,
+    list_makespan,
+    load_timings,
+    problem_key,
+    save_timings,
+    schedule,
+)
+from aoc21.solution import Solution, format_bytes, format_elapsed
+from aoc21.usage import UsageMeter
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from aoc21.bench.scaling import Scaling
+    from aoc21.distributed import Address
+    from aoc21.shared import SharedInput
 
 
-HEADERS = ("Day", "Solution", "Elapsed", "Runs")
+HEADERS = ("Day", "Solution", "Parse", "Solve", "Elapsed", "Runs", "Cached")
+MEMORY_HEADERS = ("Peak memory", "RSS change")
+USAGE_HEADERS = ("User", "Sys", "GC runs", "GC time")
+STABLE_HEADERS = ("Variation", "Overhead")
+STATISTICS_HEADERS = ("Repeats", "Median", "Mean", "Std dev", "P95")
+HOTSPOT_HEADERS = ("Function", "Calls", "Total", "Cumulative")
+STACK_HEADERS = ("Day", "Samples", "File")
+SCALING_HEADERS = ("Day", "Sizes", "Unit", "First", "Last", "Exponent", "Stopped")
+COMPARISON_HEADERS = ("Day", "Min", "Baseline", "Median", "Baseline", "Change", "")
 
 logger = getLogger("aoc21")
 
@@ -21,6 +96,25 @@ def run(
     days: Optional[Collection[int]] = None,
     parallel: bool = True,
     benchmark: bool = False,
+    result_cache: Optional[DiskCache] = None,
+    history: Optional[Path] = None,
+    baseline: Optional[str] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    settings: BenchmarkSettings = BenchmarkSettings(),
+    timings: Optional[Path] = None,
+    stream: bool = False,
+    memory: bool = False,
+    profile: Optional[Path] = None,
+    top: int = 10,
+    flamegraphs: Optional[Path] = None,
+    interval: float = DEFAULT_INTERVAL,
+    output_format: str = "table",
+    workers: Optional[int] = None,
+    executor: ExecutorSettings = ExecutorSettings(),
+    share_inputs: bool = False,
+    limits: Limits = Limits(),
+    usage: bool = False,
+    remote: Sequence["Address"] = (),
 ) -> bool:
     """
     Run solves for all days after filtering and print solutions.
@@ -29,39 +123,205 @@ def run(
     :param parallel: Whether to run the solvers in parallel with multiple processes.
     :param benchmark: Whether to run the solvers repeatedly to obtain a more accurate
     execution time.
-    :return: True if no exceptions occurred during solving, False otherwise.
+    :param result_cache: Cache to reuse solutions from when neither the input nor the
+    solver has changed, or None to always run solvers.
+    :param history: File to append benchmark results to, or None to not keep them.
+    :param baseline: If benchmarking, compare results against the latest run in the
+    history with a git revision starting with this, or the latest run if empty. None
+    skips the comparison.
+    :param threshold: The fraction the minimum or median time of a solution can
+    increase by relative to the baseline before it is considered to have regressed.
+    :param settings: Controls how many times solvers are repeated when benchmarking.
+    Stable benchmarks are always solved in sequence pinned to a single CPU.
+    :param timings: File to record solver times in, used to start the most
+    expensive solvers first when running in parallel, or None to not record them.
+    :param stream: Whether to print each solution as soon as it is available, before
+    printing the table of all solutions.
+    :param memory: Whether to measure the memory used by each solver.
+    :param profile: Directory to save cProfile statistics for each solver in, or None
+    to not profile solvers.
+    :param top: The number of functions with the highest cumulative time to print
+    for each profiled solver.
+    :param flamegraphs: Directory to save collapsed stacks recorded by the sampling
+    profiler for each solver in, or None to not sample solvers.
+    :param interval: The time in seconds between samples of the call stack.
+    :param output_format: How to print the solutions, either 'table' for people to
+    read, or 'json', 'csv' or 'ndjson' with raw values for other programs. NDJSON
+    solutions are printed as soon as they are available, and only tables include
+    other information such as hotspots and comparisons.
+    :param workers: Number of processes or threads to use, or None to use one for
+    each CPU.
+    :param executor: Controls how solvers are run in parallel.
+    :param share_inputs: Whether to parse inputs which are arrays of integers once
+    and share them with worker processes, so the parts of those days can be solved
+    by different workers.
+    :param limits: Time and memory each problem is allowed to use. Problems exceeding
+    them fail without stopping the rest of the run.
+    :param usage: Whether to print the processor time and garbage collections for
+    each solver.
+    :param remote: Hosts and ports of remote workers to solve problems with instead of
+    workers in this machine, or empty to not use remote workers.
+    :return: True if no exceptions occurred during solving and no solutions regressed,
+    False otherwise.
     """
 
-    problems = []
-    for problem in PROBLEMS:
-        if days is None or problem.day in days:
-            problems.append(problem)
-        else:
-            logger.info("Skipping day %d, part %d.", problem.day, problem.part)
+    for day in DAYS:
+        if days is not None and day not in days:
+            logger.info("Skipping day %d.", day)
 
-    if not problems:
+    problems = get_problems(days)
+    table = output_format == "table"
+
+    if not problems and table:
         print("", "No matching problems found.", "", sep=linesep)
         return True
 
-    solutions = execute(problems, parallel, benchmark)
+    estimates = load_timings(timings) if timings is not None else None
+    workers = len(remote) if remote else workers or default_workers()
+    parallel = parallel and executor.parallel
+    stable = benchmark and settings.stable
+    if stable and parallel:
+        logger.info("Solving in sequence for stable benchmarks.")
+        parallel = False
+
+    if output_format == "ndjson":
+        on_solution = partial(write_ndjson, f=stdout)
+    elif stream and table:
+        print()
+        on_solution = _print_solution
+    else:
+        on_solution = None
+
+    with pinned(settings.cpu) if stable else nullcontext():
+        start = perf_counter()
+        solutions = execute(
+            problems,
+            parallel,
+            benchmark,
+            result_cache,
+            settings,
+            estimates,
+            workers,
+            on_solution,
+            memory,
+            profile,
+            flamegraphs,
+            interval,
+            executor,
+            share_inputs,
+            limits,
+            remote,
+            usage,
+        )
+        wall_s = perf_counter() - start
+
+    if timings is not None:
+        save_timings(timings, solutions)
     solutions.sort(key=lambda s: (s.problem.day, s.problem.part))
 
-    table = tabulate(
-        map(_solution_as_row, solutions),
-        HEADERS,
-        tablefmt="pipe",
-        numalign="right",
-        stralign="right",
-    )
-    print("", table, "", sep=linesep)
+    if output_format == "json":
+        write_json(solutions, wall_s, stdout)
+    elif output_format == "csv":
+        write_csv(solutions, stdout)
+    elif table:
+        _print_tables(
+            solutions, benchmark, settings, memory, usage, profile, flamegraphs, top
+        )
+        extra_runs = benchmark or memory or profile or flamegraphs
+        if parallel and not extra_runs:
+            # Solvers are run more than once when benchmarking, measuring memory or
+            # profiling, which is not reflected in the elapsed times.
+            _print_makespan(solutions, wall_s, workers)
+
+    success = all(s.exception is None for s in solutions)
+
+    if benchmark and history is not None:
+        # Find the baseline before adding this run to the history.
+        found = None
+        if baseline is not None:
+            found = find_baseline(history, baseline or None)
+        append_record(history, create_record(solutions))
+        logger.info("Saved benchmark results to %s.", history)
+
+        if baseline is not None and found is None and table:
+            print(f"No benchmark run matching {baseline!r} found.", "", sep=linesep)
+        elif baseline is not None and found is None:
+            logger.warning("No benchmark run matching %r found.", baseline)
+        elif found is not None:
+            comparisons = compare(found, solutions, threshold)
+            regressed = sum(1 for c in comparisons if c.regressed)
+            if table:
+                _print_comparison(found, comparisons, threshold)
+            elif regressed:
+                logger.warning(
+                    "%d solution(s) regressed by more than %.0f%%.",
+                    regressed,
+                    threshold * 100,
+                )
+            success = regressed == 0 and success
 
-    return all(s.exception is None for s in solutions)
+    return success
+
+
+def _print_tables(
+    solutions: List[Solution],
+    benchmark: bool,
+    settings: BenchmarkSettings,
+    memory: bool,
+    usage: bool,
+    profile: Optional[Path],
+    flamegraphs: Optional[Path],
+    top: int,
+):
+    headers = HEADERS
+    rows = [_solution_as_row(s) for s in solutions]
+    if benchmark:
+        headers += STATISTICS_HEADERS
+        for row, solution in zip(rows, solutions):
+            row.extend(_statistics_as_row(solution))
+    if benchmark and settings.gc == "both":
+        headers += ("With GC",)
+        for row, solution in zip(rows, solutions):
+            row.append(_with_gc_as_cell(solution))
+    if benchmark and settings.stable:
+        headers += STABLE_HEADERS
+        for row, solution in zip(rows, solutions):
+            row.extend(_stable_as_row(solution))
+    if usage:
+        headers += USAGE_HEADERS
+        for row, solution in zip(rows, solutions):
+            row.extend(_usage_as_row(solution))
+    if memory:
+        headers += MEMORY_HEADERS
+        for row, solution in zip(rows, solutions):
+            row.extend(_memory_as_row(solution))
+
+    print("", _tabulate(rows, headers), "", sep=linesep)
+
+    if profile is not None:
+        _print_hotspots(solutions, top)
+    if flamegraphs is not None:
+        _print_stacks(solutions)
 
 
 def execute(
     problems: Iterable[Problem],
     parallel: bool = True,
     benchmark: bool = False,
+    result_cache: Optional[DiskCache] = None,
+    settings: BenchmarkSettings = BenchmarkSettings(),
+    estimates: Optional[Mapping[str, float]] = None,
+    workers: Optional[int] = None,
+    on_solution: Optional[Callable[[Solution], None]] = None,
+    memory: bool = False,
+    profile: Optional[Path] = None,
+    flamegraphs: Optional[Path] = None,
+    interval: float = DEFAULT_INTERVAL,
+    executor: ExecutorSettings = ExecutorSettings(),
+    share_inputs: bool = False,
+    limits: Limits = Limits(),
+    remote: Sequence["Address"] = (),
+    usage: bool = False,
 ) -> List[Solution]:
     """
     Run solvers for problems and print the solutions.
@@ -70,15 +330,601 @@ def execute(
     :param parallel: Whether to run the solvers in parallel with multiple processes.
     :param benchmark: Whether to run the solvers repeatedly to obtain a more accurate
     execution time.
+    :param result_cache: Cache to reuse solutions from when neither the input nor the
+    solver has changed, or None to always run solvers. Cached solutions are not used
+    when benchmarking, measuring, profiling or enforcing limits, as they only have
+    values, but new solutions are still added.
+    :param settings: Controls how many times solvers are repeated when benchmarking.
+    :param estimates: Estimated times for problems keyed by day and part, such as
+    '1.2', used to start the most expensive problems first.
+    :param workers: Number of processes to use, or None to use one for each CPU.
+    :param on_solution: Called with each solution as soon as it is available, which
+    may be in a different order to the problems.
+    :param memory: Whether to measure the memory used by each solver. This is done
+    with an extra run so the memory tracing does not affect the elapsed time.
+    :param profile: Directory to save cProfile statistics for each solver in, or None
+    to not profile solvers. Solvers are profiled with an extra run.
+    :param flamegraphs: Directory to save collapsed stacks recorded by the sampling
+    profiler for each solver in, or None to not sample solvers. Solvers are sampled
+    with extra runs.
+    :param interval: The time in seconds between samples of the call stack.
+    :param executor: Controls how solvers are run in parallel.
+    :param share_inputs: Whether to parse inputs which are arrays of integers in this
+    process and share them with worker processes through shared memory, so the parts
+    of those days can be solved by different workers. Shared inputs are read-only
+    views rather than tuples, and their parse time is not included in solutions.
+    :param limits: Time and memory each problem is allowed to use, enforced by the
+    process solving it. Problems exceeding them fail with Timeout or MemoryError.
+    :param remote: Hosts and ports of remote workers started with 'aoc21 worker' to
+    solve problems with instead of the executor, or empty to not use remote workers.
+    Problems are sent to each worker in jobs like for local workers, and jobs for a
+    worker which is lost are retried with the others. The contents of input files
+    are sent to the workers, which do not use the disk cache.
+    :param usage: Whether the solutions need the processor time and garbage
+    collections of each solver, which cached solutions do not have.
+    :return: The solutions, in the same order as the problems.
+    """
+
+    problems = list(problems)
+    solutions: List[Optional[Solution]] = [None] * len(problems)
+    keys: List[Optional[str]] = [None] * len(problems)
+    # Solvers have to run for anything other than their values to be available.
+    measured = (
+        benchmark
+        or memory
+        or usage
+        or profile is not None
+        or flamegraphs is not None
+        or limits.enabled
+    )
+
+    if result_cache is not None:
+        for i, problem in enumerate(problems):
+            keys[i] = _result_key(problem)
+            if not measured:
+                solutions[i] = _solve_cached(problem, result_cache, keys[i])
+            if solutions[i] is not None and on_solution is not None:
+                on_solution(solutions[i])
+
+    pending = [i for i, s in enumerate(solutions) if s is None]
+    solved = _execute(
+        (problems[i] for i in pending),
+        parallel and executor.parallel and len(pending) > 1,
+        benchmark,
+        settings,
+        estimates,
+        workers or default_workers(),
+        on_solution,
+        memory,
+        profile,
+        flamegraphs,
+        interval,
+        executor,
+        share_inputs,
+        limits,
+        remote,
+    )
+
+    for i, solution in zip(pending, solved):
+        solutions[i] = solution
+        if result_cache is not None and solution.exception is None:
+            result_cache.put(keys[i], solution.value)
+
+    return solutions
+
+
+def _execute(
+    problems: Iterable[Problem],
+    parallel: bool,
+    benchmark: bool,
+    settings: BenchmarkSettings,
+    estimates: Optional[Mapping[str, float]],
+    workers: int,
+    on_solution: Optional[Callable[[Solution], None]],
+    memory: bool,
+    profile: Optional[Path],
+    flamegraphs: Optional[Path],
+    interval: float,
+    executor: ExecutorSettings,
+    share_inputs: bool,
+    limits: Limits,
+    remote: Sequence["Address"],
+) -> List[Solution]:
+    problems = list(problems)
+    solve = partial(_solve_timed, settings=settings) if benchmark else _solve_once
+    if memory:
+        solve = partial(_solve_with_memory, solve=solve)
+    if profile is not None:
+        solve = partial(_solve_with_profile, solve=solve, directory=profile)
+    if flamegraphs is not None:
+        solve = partial(
+            _solve_with_sampling, solve=solve, directory=flamegraphs, interval=interval
+        )
+    if limits.enabled:
+        solve = partial(_solve_with_limits, solve=solve, limits=limits)
+    if remote and problems:
+        return _execute_remote(problems, solve, estimates, on_solution, remote)
+    if not parallel:
+        return _solve_job(problems, solve, on_solution)
+
+    shared, blocks = {}, []
+    if share_inputs and executor.kind == "process":
+        shared, blocks = _share_inputs(problems)
+
+    try:
+        # Problems sharing an input are solved by the same worker unless the input is
+        # shared, and the most expensive jobs are submitted first so they are not left
+        # running on their own at the end.
+        jobs = schedule(problems, estimates, shared.keys())
+        # Starting more workers than there are jobs only adds overhead.
+        workers = min(workers, len(jobs))
+        logger.info(
+            "Scheduled %d jobs, expecting %.1f ms with %d workers.",
+            len(jobs),
+            list_makespan([j.cost_s for j in jobs], workers) * 1e3,
+            workers,
+        )
+
+        from concurrent.futures import as_completed
+
+        modules = sorted({p.solver.__module__ for p in problems})
+        initargs = _worker_args(modules, shared)
+        with create_executor(
+            executor, workers, _init_worker, initargs, modules
+        ) as pool:
+            # Jobs are queued in the order they are submitted.
+            futures = [pool.submit(_solve_job, j.problems, solve) for j in jobs]
+            solved = {}
+            for future in as_completed(futures):
+                for solution in future.result():
+                    solved[problem_key(solution.problem)] = solution
+                    if on_solution is not None:
+                        on_solution(solution)
+    finally:
+        # Workers have exited by now, so nothing is still attached.
+        if blocks:
+            from aoc21.shared import release
+
+            for block in blocks:
+                release(block)
+
+    return [solved[problem_key(p)] for p in problems]
+
+
+def _execute_remote(
+    problems: List[Problem],
+    solve: Callable[[Problem], Solution],
+    estimates: Optional[Mapping[str, float]],
+    on_solution: Optional[Callable[[Solution], None]],
+    remote: Sequence["Address"],
+) -> List[Solution]:
+    from aoc21.distributed import distribute
+
+    jobs = schedule(problems, estimates)
+    logger.info("Sending %d jobs to %d remote workers.", len(jobs), len(remote))
+
+    modules = sorted({p.solver.__module__ for p in problems})
+    # Input files only exist on this machine, so their contents are sent instead.
+    days = {p.day for p in problems}
+    inputs = {d: p.read_bytes() for d, p in get_input_paths().items() if d in days}
+    results = distribute(
+        partial(_solve_job, solve=solve),
+        [j.problems for j in jobs],
+        remote,
+        _failed_job,
+        _init_remote_worker,
+        (inputs, tuple(modules)),
+    )
+
+    solved = {}
+    for _, solutions in results:
+        for solution in solutions:
+            solved[problem_key(solution.problem)] = solution
+            if on_solution is not None:
+                on_solution(solution)
+
+    return [solved[problem_key(p)] for p in problems]
+
+
+def _failed_job(problems: Sequence[Problem], error: Exception) -> List[Solution]:
+    for problem in problems:
+        logger.error(
+            "Day %d, part %d failed.", problem.day, problem.part, exc_info=error
+        )
+
+    return [Solution(p, None, error, 0.0, 0) for p in problems]
+
+
+def _share_inputs(
+    problems: Sequence[Problem],
+) -> Tuple[Dict[int, "SharedInput"], List["SharedMemory"]]:
+    # Only share inputs for days with more than one problem, as those are the ones
+    # which would otherwise be parsed by each worker solving them.
+    counts = Counter(p.day for p in problems if p.has_phases and p.day in ARRAY_INPUTS)
+    days = [d for d, c in counts.items() if c > 1]
+    if not days:
+        return {}, []
+
+    from aoc21.shared import is_shareable, publish
+
+    shared, blocks = {}, []
+    for day in days:
+        parse = next(p.parse for p in problems if p.day == day)
+        try:
+            data = load_input(day, parse)
+        except Exception:
+            # Leave the workers to report the error.
+            continue
+
+        if not is_shareable(data):
+            logger.info("Not sharing the input for day %d.", day)
+            continue
+
+        block, shared[day] = publish(data)
+        blocks.append(block)
+        logger.info("Shared the input for day %d (%d bytes).", day, block.size)
+
+    return shared, blocks
+
+
+def run_batch(
+    day: int,
+    directory: Path,
+    parallel: bool = True,
+    workers: Optional[int] = None,
+    executor: ExecutorSettings = ExecutorSettings(),
+    remote: Sequence["Address"] = (),
+) -> bool:
+    """
+    Run solvers for a day over every input file in a directory, and print the
+    solutions for each file and the overall throughput.
+
+    :param day: The day to solve problems for.
+    :param directory: The directory with input files.
+    :param parallel: Whether to solve files in parallel with multiple processes.
+    :param workers: Number of processes or threads to use, or None to use one for
+    each CPU.
+    :param executor: Controls how files are solved in parallel.
+    :param remote: Hosts and ports of remote workers to solve files with instead of
+    workers in this machine, or empty to not use remote workers.
     :return: True if no exceptions occurred during solving, False otherwise.
     """
 
-    solve = _solve_timed if benchmark else _solve_once
-    if parallel:
-        with ProcessPoolExecutor() as pool:
-            return list(pool.map(solve, problems))
-    else:
-        return list(map(solve, problems))
+    problems = get_problems([day])
+    paths = find_inputs(directory)
+
+    if not problems or not paths:
+        print("", "No matching problems or input files found.", "", sep=linesep)
+        return True
+
+    start = perf_counter()
+    results = execute_batch(problems, paths, parallel, workers, executor, remote)
+    wall_s = perf_counter() - start
+
+    headers = ("File", "Size", "Parse", *(f"Part {p.part}" for p in problems))
+    headers += ("Elapsed",)
+    print("", _tabulate(map(_file_result_as_row, results), headers), "", sep=linesep)
+
+    throughput = Throughput(len(results), sum(r.size_bytes for r in results), wall_s)
+    print(
+        f"Solved {throughput.files} files ({format_bytes(throughput.size_bytes)}) in "
+        f"{format_elapsed(wall_s)}: {throughput.files_per_s:.1f} files/s, "
+        f"{throughput.bytes_per_s / 2 ** 20:.2f} MiB/s.",
+        "",
+        sep=linesep,
+    )
+
+    return all(s.exception is None for r in results for s in r.solutions)
+
+
+def run_scaling(
+    days: Optional[Collection[int]] = None,
+    factor: float = DEFAULT_FACTOR,
+    steps: int = DEFAULT_STEPS,
+    seed: int = 0,
+    timeout_s: Optional[float] = DEFAULT_TIMEOUT,
+) -> bool:
+    """
+    Time solvers with generated inputs of increasing sizes, and print how the time
+    taken grows with the size of the input.
+
+    :param days: Days to measure, or None to measure all of them.
+    :param factor: The ratio between consecutive sizes, starting from the size of the
+    puzzle input.
+    :param steps: The number of sizes to measure.
+    :param seed: Selects the generated inputs.
+    :param timeout_s: The longest time to spend solving one input, or None to wait
+    for every size.
+    :return: True if no exceptions occurred during solving, False otherwise.
+    """
+
+    from aoc21.bench.generators import GENERATORS
+    from aoc21.bench.scaling import measure_scaling, scaled_sizes
+
+    problems = [p for p in get_problems(days) if p.day in GENERATORS]
+    if not problems:
+        print("", "No matching problems found.", "", sep=linesep)
+        return True
+
+    from tempfile import TemporaryDirectory
+
+    results = []
+    with TemporaryDirectory() as directory:
+        for problem in problems:
+            sizes = scaled_sizes(GENERATORS[problem.day].size, factor, steps)
+            results.append(
+                measure_scaling(problem, sizes, Path(directory), seed, timeout_s)
+            )
+
+    print(
+        "", _tabulate(map(_scaling_as_row, results), SCALING_HEADERS), "", sep=linesep
+    )
+
+    return not any(s.failed for s in results)
+
+
+def execute_batch(
+    problems: Sequence[Problem],
+    paths: Sequence[Path],
+    parallel: bool = True,
+    workers: Optional[int] = None,
+    executor: ExecutorSettings = ExecutorSettings(),
+    remote: Sequence["Address"] = (),
+) -> List[FileResult]:
+    """
+    Solve problems for one day using each input file.
+
+    :param problems: The problems for each part of a day.
+    :param paths: The input files.
+    :param parallel: Whether to solve files in parallel with multiple processes.
+    :param workers: Number of processes or threads to use, or None to use one for
+    each CPU.
+    :param executor: Controls how files are solved in parallel.
+    :param remote: Hosts and ports of remote workers to solve files with instead of
+    the executor, or empty to not use remote workers. Files are read by this process
+    and sent to the workers in chunks.
+    :return: The results, in the same order as the files.
+    """
+
+    if remote and paths:
+        return _execute_batch_remote(problems, paths, remote)
+
+    solve = partial(solve_file, problems)
+    if not parallel or not executor.parallel or len(paths) < 2:
+        return [solve(p) for p in paths]
+
+    workers = min(workers or default_workers(), len(paths))
+    # Send files to workers in chunks to reduce the overhead of many small inputs,
+    # while leaving enough chunks to balance the load.
+    chunksize = max(1, len(paths) // (workers * 4))
+    logger.info("Solving %d files in chunks of %d...", len(paths), chunksize)
+
+    modules = [DAYS[problems[0].day]]
+    with create_executor(
+        executor, workers, _init_worker, _worker_args(modules, {}), modules
+    ) as pool:
+        return list(pool.map(solve, paths, chunksize=chunksize))
+
+
+def _execute_batch_remote(
+    problems: Sequence[Problem], paths: Sequence[Path], remote: Sequence["Address"]
+) -> List[FileResult]:
+    from aoc21.distributed import distribute
+
+    chunksize = max(1, len(paths) // (len(remote) * 4))
+    chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    logger.info(
+        "Sending %d files to remote workers in chunks of %d...", len(paths), chunksize
+    )
+
+    modules = (DAYS[problems[0].day],)
+    results = distribute(
+        partial(_solve_file_data, problems),
+        chunks,
+        remote,
+        partial(_failed_files, problems),
+        _init_worker,
+        (None, {}, modules),
+        prepare=_read_files,
+    )
+
+    solved: List[List[FileResult]] = [[] for _ in chunks]
+    for index, chunk in results:
+        solved[index] = chunk
+
+    return [r for chunk in solved for r in chunk]
+
+
+def _read_files(paths: Sequence[Path]) -> List[Tuple[Path, bytes]]:
+    return [(p, p.read_bytes()) for p in paths]
+
+
+def _solve_file_data(
+    problems: Sequence[Problem], files: Sequence[Tuple[Path, bytes]]
+) -> List[FileResult]:
+    return [solve_data(problems, path, data) for path, data in files]
+
+
+def _failed_files(
+    problems: Sequence[Problem], paths: Sequence[Path], error: Exception
+) -> List[FileResult]:
+    logger.error("Failed to solve %d files.", len(paths), exc_info=error)
+    return [
+        FileResult(
+            p,
+            p.stat().st_size,
+            0.0,
+            [Solution(q, None, error, 0.0, 0) for q in problems],
+        )
+        for p in paths
+    ]
+
+
+async def run_async(
+    problems: Iterable[Problem],
+    workers: Optional[int] = None,
+    benchmark: bool = False,
+    settings: BenchmarkSettings = BenchmarkSettings(),
+    timeout_s: Optional[float] = None,
+    max_pending: Optional[int] = None,
+) -> AsyncIterator[Solution]:
+    """
+    Solve problems in worker processes without blocking the event loop, yielding each
+    solution as soon as it is available.
+
+    Each worker is a separate Python process which solves one problem at a time, so a
+    solver which crashes or hangs only affects its own problem. Problems taking longer
+    than the deadline fail with Timeout, and workers which are stuck or exit are
+    replaced. Workers stop solving problems while too many solutions are waiting to be
+    consumed. Cancelling the task consuming the solutions or closing the iterator
+    stops every worker, killing any still solving a problem.
+
+    :param problems: Sequence of problems to solve.
+    :param workers: Number of worker processes, or None to use one for each CPU.
+    :param benchmark: Whether to run the solvers repeatedly to obtain a more accurate
+    execution time.
+    :param settings: Controls how many times solvers are repeated when benchmarking.
+    :param timeout_s: The time in seconds each problem is allowed to take, including
+    benchmarking, or None to wait for every problem.
+    :param max_pending: The number of solutions which can be waiting to be consumed
+    before workers wait, or None to allow one for each worker.
+    :return: The solutions, in the order they are solved.
+    """
+
+    from asyncio import Queue, create_task, gather, wait_for
+    from asyncio import TimeoutError as AsyncTimeoutError
+
+    from aoc21.worker import WorkerProcess
+
+    problems = list(problems)
+    if not problems:
+        return
+
+    workers = min(workers or default_workers(), len(problems))
+    solve = partial(_solve_timed, settings=settings) if benchmark else _solve_once
+    modules = sorted({p.solver.__module__ for p in problems})
+    initargs = _worker_args(modules, {})
+
+    jobs: "Queue[Problem]" = Queue()
+    for problem in problems:
+        jobs.put_nowait(problem)
+    solutions: "Queue[Solution]" = Queue(max_pending or workers)
+
+    async def work():
+        worker = None
+        try:
+            while not jobs.empty():
+                problem = jobs.get_nowait()
+                start = perf_counter()
+                error: Optional[Exception] = None
+                try:
+                    if worker is None:
+                        worker = await WorkerProcess.start(_init_worker, initargs)
+                    solution = await wait_for(worker.call(solve, problem), timeout_s)
+                except AsyncTimeoutError:
+                    error = Timeout(f"Took longer than {timeout_s} s.")
+                except Exception as e:
+                    # Anything else, such as a problem which cannot be pickled, only
+                    # fails this problem so the consumer still gets a solution for it.
+                    error = e
+
+                if error is not None:
+                    logger.error(
+                        "Day %d, part %d failed.",
+                        problem.day,
+                        problem.part,
+                        exc_info=error,
+                    )
+                    # The worker may be stuck or have exited, so start a new one.
+                    if worker is not None:
+                        await worker.close()
+                        worker = None
+                    solution = Solution(problem, None, error, perf_counter() - start, 0)
+
+                await solutions.put(solution)
+        finally:
+            if worker is not None:
+                await worker.close()
+
+    tasks = [create_task(work()) for _ in range(workers)]
+    try:
+        for _ in problems:
+            yield await solutions.get()
+        # Let the workers exit by themselves once every problem is solved.
+        await gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+
+
+def _worker_args(modules: Sequence[str], shared: Mapping[int, "SharedInput"]) -> tuple:
+    # Workers need the same input settings as this process.
+    return get_disk_cache(), get_input_paths(), tuple(modules), dict(shared)
+
+
+def _init_worker(
+    disk_cache: Optional[DiskCache],
+    input_paths: Mapping[int, Path],
+    modules: Sequence[str] = (),
+    shared: Optional[Mapping[int, "SharedInput"]] = None,
+):
+    set_disk_cache(disk_cache)
+    set_input_paths(input_paths)
+
+    if shared:
+        from aoc21.shared import attach
+
+        for day, shared_input in shared.items():
+            set_input(day, attach(shared_input))
+
+    # Import day modules before any jobs arrive so the first job sent to each worker
+    # does not wait for them. They are already imported by forked workers.
+    for name in modules:
+        import_module(name)
+
+
+def _init_remote_worker(inputs: Mapping[int, bytes], modules: Sequence[str]):
+    # Remote workers have their own disk caches, which may not be at the same path.
+    _init_worker(None, {}, modules)
+    set_input_data(inputs)
+
+
+def _solve_job(
+    problems: Sequence[Problem],
+    solve: Callable[[Problem], Solution],
+    on_solution: Optional[Callable[[Solution], None]] = None,
+) -> List[Solution]:
+    solutions = []
+    for problem in problems:
+        solution = solve(problem)
+        solutions.append(solution)
+        if on_solution is not None:
+            on_solution(solution)
+
+    return solutions
+
+
+def _result_key(problem: Problem) -> str:
+    # Solutions are only valid for the same input and the same solver.
+    return combine_digests(
+        str(problem.day),
+        str(problem.part),
+        input_digest(problem.day),
+        source_digest(problem.solver.__module__),
+    )
+
+
+def _tabulate(rows: Iterable[Sequence[Any]], headers: Sequence[str]) -> str:
+    from tabulate import tabulate
+
+    return tabulate(
+        rows,
+        headers,
+        tablefmt="pipe",
+        numalign="right",
+        stralign="right",
+    )
 
 
 def _solution_as_row(solution: Solution) -> List[Any]:
@@ -88,16 +934,326 @@ def _solution_as_row(solution: Solution) -> List[Any]:
     else:
         value = solution.exception.__class__.__name__
 
-    return [name, value, solution.elapsed, solution.runs]
+    return [
+        name,
+        value,
+        solution.parse_elapsed,
+        solution.solve_elapsed,
+        solution.elapsed,
+        solution.runs,
+        "yes" if solution.cached else "",
+    ]
+
+
+def _file_result_as_row(result: FileResult) -> List[Any]:
+    values = [
+        s.value if s.exception is None else s.exception.__class__.__name__
+        for s in result.solutions
+    ]
+    return [
+        result.path.name,
+        format_bytes(result.size_bytes),
+        format_elapsed(result.parse_s),
+        *values,
+        format_elapsed(result.elapsed_s),
+    ]
+
+
+def _scaling_as_row(scaling: "Scaling") -> List[Any]:
+    measurements = scaling.measurements
+    exponent = scaling.exponent
+
+    return [
+        f"{scaling.problem.day}.{scaling.problem.part}",
+        f"{measurements[0].size}-{measurements[-1].size}" if measurements else "",
+        scaling.unit,
+        format_elapsed(measurements[0].elapsed_s) if measurements else "",
+        format_elapsed(measurements[-1].elapsed_s) if measurements else "",
+        "" if exponent is None else f"{exponent:.2f}",
+        scaling.stopped or "",
+    ]
+
+
+def _print_solution(solution: Solution):
+    name = f"{solution.problem.day}.{solution.problem.part}"
+    if solution.exception is None:
+        value = solution.value
+    else:
+        value = solution.exception.__class__.__name__
+
+    cached = ", cached" if solution.cached else ""
+    print(f"{name}: {value} ({solution.elapsed}{cached})", flush=True)
+
+
+def _statistics_as_row(solution: Solution) -> List[Any]:
+    if not solution.samples_s:
+        return [""] * len(STATISTICS_HEADERS)
+
+    return [
+        len(solution.samples_s),
+        format_elapsed(solution.median_s),
+        format_elapsed(solution.mean_s),
+        format_elapsed(solution.stddev_s),
+        format_elapsed(solution.p95_s),
+    ]
+
+
+def _with_gc_as_cell(solution: Solution) -> str:
+    if solution.with_gc_s is None:
+        return ""
+
+    if solution.elapsed_s <= 0:
+        # Subtracting the timer overhead can leave nothing to compare against.
+        return format_elapsed(solution.with_gc_s)
+
+    change = solution.with_gc_s / solution.elapsed_s - 1
+    return f"{format_elapsed(solution.with_gc_s)} ({change:+.0%})"
+
+
+def _stable_as_row(solution: Solution) -> List[Any]:
+    if solution.overhead_s is None:
+        return [""] * len(STABLE_HEADERS)
+
+    return [f"{solution.variation:.1%}", format_elapsed(solution.overhead_s)]
+
+
+def _usage_as_row(solution: Solution) -> List[Any]:
+    if solution.cpu_user_s is None:
+        return [""] * len(USAGE_HEADERS)
+
+    return [
+        format_elapsed(solution.cpu_user_s),
+        format_elapsed(solution.cpu_sys_s),
+        "/".join(map(str, solution.gc_collections)),
+        format_elapsed(solution.gc_s),
+    ]
+
+
+def _memory_as_row(solution: Solution) -> List[Any]:
+    return [format_bytes(solution.peak_bytes), format_bytes(solution.rss_bytes)]
+
+
+def _print_hotspots(solutions: List[Solution], top: int):
+    for solution in solutions:
+        if solution.profile_path is None:
+            continue
+
+        hotspots = find_hotspots(solution.profile_path, top)
+        table = _tabulate(map(_hotspot_as_row, hotspots), HOTSPOT_HEADERS)
+        title = (
+            f"Day {solution.problem.day}, part {solution.problem.part} "
+            f"({solution.profile_path}):"
+        )
+        print(title, "", table, "", sep=linesep)
+
+
+def _print_stacks(solutions: List[Solution]):
+    rows = [
+        [
+            f"{s.problem.day}.{s.problem.part}",
+            s.stack_samples,
+            s.stacks_path,
+        ]
+        for s in solutions
+        if s.stacks_path is not None
+    ]
+    table = _tabulate(rows, STACK_HEADERS)
+    print("Collapsed stacks for flame graphs:", "", table, "", sep=linesep)
+
+
+def _hotspot_as_row(hotspot: Hotspot) -> List[Any]:
+    return [
+        hotspot.function,
+        hotspot.calls,
+        format_elapsed(hotspot.total_s),
+        format_elapsed(hotspot.cumulative_s),
+    ]
+
+
+def _print_makespan(solutions: List[Solution], wall_s: float, workers: int):
+    # Compare the time taken with the best possible time given how long each group of
+    # problems took to solve.
+    elapsed = {problem_key(s.problem): s.elapsed_s for s in solutions if not s.cached}
+    costs = []
+    for group in group_problems(s.problem for s in solutions):
+        keys = [problem_key(p) for p in group if problem_key(p) in elapsed]
+        if keys:
+            costs.append(sum(elapsed[k] for k in keys))
+
+    if not costs:
+        return
+
+    # Workers without a job to solve did not contribute.
+    workers = min(workers, len(costs))
+    ideal_s = ideal_makespan(costs, workers)
+    print(
+        f"Finished in {format_elapsed(wall_s)} with {workers} workers "
+        f"(ideal {format_elapsed(ideal_s)}, {ideal_s / wall_s:.0%} efficient).",
+        "",
+        sep=linesep,
+    )
+
+
+def _print_comparison(baseline: dict, comparisons: List[Comparison], threshold: float):
+    table = _tabulate(map(_comparison_as_row, comparisons), COMPARISON_HEADERS)
+    revision = (baseline.get("revision") or "unknown revision")[:12]
+    title = f"Compared with {revision} at {baseline.get('timestamp')}:"
+    print(title, "", table, "", sep=linesep)
+
+    regressed = sum(1 for c in comparisons if c.regressed)
+    if regressed:
+        message = f"{regressed} solution(s) regressed by more than {threshold:.0%}."
+        print(message, "", sep=linesep)
+
+
+def _comparison_as_row(comparison: Comparison) -> List[Any]:
+    change = ""
+    if comparison.baseline_median_s > 0:
+        # Subtracting the timer overhead can leave a baseline with no time at all.
+        ratio = comparison.current_median_s / comparison.baseline_median_s
+        change = f"{ratio - 1:+.1%}"
+
+    return [
+        comparison.name,
+        format_elapsed(comparison.current_min_s),
+        format_elapsed(comparison.baseline_min_s),
+        format_elapsed(comparison.current_median_s),
+        format_elapsed(comparison.baseline_median_s),
+        change,
+        "regressed" if comparison.regressed else "",
+    ]
+
+
+def _solve_cached(problem: Problem, cache: DiskCache, key: str) -> Optional[Solution]:
+    start = perf_counter()
+    found, value = cache.get(key)
+    end = perf_counter()
+
+    if not found:
+        return None
+
+    logger.info("Using cached solution for day %d, part %d.", problem.day, problem.part)
+    return Solution(problem, value, None, end - start, 0, cached=True)
+
+
+def _uncached_solver(problem: Problem) -> Callable[[], object]:
+    if problem.has_phases:
+        return partial(_solve_uncached, problem)
+    else:
+        return problem.solver
+
+
+def _solve_uncached(problem: Problem) -> object:
+    # Read the input without using the cache so parsing is included when solving
+    # again.
+    return problem.solve(read_input(problem.day, problem.parse))
+
+
+def _solve_with_memory(
+    problem: Problem, solve: Callable[[Problem], Solution]
+) -> Solution:
+    solution = solve(problem)
+    if solution.exception is not None:
+        return solution
+
+    logger.info("Measuring memory for day %d, part %d...", problem.day, problem.part)
+    try:
+        _, usage = measure_memory(_uncached_solver(problem))
+    except (Timeout, MemoryError) as e:
+        return _exceeded_limit(solution, e)
+    except Exception as e:
+        logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=e)
+        return solution
+
+    return replace(solution, peak_bytes=usage.peak_bytes, rss_bytes=usage.rss_bytes)
+
+
+def _solve_with_profile(
+    problem: Problem, solve: Callable[[Problem], Solution], directory: Path
+) -> Solution:
+    solution = solve(problem)
+    if solution.exception is not None:
+        return solution
+
+    logger.info("Profiling day %d, part %d...", problem.day, problem.part)
+    path = profile_path(directory, problem.day, problem.part, ".pstats")
+    try:
+        profile_call(_uncached_solver(problem), path)
+    except (Timeout, MemoryError) as e:
+        return _exceeded_limit(solution, e)
+    except Exception as e:
+        logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=e)
+        return solution
+
+    return replace(solution, profile_path=path)
+
+
+def _solve_with_sampling(
+    problem: Problem,
+    solve: Callable[[Problem], Solution],
+    directory: Path,
+    interval: float,
+) -> Solution:
+    solution = solve(problem)
+    if solution.exception is not None:
+        return solution
+
+    logger.info("Sampling day %d, part %d...", problem.day, problem.part)
+    path = profile_path(directory, problem.day, problem.part, ".folded")
+    try:
+        _, count = sample_call(_uncached_solver(problem), path, interval)
+    except (Timeout, MemoryError) as e:
+        return _exceeded_limit(solution, e)
+    except Exception as e:
+        logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=e)
+        return solution
+
+    return replace(solution, stacks_path=path, stack_samples=count)
+
+
+def _exceeded_limit(solution: Solution, error: Exception) -> Solution:
+    # Exceeding a limit during an extra run fails the problem, as the solver is not
+    # within its limits even if the first run happened to be.
+    problem = solution.problem
+    logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=error)
+    return replace(solution, value=None, exception=error)
+
+
+def _solve_with_limits(
+    problem: Problem, solve: Callable[[Problem], Solution], limits: Limits
+) -> Solution:
+    start = perf_counter()
+    try:
+        with limited(limits):
+            return solve(problem)
+    except (Timeout, MemoryError) as e:
+        # Limits may be exceeded outside of the solver, such as while benchmarking.
+        logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=e)
+        return Solution(problem, None, e, perf_counter() - start, 0)
 
 
 def _solve_once(problem: Problem) -> Solution:
-    # Run solver once.
+    # Run solver once, timing the parse and solve phases separately if possible.
     logger.info("Solving day %d, part %d...", problem.day, problem.part)
+    parse_s, solve_s = None, None
+    parse_cached = False
+    meter = UsageMeter()
     start = perf_counter()
 
     try:
-        value = problem.solver()
+        with meter:
+            if problem.has_phases:
+                # Parsed inputs are cached, so any part solved after the first one in
+                # this process does not parse the input again.
+                parse_cached = input_loaded(problem.day)
+                data = load_input(problem.day, problem.parse)
+                parsed = perf_counter()
+                if not parse_cached:
+                    parse_s = parsed - start
+                value = problem.solve(data)
+                solve_s = perf_counter() - parsed
+            else:
+                value = problem.solver()
     except Exception as e:
         logger.error("Day %d, part %d failed.", problem.day, problem.part, exc_info=e)
         value = None
@@ -108,10 +1264,23 @@ def _solve_once(problem: Problem) -> Solution:
     end = perf_counter()
     elapsed = end - start
 
-    return Solution(problem, value, exception, elapsed, 1)
+    return Solution(
+        problem,
+        value,
+        exception,
+        elapsed,
+        1,
+        parse_s,
+        solve_s,
+        parse_cached=parse_cached,
+        cpu_user_s=meter.usage.cpu_user_s,
+        cpu_sys_s=meter.usage.cpu_sys_s,
+        gc_collections=meter.usage.gc_collections,
+        gc_s=meter.usage.gc_s,
+    )
 
 
-def _solve_timed(problem: Problem) -> Solution:
+def _solve_timed(problem: Problem, settings: BenchmarkSettings) -> Solution:
     # Run solver initially to get solution and catch any errors.
     initial = _solve_once(problem)
 
@@ -119,22 +1288,88 @@ def _solve_timed(problem: Problem) -> Solution:
         # An exception has occurred during initial execution so skip any benchmarking.
         return initial
 
-    timer = Timer(problem.solver)
+    if problem.has_phases:
+        # Read the input each time instead of using the cache so the full cost of
+        # parsing is measured.
+        data = load_input(problem.day, problem.parse)
+        phases = [
+            lambda: read_input(problem.day, problem.parse),
+            lambda: problem.solve(data),
+        ]
+        timer = Timer(lambda: problem.solve(read_input(problem.day, problem.parse)))
+    else:
+        phases = [problem.solver]
+        timer = Timer(problem.solver)
 
     logger.info("Warming up for day %d, part %d...", problem.day, problem.part)
     runs, _ = timer.autorange()
+    timers = _timers(phases, settings.gc == "enabled")
+    warm_up(timers, runs, settings.warmup)
+
+    overhead_s = None
+    if settings.stable:
+        # Each phase is called by its own timer, so has its own overhead.
+        overhead_s = timer_overhead(runs)
+        logger.debug("Timer overhead is %s per call.", format_elapsed(overhead_s))
 
-    # Repeat the timing procedure and get the minimum elapsed time before dividing
-    # by number of runs.
-    repeat = 5
     logger.info(
-        "Benchmarking day %d, part %d (%d x %d runs)...",
+        "Benchmarking day %d, part %d (%s%d x %d runs)...",
         problem.day,
         problem.part,
-        repeat,
+        "at least " if settings.adaptive else "",
+        settings.repeat,
+        runs,
+    )
+    samples = sample(timers, runs, settings)
+    if overhead_s is not None:
+        samples = _subtract_overhead(samples, overhead_s)
+
+    with_gc_s = None
+    if settings.gc == "both":
+        logger.info(
+            "Benchmarking day %d, part %d with GC...", problem.day, problem.part
+        )
+        gc_timers = _timers(phases, True)
+        warm_up(gc_timers, runs, settings.warmup)
+        gc_samples = sample(gc_timers, runs, settings)
+        if overhead_s is not None:
+            gc_samples = _subtract_overhead(gc_samples, overhead_s)
+        with_gc_s = min(map(sum, gc_samples))
+
+    # Use the minimum time per run for each phase as the elapsed time.
+    if problem.has_phases:
+        parse_s = min(p for p, _ in samples)
+        solve_s = min(s for _, s in samples)
+        elapsed = parse_s + solve_s
+    else:
+        parse_s, solve_s = None, None
+        elapsed = min(s[0] for s in samples)
+
+    return Solution(
+        problem,
+        initial.value,
+        None,
+        elapsed,
         runs,
+        parse_s,
+        solve_s,
+        samples_s=tuple(map(sum, samples)),
+        cpu_user_s=initial.cpu_user_s,
+        cpu_sys_s=initial.cpu_sys_s,
+        gc_collections=initial.gc_collections,
+        gc_s=initial.gc_s,
+        with_gc_s=with_gc_s,
+        overhead_s=overhead_s,
     )
-    results = timer.repeat(repeat, runs)
-    elapsed = min(results) / runs
 
-    return Solution(problem, initial.value, None, elapsed, runs)
+
+def _subtract_overhead(
+    samples: List[Tuple[float, ...]], overhead_s: float
+) -> List[Tuple[float, ...]]:
+    return [tuple(max(t - overhead_s, 0.0) for t in s) for s in samples]
+
+
+def _timers(phases: Sequence[Callable[[], object]], collect: bool) -> List[Timer]:
+    # Timers disable the garbage collector while timing unless the setup enables it.
+    setup = enable if collect else "pass"
+    return [Timer(p, setup=setup) for p in phases]
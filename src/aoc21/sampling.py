@@ -0,0 +1,152 @@
+from collections import Counter
+from pathlib import Path
+from sys import _current_frames, _getframe
+from threading import Event, Thread, current_thread, get_ident, main_thread
+from time import perf_counter
+from types import FrameType
+from typing import Callable, Counter as CounterType, Optional, Tuple, TypeVar
+
+try:
+    from signal import ITIMER_PROF, SIGPROF, setitimer, signal
+except ImportError:
+    # Interval timers are not available on Windows.
+    SIGPROF = None
+
+
+DEFAULT_INTERVAL = 1e-3
+DEFAULT_DURATION = 0.1
+
+T = TypeVar("T")
+
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    """
+    Records the call stack at regular intervals while a function runs.
+
+    On platforms with interval timers, a signal is delivered after each interval of
+    CPU time used by the process so sampling has very little overhead. Otherwise, a
+    background thread samples the stack after each interval of wall time.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        if interval <= 0:
+            raise ValueError("The interval must be positive.")
+
+        self.interval: float = interval
+        self.stacks: CounterType[Stack] = Counter()
+        self._root: Optional[FrameType] = None
+
+    @property
+    def count(self) -> int:
+        return sum(self.stacks.values())
+
+    def run(self, func: Callable[[], T], duration: float = 0.0) -> T:
+        """
+        Call a function while sampling its call stack.
+
+        :param func: The function to call.
+        :param duration: The function is called repeatedly until at least this many
+        seconds have passed, so fast functions still get enough samples.
+        :return: The result of the last call.
+        """
+
+        if SIGPROF is not None and current_thread() is main_thread():
+            return self._run_with_signal(func, duration)
+        else:
+            return self._run_with_thread(func, duration)
+
+    def write_collapsed(self, path: Path):
+        """
+        Write the sampled stacks in the collapsed format used by flame graph tools,
+        with one line for each stack with its frames separated by semicolons
+        followed by the number of samples.
+        """
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def _run_with_signal(self, func: Callable[[], T], duration: float) -> T:
+        previous = signal(SIGPROF, self._handle_signal)
+        # The timer is only set once as it counts CPU time in whole clock ticks, so
+        # would never expire if reset for each call of a fast function.
+        setitimer(ITIMER_PROF, self.interval, self.interval)
+        try:
+            return self._call(func, duration)
+        finally:
+            setitimer(ITIMER_PROF, 0)
+            signal(SIGPROF, previous)
+
+    def _handle_signal(self, signum, frame: Optional[FrameType]):
+        self._record(frame)
+
+    def _run_with_thread(self, func: Callable[[], T], duration: float) -> T:
+        ident = get_ident()
+        stop = Event()
+
+        def sample():
+            while not stop.wait(self.interval):
+                self._record(_current_frames().get(ident))
+
+        thread = Thread(target=sample, name="aoc21-sampler", daemon=True)
+        thread.start()
+        try:
+            return self._call(func, duration)
+        finally:
+            stop.set()
+            thread.join()
+
+    def _call(self, func: Callable[[], T], duration: float) -> T:
+        # Only record frames called from this one.
+        self._root = _getframe()
+        start = perf_counter()
+        result = func()
+        while perf_counter() - start < duration:
+            result = func()
+
+        return result
+
+    def _record(self, frame: Optional[FrameType]):
+        frames = []
+        while frame is not None and frame is not self._root:
+            frames.append(_describe(frame))
+            frame = frame.f_back
+
+        if frame is self._root and frames:
+            # Stacks are written from the outermost frame inwards.
+            frames.reverse()
+            self.stacks[tuple(frames)] += 1
+
+
+def _describe(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def sample_call(
+    func: Callable[[], T],
+    path: Path,
+    interval: float = DEFAULT_INTERVAL,
+    duration: float = DEFAULT_DURATION,
+) -> Tuple[T, int]:
+    """
+    Call a function with the sampling profiler and save the collapsed stacks.
+
+    :param func: The function to profile.
+    :param path: The file to write collapsed stacks to.
+    :param interval: The time in seconds between samples.
+    :param duration: The function is called repeatedly until at least this many
+    seconds have passed, so fast functions still get enough samples.
+    :return: The result of the last call and the number of samples recorded.
+    """
+
+    profiler = SamplingProfiler(interval)
+    try:
+        result = profiler.run(func, duration)
+    finally:
+        profiler.write_collapsed(path)
+
+    return result, profiler.count
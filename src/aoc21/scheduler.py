@@ -0,0 +1,159 @@
+from heapq import heapify, heapreplace
+from json import dumps, loads
+from logging import getLogger
+from os import cpu_count
+from pathlib import Path
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from aoc21.problem import Problem
+from aoc21.solution import Solution
+
+
+logger = getLogger("aoc21")
+
+
+class Job(NamedTuple):
+    """
+    Problems to be solved in sequence by the same worker.
+    """
+
+    problems: Tuple[Problem, ...]
+    cost_s: float
+
+
+def default_workers() -> int:
+    return cpu_count() or 1
+
+
+def problem_key(problem: Problem) -> str:
+    return f"{problem.day}.{problem.part}"
+
+
+def load_timings(path: Path) -> Dict[str, float]:
+    """
+    Load the last recorded time for each problem.
+
+    :param path: The JSON file with recorded times.
+    :return: The times in seconds keyed by day and part, such as '1.2'.
+    """
+
+    try:
+        timings = loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning("Ignoring invalid timings in %s.", path)
+        return {}
+
+    return {k: float(v) for k, v in timings.items()}
+
+
+def save_timings(path: Path, solutions: Iterable[Solution]):
+    """
+    Record the time taken by each solution which was actually run, keeping the
+    previous times for all other problems.
+
+    :param path: The JSON file with recorded times.
+    :param solutions: The solutions.
+    """
+
+    timings = load_timings(path)
+    for s in solutions:
+        if s.exception is None and not s.cached:
+            timings[problem_key(s.problem)] = s.elapsed_s
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dumps(timings, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def group_problems(
+    problems: Iterable[Problem], split_days: Collection[int] = ()
+) -> List[Tuple[Problem, ...]]:
+    """
+    Group problems which share the same input, so the input is only parsed once by
+    the worker solving them.
+
+    :param problems: The problems.
+    :param split_days: Days with inputs already available to every worker, which do
+    not need their problems grouped.
+    :return: Groups of problems in the order they were first found.
+    """
+
+    groups: Dict[object, List[Problem]] = {}
+    for p in problems:
+        if p.has_phases and p.day not in split_days:
+            key = (p.day, p.parse)
+        else:
+            key = (p.day, p.part, p.solver)
+        groups.setdefault(key, []).append(p)
+
+    return [tuple(g) for g in groups.values()]
+
+
+def schedule(
+    problems: Iterable[Problem],
+    estimates: Optional[Mapping[str, float]] = None,
+    split_days: Collection[int] = (),
+) -> List[Job]:
+    """
+    Order problems so the most expensive jobs are started first, which keeps the
+    total time close to the ideal when handed out to workers as they become free.
+
+    :param problems: The problems to solve.
+    :param estimates: The estimated time in seconds for each problem keyed by day and
+    part. Problems without estimates are assumed to be as expensive as the most
+    expensive known problem so they are not left until the end.
+    :param split_days: Days with inputs already available to every worker, whose
+    problems can be solved by different workers.
+    :return: Jobs sorted from the most expensive to the least expensive.
+    """
+
+    estimates = estimates or {}
+    default = max(estimates.values(), default=1.0)
+
+    jobs = []
+    for group in group_problems(problems, split_days):
+        cost = sum(estimates.get(problem_key(p), default) for p in group)
+        jobs.append(Job(group, cost))
+
+    # Sorting is stable so jobs with equal costs remain in order.
+    jobs.sort(key=lambda j: j.cost_s, reverse=True)
+    return jobs
+
+
+def ideal_makespan(costs: Sequence[float], workers: int) -> float:
+    """
+    Get the lower bound of the time needed to finish jobs with a number of workers.
+    """
+
+    if not costs:
+        return 0.0
+
+    return max(max(costs), sum(costs) / workers)
+
+
+def list_makespan(costs: Sequence[float], workers: int) -> float:
+    """
+    Get the time needed to finish jobs in order, each being given to the first worker
+    to become free.
+    """
+
+    finish = [0.0] * min(workers, len(costs))
+    if not finish:
+        return 0.0
+
+    heapify(finish)
+    for c in costs:
+        heapreplace(finish, finish[0] + c)
+
+    return max(finish)
@@ -0,0 +1,220 @@
+from json import JSONDecodeError, dumps, loads
+from logging import getLogger
+from pathlib import Path
+from socketserver import StreamRequestHandler, UnixStreamServer
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from aoc21.cache import default_cache_directory
+from aoc21.days import DAYS, get_problems, load_problems
+from aoc21.inputs import INPUT_CACHE, load_input, set_input_paths
+from aoc21.output import solution_as_dict
+from aoc21.runner import execute
+
+
+logger = getLogger("aoc21")
+
+
+def default_socket_path() -> Path:
+    """
+    Get the socket the server listens on if not otherwise specified.
+    """
+
+    return default_cache_directory() / "server.sock"
+
+
+class SolverServer(UnixStreamServer):
+    """
+    Solves problems on request over a Unix socket, keeping day modules imported and
+    parsed inputs cached between requests.
+
+    Each line sent to the server is a JSON request and gets a line with a JSON
+    response. Requests have a day, and optionally a part and the path of an input
+    file to use instead of the packaged input:
+
+        {"day": 1, "part": 2, "input": "/path/to/input.txt"}
+
+    Responses have the solutions in the same format as JSON output, or an error:
+
+        {"ok": true, "solutions": [{"day": 1, "part": 2, "value": 1234, ...}]}
+        {"ok": false, "error": "No solutions for day 26."}
+
+    A request of {"command": "shutdown"} stops the server once the connection closes.
+    Requests are handled one at a time, so solvers have the process to themselves.
+    Connections are also handled one at a time. While one is open, the server blocks
+    on it, and other clients wait to connect until it closes.
+    """
+
+    def __init__(self, path: Path, input_paths: Optional[Mapping[int, Path]] = None):
+        """
+        :param path: The socket to listen on, which must not be in use by another
+        server. Stale sockets are replaced.
+        :param input_paths: Files to read instead of the packaged inputs for some days
+        when requests do not specify an input.
+        """
+
+        if path.exists():
+            if _is_listening(path):
+                raise ValueError(f"A server is already listening on {path}.")
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        super().__init__(str(path), _Handler)
+        self.path = path
+        self.input_paths: Dict[int, Path] = dict(input_paths or {})
+        self.stopping = False
+        # Files last read for each input path, to notice when they change.
+        self._input_stats: Dict[Path, Tuple[int, int]] = {}
+
+    def preload(self):
+        """
+        Import every day and parse the inputs of days with separate parse phases, so
+        the first requests do not pay for them.
+        """
+
+        set_input_paths(self.input_paths)
+        for day, path in self.input_paths.items():
+            # Record the files before reading them, so later changes are noticed.
+            self._check_input(day, path)
+        for problem in get_problems():
+            if problem.has_phases:
+                load_input(problem.day, problem.parse)
+
+        logger.info("Preloaded %d days.", len(DAYS))
+
+    def run(self):
+        """
+        Handle requests until asked to shut down.
+        """
+
+        logger.info("Listening on %s.", self.path)
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.path.unlink(missing_ok=True)
+
+    def respond(self, request: Any) -> Dict[str, Any]:
+        """
+        Get the response to a decoded request.
+        """
+
+        if not isinstance(request, dict):
+            return _error("Expected a JSON object.")
+
+        command = request.get("command", "solve")
+        if command == "shutdown":
+            logger.info("Shutting down.")
+            self.stopping = True
+            return {"ok": True}
+        elif command == "ping":
+            return {"ok": True}
+        elif command != "solve":
+            return _error(f"Unknown command: {command!r}.")
+
+        day, part, path = request.get("day"), request.get("part"), request.get("input")
+        if not isinstance(day, int):
+            return _error("Expected an integer day.")
+        if part is not None and not isinstance(part, int):
+            return _error("Expected an integer part.")
+        if path is not None and not isinstance(path, str):
+            return _error("Expected the input to be a path.")
+
+        try:
+            problems = load_problems(day)
+        except ValueError as e:
+            return _error(str(e))
+
+        if part is not None:
+            problems = [p for p in problems if p.part == part]
+            if not problems:
+                return _error(f"No solution for day {day}, part {part}.")
+
+        input_paths = dict(self.input_paths)
+        if path is not None:
+            input_paths[day] = Path(path)
+        if day in input_paths:
+            error = self._check_input(day, input_paths[day])
+            if error is not None:
+                return _error(error)
+
+        set_input_paths(input_paths)
+        try:
+            solutions = execute(problems, parallel=False)
+        finally:
+            set_input_paths(self.input_paths)
+
+        return {"ok": True, "solutions": list(map(solution_as_dict, solutions))}
+
+    def _check_input(self, day: int, path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError as e:
+            return f"Cannot read input {path}: {e.strerror}."
+
+        # Parsed inputs are cached by path, so discard them if the file has changed.
+        key = stat.st_mtime_ns, stat.st_size
+        if self._input_stats.get(path, key) != key:
+            logger.info("Input %s has changed.", path)
+            INPUT_CACHE.invalidate(day, str(path))
+        self._input_stats[path] = key
+
+        return None
+
+
+def query(path: Path, requests: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Send requests to a server and wait for the responses.
+
+    :param path: The socket the server is listening on.
+    :param requests: The requests, which are sent over one connection.
+    :return: The response to each request, in order.
+    """
+
+    from socket import AF_UNIX, SOCK_STREAM, socket
+
+    responses = []
+    with socket(AF_UNIX, SOCK_STREAM) as s:
+        s.connect(str(path))
+        with s.makefile("rwb") as f:
+            for request in requests:
+                f.write(dumps(request).encode() + b"\n")
+                f.flush()
+                line = f.readline()
+                if not line:
+                    raise ConnectionError("The server closed the connection.")
+                responses.append(loads(line))
+
+    return responses
+
+
+class _Handler(StreamRequestHandler):
+    server: SolverServer
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = loads(line)
+            except JSONDecodeError as e:
+                response = _error(f"Invalid JSON: {e}.")
+            else:
+                response = self.server.respond(request)
+
+            self.wfile.write(dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": message}
+
+
+def _is_listening(path: Path) -> bool:
+    from socket import AF_UNIX, SOCK_STREAM, socket
+
+    with socket(AF_UNIX, SOCK_STREAM) as s:
+        try:
+            s.connect(str(path))
+        except OSError:
+            return False
+
+    return True
@@ -0,0 +1,134 @@
+from array import array
+from atexit import register
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+
+class SharedInput(NamedTuple):
+    """
+    Describes a parsed input published in shared memory.
+    """
+
+    name: str
+    typecode: str
+    length: int
+    rows: Optional[int] = None
+
+
+# Shared memory attached by this process and the views of it, which must stay open
+# while the inputs are in use.
+_attached: List[Tuple[SharedMemory, List[memoryview]]] = []
+
+
+def is_shareable(value: object) -> bool:
+    """
+    Check whether a parsed input can be shared, which requires a tuple of integers or
+    a tuple of rows of integers with the same length.
+    """
+
+    if not isinstance(value, tuple) or not value:
+        return False
+    elif all(isinstance(v, int) for v in value):
+        return _typecode(value) is not None
+    elif all(isinstance(r, tuple) for r in value):
+        width = len(value[0])
+        return (
+            all(len(r) == width and all(isinstance(v, int) for v in r) for r in value)
+            and _typecode(chain.from_iterable(value)) is not None
+        )
+    else:
+        return False
+
+
+def publish(value: Sequence) -> Tuple[SharedMemory, SharedInput]:
+    """
+    Copy a parsed input into a new block of shared memory.
+
+    :param value: The parsed input, which must be shareable.
+    :return: The shared memory, which must be released once no longer needed, and a
+    description of the input to send to other processes.
+    """
+
+    rows = None
+    if value and isinstance(value[0], tuple):
+        rows = len(value)
+        value = tuple(chain.from_iterable(value))
+
+    typecode = _typecode(value)
+    if typecode is None:
+        raise ValueError("The input must only have integers that fit in 64 bits.")
+
+    values = array(typecode, value)
+    size = len(values) * values.itemsize
+    memory = SharedMemory(create=True, size=max(size, 1))
+    memory.buf[:size] = memoryview(values).cast("B")
+
+    return memory, SharedInput(memory.name, typecode, len(values), rows)
+
+
+def attach(shared: SharedInput) -> Sequence:
+    """
+    Get a parsed input published by another process without copying it.
+
+    :param shared: The description of the input.
+    :return: A read-only view of the integers, or a tuple of views for each row.
+    """
+
+    memory = _open(shared.name)
+    size = shared.length * array(shared.typecode).itemsize
+    view = memory.buf[:size].toreadonly().cast(shared.typecode)
+
+    if shared.rows is None:
+        views = [view]
+        value = view
+    else:
+        width = shared.length // shared.rows
+        views = [view[i * width : (i + 1) * width] for i in range(shared.rows)]
+        views.append(view)
+        value = tuple(views[:-1])
+
+    if not _attached:
+        register(_detach)
+    _attached.append((memory, views))
+
+    return value
+
+
+def release(memory: SharedMemory):
+    """
+    Free shared memory created by this process.
+    """
+
+    memory.close()
+    memory.unlink()
+
+
+def _typecode(values) -> Optional[str]:
+    values = tuple(values)
+    low, high = min(values, default=0), max(values, default=0)
+    if -(1 << 7) <= low and high < 1 << 7:
+        return "b"
+    elif -(1 << 63) <= low and high < 1 << 63:
+        return "q"
+    else:
+        return None
+
+
+def _open(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching always registers the memory with the resource
+        # tracker, which is shared with the process which created it so has no effect.
+        return SharedMemory(name)
+
+
+def _detach():
+    # Views must be released before the memory can be closed, which would otherwise
+    # fail when the memory is garbage collected as the interpreter exits.
+    while _attached:
+        memory, views = _attached.pop()
+        for view in views:
+            view.release()
+        memory.close()
@@ -1,7 +1,15 @@
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
 from aoc21.problem import Problem
+from aoc21.stats import (
+    coefficient_of_variation,
+    mean,
+    median,
+    percentile,
+    standard_deviation,
+)
 
 
 @dataclass
@@ -15,13 +23,77 @@ class Solution:
     exception: Optional[Exception]
     elapsed_s: float
     runs: int
+    parse_s: Optional[float] = None
+    solve_s: Optional[float] = None
+    cached: bool = False
+    # Whether the parsed input was already cached, so no parse time was measured.
+    parse_cached: bool = False
+    samples_s: Tuple[float, ...] = ()
+    peak_bytes: Optional[int] = None
+    rss_bytes: Optional[int] = None
+    profile_path: Optional[Path] = None
+    stacks_path: Optional[Path] = None
+    stack_samples: int = 0
+    cpu_user_s: Optional[float] = None
+    cpu_sys_s: Optional[float] = None
+    gc_collections: Tuple[int, ...] = ()
+    gc_s: Optional[float] = None
+    with_gc_s: Optional[float] = None
+    overhead_s: Optional[float] = None
 
     @property
     def elapsed(self) -> str:
-        return _format_elapsed(self.elapsed_s)
+        return format_elapsed(self.elapsed_s)
 
+    # Statistics fall back to the single elapsed time if not benchmarked.
 
-def _format_elapsed(seconds: float) -> str:
+    @property
+    def median_s(self) -> float:
+        return median(self.samples_s) if self.samples_s else self.elapsed_s
+
+    @property
+    def mean_s(self) -> float:
+        return mean(self.samples_s) if self.samples_s else self.elapsed_s
+
+    @property
+    def stddev_s(self) -> float:
+        return standard_deviation(self.samples_s)
+
+    @property
+    def variation(self) -> float:
+        return coefficient_of_variation(self.samples_s) if self.samples_s else 0.0
+
+    @property
+    def p95_s(self) -> float:
+        return percentile(self.samples_s, 95) if self.samples_s else self.elapsed_s
+
+    @property
+    def parse_elapsed(self) -> str:
+        if self.parse_cached:
+            return "cached"
+        return format_elapsed(self.parse_s) if self.parse_s is not None else ""
+
+    @property
+    def solve_elapsed(self) -> str:
+        return format_elapsed(self.solve_s) if self.solve_s is not None else ""
+
+
+def format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return ""
+
+    magnitude = abs(size)
+    if magnitude >= 1 << 30:
+        return f"{size / (1 << 30):.1f} GiB"
+    elif magnitude >= 1 << 20:
+        return f"{size / (1 << 20):.1f} MiB"
+    elif magnitude >= 1 << 10:
+        return f"{size / (1 << 10):.1f} KiB"
+    else:
+        return f"{size} B"
+
+
+def format_elapsed(seconds: float) -> str:
     if seconds >= 10.0:
         return f"{seconds:.1f} s"
     elif seconds >= 1e-2:
@@ -0,0 +1,95 @@
+from os import environ, linesep, pathsep
+from subprocess import PIPE, run
+from sys import executable, path, stderr
+from typing import List, NamedTuple, Sequence
+
+
+class ImportTime(NamedTuple):
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_times(lines: Sequence[str]) -> List[ImportTime]:
+    """
+    Parse the output of running Python with '-X importtime'.
+
+    :param lines: Lines written to stderr, which may include other output.
+    :return: Times for each import in the order they finished.
+    """
+
+    times = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            # Skip the header line.
+            continue
+
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        # Nested imports are indented by two spaces for each level.
+        depth = (len(name) - len(module) - 1) // 2
+        times.append(ImportTime(module, depth, self_us, cumulative_us))
+
+    return times
+
+
+def profile_startup(args: Sequence[str], top: int = 20) -> int:
+    """
+    Run the command line interface again in a new interpreter with import times
+    enabled, and print the slowest imports after its output.
+
+    :param args: The arguments to run the command line interface with.
+    :param top: The number of imports to list.
+    :return: The exit code of the new interpreter.
+    """
+
+    # Make sure the new interpreter can find this package the same way.
+    env = dict(environ, PYTHONPATH=pathsep.join(p for p in path if p))
+    process = run(
+        [executable, "-X", "importtime", "-m", "aoc21.main", *args],
+        stderr=PIPE,
+        text=True,
+        env=env,
+    )
+
+    lines = process.stderr.splitlines()
+    times = parse_import_times(lines)
+    for line in lines:
+        if not line.startswith("import time:"):
+            print(line, file=stderr)
+
+    # Only top level imports count towards the total time.
+    total_us = sum(t.cumulative_us for t in times if t.depth == 0)
+    slowest = sorted(times, key=lambda t: t.cumulative_us, reverse=True)[:top]
+
+    from tabulate import tabulate
+
+    table = tabulate(
+        (
+            (
+                t.module,
+                t.depth,
+                f"{t.self_us / 1e3:.1f}",
+                f"{t.cumulative_us / 1e3:.1f}",
+            )
+            for t in slowest
+        ),
+        ("Module", "Depth", "Self (ms)", "Cumulative (ms)"),
+        tablefmt="pipe",
+        numalign="right",
+        stralign="right",
+    )
+    summary = f"Imported {len(times)} modules in {total_us / 1e3:.1f} ms."
+    print(summary, "", table, "", sep=linesep)
+
+    return process.returncode
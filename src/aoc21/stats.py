@@ -0,0 +1,116 @@
+from math import ceil, floor, fsum, inf, sqrt
+from typing import Sequence, Tuple
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Get a percentile of samples, interpolating linearly between the closest ranks.
+
+    :param samples: The samples, which must not be empty.
+    :param q: The percentile, between 0 and 100.
+    :return: The value at the percentile.
+    """
+
+    if not samples:
+        raise ValueError("Expected at least one sample.")
+    if not 0 <= q <= 100:
+        raise ValueError("Percentile must be between 0 and 100.")
+
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    lower = floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = position - lower
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+def median(samples: Sequence[float]) -> float:
+    """
+    Get the median of samples, which must not be empty.
+    """
+
+    return percentile(samples, 50)
+
+
+def mean(samples: Sequence[float]) -> float:
+    """
+    Get the mean of samples, which must not be empty.
+    """
+
+    if not samples:
+        raise ValueError("Expected at least one sample.")
+
+    return fsum(samples) / len(samples)
+
+
+def standard_deviation(samples: Sequence[float]) -> float:
+    """
+    Get the sample standard deviation, or zero if there are too few samples.
+    """
+
+    n = len(samples)
+    if n < 2:
+        return 0.0
+
+    average = mean(samples)
+    return sqrt(fsum((s - average) ** 2 for s in samples) / (n - 1))
+
+
+def coefficient_of_variation(samples: Sequence[float]) -> float:
+    """
+    Get the standard deviation of samples relative to their mean, which must not be
+    empty.
+    """
+
+    average = mean(samples)
+    if average <= 0:
+        return 0.0
+
+    return standard_deviation(samples) / average
+
+
+def median_interval(
+    samples: Sequence[float], confidence: float = 0.95
+) -> Tuple[float, float]:
+    """
+    Get a confidence interval for the median of samples.
+
+    The interval is found from the order statistics of the samples so no assumptions
+    are made about their distribution, which is rarely normal for timings.
+
+    :param samples: The samples.
+    :param confidence: The confidence level of the interval.
+    :return: The lower and upper bounds of the interval, which are infinite if there
+    are too few samples.
+    """
+
+    from statistics import NormalDist
+
+    n = len(samples)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    spread = z * sqrt(n) / 2
+
+    # Ranks are 1-based.
+    lower = floor(n / 2 - spread)
+    upper = ceil(n / 2 + spread) + 1
+    if lower < 1 or upper > n:
+        return -inf, inf
+
+    ordered = sorted(samples)
+    return ordered[lower - 1], ordered[upper - 1]
+
+
+def relative_interval_width(
+    samples: Sequence[float], confidence: float = 0.95
+) -> float:
+    """
+    Get the width of the confidence interval for the median relative to the median.
+    """
+
+    lower, upper = median_interval(samples, confidence)
+    middle = median(samples) if samples else 0.0
+    if middle <= 0:
+        return inf
+
+    return (upper - lower) / middle
@@ -0,0 +1,72 @@
+from gc import callbacks
+from os import times
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Usage(NamedTuple):
+    """
+    Processor time and garbage collection while running some code.
+    """
+
+    cpu_user_s: float
+    cpu_sys_s: float
+    gc_collections: Tuple[int, ...]
+    gc_s: float
+
+
+def cpu_times() -> Tuple[float, float]:
+    """
+    Get the user and system processor time used by this process in seconds.
+    """
+
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        # times also returns seconds, but only as precise as a clock tick on most
+        # platforms, so it is only used where getrusage is not available.
+        t = times()
+        return t.user, t.system
+
+    usage = getrusage(RUSAGE_SELF)
+    return usage.ru_utime, usage.ru_stime
+
+
+class UsageMeter:
+    """
+    Measures the processor time used by this process and the garbage collections in it
+    while the context is active.
+
+    Both are counted for the whole process, so include other threads.
+    """
+
+    def __init__(self):
+        self.usage: Optional[Usage] = None
+        self._collections: List[int] = [0, 0, 0]
+        self._gc_s: float = 0.0
+        self._gc_start: Optional[float] = None
+        self._cpu_start: Tuple[float, float] = (0.0, 0.0)
+
+    def __enter__(self) -> "UsageMeter":
+        callbacks.append(self._on_gc)
+        self._cpu_start = cpu_times()
+        return self
+
+    def __exit__(self, *exc_info):
+        user, system = cpu_times()
+        callbacks.remove(self._on_gc)
+
+        self.usage = Usage(
+            user - self._cpu_start[0],
+            system - self._cpu_start[1],
+            tuple(self._collections),
+            self._gc_s,
+        )
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]):
+        if phase == "start":
+            self._gc_start = perf_counter()
+        elif self._gc_start is not None:
+            self._gc_s += perf_counter() - self._gc_start
+            self._gc_start = None
+            self._collections[info["generation"]] += 1
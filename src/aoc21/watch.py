@@ -0,0 +1,140 @@
+from importlib import reload
+from importlib.util import find_spec
+from logging import getLogger
+from pathlib import Path
+from sys import modules
+from time import sleep
+from typing import Callable, Collection, Dict, NamedTuple, Optional, Set, Tuple
+
+from aoc21.cache import dependencies, module_digest
+from aoc21.days import DAYS
+from aoc21.inputs import input_file, invalidate_input
+
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+logger = getLogger("aoc21")
+
+# The modification time and size of a file, or None if it does not exist.
+Stat = Optional[Tuple[int, int]]
+
+
+class Changes(NamedTuple):
+    """
+    Days with modules or inputs which have changed.
+    """
+
+    modules: Set[int]
+    inputs: Set[int]
+
+    @property
+    def days(self) -> Set[int]:
+        return self.modules | self.inputs
+
+
+class Watcher:
+    """
+    Polls the modules and input files for days to find which have changed.
+    """
+
+    def __init__(self, days: Collection[int]):
+        self._files: Dict[int, Tuple[Optional[Path], Optional[Path]]] = {
+            day: (_module_file(day), input_file(day)) for day in days
+        }
+        self._stats: Dict[int, Tuple[Stat, Stat]] = self._snapshot()
+
+    def poll(self) -> Changes:
+        """
+        Find the days changed since the last poll.
+        """
+
+        stats = self._snapshot()
+        changes = Changes(set(), set())
+        for day, (module, data) in stats.items():
+            previous_module, previous_data = self._stats[day]
+            if module != previous_module:
+                changes.modules.add(day)
+            if data != previous_data:
+                changes.inputs.add(day)
+
+        self._stats = stats
+        return changes
+
+    def _snapshot(self) -> Dict[int, Tuple[Stat, Stat]]:
+        return {
+            day: (_stat(module), _stat(data))
+            for day, (module, data) in self._files.items()
+        }
+
+
+def watch(
+    days: Optional[Collection[int]],
+    solve: Callable[[Collection[int]], object],
+    interval: float = DEFAULT_POLL_INTERVAL,
+):
+    """
+    Solve problems, then solve them again for each day whose module or input changes
+    until interrupted.
+
+    Changed modules are reloaded and parsed inputs are discarded for changed days
+    only, so unchanged days keep their cached inputs. Solving must be done in this
+    process for the reloaded modules and cached inputs to be used.
+
+    :param days: Days to watch, or None to watch every day.
+    :param solve: Solves and prints the problems for some days.
+    :param interval: The time in seconds between polls.
+    """
+
+    days = sorted(day for day in DAYS if days is None or day in days)
+    watcher = Watcher(days)
+    solve(days)
+    print("Watching for changes, press Ctrl+C to stop.", flush=True)
+
+    while True:
+        sleep(interval)
+        changes = watcher.poll()
+        if not changes.days:
+            continue
+
+        module_digest.cache_clear()
+        dependencies.cache_clear()
+        failed = set()
+        for day in sorted(changes.modules):
+            module = modules.get(DAYS[day])
+            if module is None:
+                continue
+
+            logger.info("Reloading day %d.", day)
+            try:
+                reload(module)
+            except Exception as e:
+                logger.error("Failed to reload day %d.", day, exc_info=e)
+                failed.add(day)
+
+        # Parsed inputs are cached by day rather than parser, so they are discarded
+        # for changed modules as well as changed inputs.
+        changed = sorted(changes.days - failed)
+        if not changed:
+            continue
+        for day in changed:
+            invalidate_input(day)
+
+        print(f"Changed: {', '.join(map(str, changed))}", flush=True)
+        solve(changed)
+
+
+def _module_file(day: int) -> Optional[Path]:
+    spec = find_spec(DAYS[day])
+    return Path(spec.origin) if spec is not None and spec.origin else None
+
+
+def _stat(path: Optional[Path]) -> Stat:
+    if path is None:
+        return None
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,162 @@
+from os import dup, dup2, fdopen
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from struct import Struct
+from sys import executable, stdin
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from asyncio.subprocess import Process
+
+
+# Frames are pickled objects prefixed with their length.
+HEADER = Struct(">Q")
+
+
+class WorkerError(Exception):
+    """
+    Raised when a worker process exits before replying.
+    """
+
+
+def encode_frame(value: Any) -> bytes:
+    """
+    Pickle a value into a frame to send to or from a worker.
+    """
+
+    data = dumps(value, protocol=HIGHEST_PROTOCOL)
+    return HEADER.pack(len(data)) + data
+
+
+def read_frame(f: IO[bytes]) -> Any:
+    """
+    Read a frame and unpickle its value.
+
+    :param f: The stream to read from.
+    :return: The value.
+    :raise EOFError: If the stream ends before a whole frame is read.
+    """
+
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise EOFError("The stream ended before the frame header.")
+
+    (size,) = HEADER.unpack(header)
+    data = f.read(size)
+    if len(data) < size:
+        raise EOFError("The stream ended before the frame data.")
+
+    return loads(data)
+
+
+class WorkerProcess:
+    """
+    A Python process which calls functions sent to it over pipes, isolated from this
+    process and every other worker. Used from an asyncio event loop.
+
+    Functions and their arguments are pickled, so must be importable by the worker.
+    """
+
+    def __init__(self, process: "Process"):
+        self._process = process
+        self.busy = False
+
+    @classmethod
+    async def start(
+        cls,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Sequence[Any] = (),
+    ) -> "WorkerProcess":
+        """
+        Start a worker process.
+
+        :param initializer: Called in the worker before any functions are sent.
+        :param initargs: Arguments for the initializer.
+        :return: The worker.
+        """
+
+        from asyncio import create_subprocess_exec
+        from asyncio.subprocess import PIPE
+
+        process = await create_subprocess_exec(
+            executable, "-m", "aoc21.worker", stdin=PIPE, stdout=PIPE
+        )
+        worker = cls(process)
+        worker._send((initializer, tuple(initargs)))
+        return worker
+
+    async def call(self, func: Callable[[Any], Any], arg: Any) -> Any:
+        """
+        Call a function in the worker and wait for its result.
+
+        :raise WorkerError: If the worker exits before replying.
+        """
+
+        from asyncio import IncompleteReadError
+
+        self.busy = True
+        self._send((func, arg))
+        try:
+            await self._process.stdin.drain()
+            header = await self._process.stdout.readexactly(HEADER.size)
+            (size,) = HEADER.unpack(header)
+            data = await self._process.stdout.readexactly(size)
+        except (IncompleteReadError, ConnectionError) as e:
+            code = await self._process.wait()
+            raise WorkerError(f"The worker exited with code {code}.") from e
+
+        self.busy = False
+        return loads(data)
+
+    async def close(self):
+        """
+        Stop the worker, killing it if it is still calling a function.
+        """
+
+        if self.busy:
+            self.kill()
+        elif self._process.returncode is None:
+            # The worker exits once there are no more frames to read.
+            self._process.stdin.close()
+
+        await self._process.wait()
+
+    def kill(self):
+        """
+        Kill the worker immediately.
+        """
+
+        if self._process.returncode is None:
+            self._process.kill()
+
+    def _send(self, value: Any):
+        self._process.stdin.write(encode_frame(value))
+
+
+def main():
+    """
+    Run a worker, reading frames from standard input and writing replies to standard
+    output.
+    """
+
+    # Anything printed by the functions goes to standard error so it is not mixed up
+    # with the replies.
+    replies = fdopen(dup(1), "wb")
+    dup2(2, 1)
+    requests = stdin.buffer
+
+    initializer, initargs = read_frame(requests)
+    if initializer is not None:
+        initializer(*initargs)
+
+    while True:
+        try:
+            func, arg = read_frame(requests)
+        except EOFError:
+            return
+
+        replies.write(encode_frame(func(arg)))
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import pytest
+
+from aoc21.affinity import available_cpus, can_pin, default_cpu, pinned
+
+
+def test_default_cpu():
+    assert default_cpu() in available_cpus()
+
+
+@pytest.mark.skipif(not can_pin(), reason="Pinning is not supported.")
+def test_pinned():
+    before = available_cpus()
+    cpu = min(before)
+
+    with pinned(cpu) as pinned_cpu:
+        assert pinned_cpu == cpu
+        assert available_cpus() == {cpu}
+
+    assert available_cpus() == before
@@ -0,0 +1,94 @@
+from asyncio import run, sleep as async_sleep, wait_for
+from functools import partial
+from pathlib import Path
+from time import sleep
+
+from aoc21.days import get_problems
+from aoc21.limits import Timeout
+from aoc21.problem import Problem
+from aoc21.runner import run_async
+
+
+def _hang():
+    sleep(60)
+
+
+def _crash():
+    # Exit the worker without replying.
+    import os
+
+    os._exit(3)
+
+
+def _touch(path: Path):
+    path.touch()
+
+
+async def _collect(*args, **kwargs):
+    return [s async for s in run_async(*args, **kwargs)]
+
+
+def test_run_async():
+    solutions = run(_collect(get_problems([1, 6]), workers=2))
+
+    assert sorted((s.problem.day, s.problem.part) for s in solutions) == [
+        (1, 1),
+        (1, 2),
+        (6, 1),
+        (6, 2),
+    ]
+    assert all(s.exception is None for s in solutions)
+
+
+def test_run_async_timeout():
+    problems = [Problem(0, 1, _hang), *get_problems([1])]
+    solutions = run(_collect(problems, workers=1, timeout_s=1.0))
+
+    hung, *solved = solutions
+    assert isinstance(hung.exception, Timeout)
+    assert [s.exception for s in solved] == [None, None]
+
+
+def test_run_async_crash():
+    problems = [Problem(0, 1, _crash), *get_problems([1])]
+    solutions = run(_collect(problems, workers=1))
+
+    assert solutions[0].exception is not None
+    assert [s.exception for s in solutions[1:]] == [None, None]
+
+
+def test_run_async_close():
+    async def first():
+        solutions = run_async([Problem(0, 1, _hang), *get_problems([1])], workers=2)
+        async for solution in solutions:
+            await solutions.aclose()
+            return solution
+
+    solution = run(first())
+    assert solution.problem.day == 1
+
+
+def test_run_async_unpicklable():
+    problems = [*get_problems([1]), Problem(1, 3, lambda: 1)]
+    solutions = run(wait_for(_collect(problems, workers=1), 60))
+
+    assert [s.exception for s in solutions[:2]] == [None, None]
+    assert solutions[2].exception is not None
+
+
+def test_run_async_max_pending(tmp_path):
+    problems = [Problem(0, i, partial(_touch, tmp_path / str(i))) for i in range(5)]
+
+    async def consume():
+        solutions = run_async(problems, workers=1, max_pending=1)
+        first = await solutions.__anext__()
+        # Give the worker time to solve every problem if nothing stopped it.
+        await async_sleep(2.0)
+        solved = len(list(tmp_path.iterdir()))
+        rest = [s async for s in solutions]
+        return [first, *rest], solved
+
+    solutions, solved = run(consume())
+    assert solved < len(problems)
+    assert len(solutions) == len(problems)
+    assert len(list(tmp_path.iterdir())) == len(problems)
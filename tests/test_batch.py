@@ -0,0 +1,29 @@
+from aoc21.batch import find_inputs, solve_file
+from aoc21.days import load_problems
+
+
+def test_find_inputs(tmp_path):
+    (tmp_path / "b.txt").write_text("")
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / ".hidden").write_text("")
+    (tmp_path / "nested").mkdir()
+
+    assert [p.name for p in find_inputs(tmp_path)] == ["a.txt", "b.txt"]
+
+
+def test_solve_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n")
+
+    result = solve_file(load_problems(1), path)
+    assert result.size_bytes == path.stat().st_size
+    assert [s.value for s in result.solutions] == [7, 5]
+    assert all(s.exception is None for s in result.solutions)
+
+
+def test_solve_file_parse_error(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("not a number\n")
+
+    result = solve_file(load_problems(1), path)
+    assert all(isinstance(s.exception, ValueError) for s in result.solutions)
@@ -0,0 +1,91 @@
+from io import StringIO
+from time import sleep
+
+import pytest
+
+from aoc21.bench.generators import GENERATORS, generate
+from aoc21.bench.scaling import (
+    Measurement,
+    _time,
+    fit_exponent,
+    measure_scaling,
+    scaled_sizes,
+)
+from aoc21.days import DAYS, load_problems
+from aoc21.limits import Timeout, can_limit_time
+
+
+def test_generators_cover_days():
+    assert set(GENERATORS) == set(DAYS)
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generate(day):
+    size = min(GENERATORS[day].size, 100)
+    text = generate(day, size)
+    assert text == generate(day, size)
+    assert text != generate(day, size, seed=1)
+
+    for problem in load_problems(day):
+        assert problem.solve(problem.parse(StringIO(text))) is not None
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_generate_diagnostic_ratings(seed):
+    # Random numbers would sometimes leave no carbon dioxide scrubber rating.
+    (_, part2) = load_problems(3)
+    for size in (1, 2, 3, 50):
+        assert part2.solve(part2.parse(StringIO(generate(3, size, seed)))) > 0
+
+
+def test_generate_invalid():
+    with pytest.raises(ValueError):
+        generate(26, 10)
+    with pytest.raises(ValueError):
+        generate(1, 0)
+
+
+def test_scaled_sizes():
+    assert scaled_sizes(20, 10, 3) == [20, 200, 2000]
+    assert scaled_sizes(6, 1.5, 3) == [6, 9, 14]
+    with pytest.raises(ValueError):
+        scaled_sizes(20, 1, 3)
+
+
+def test_fit_exponent():
+    linear = [Measurement(n, 2e-6 * n) for n in (10, 100, 1000)]
+    quadratic = [Measurement(n, 3e-9 * n**2) for n in (10, 100, 1000)]
+    assert fit_exponent(linear) == pytest.approx(1.0)
+    assert fit_exponent(quadratic) == pytest.approx(2.0)
+    assert fit_exponent(linear[:1]) is None
+
+
+def test_measure_scaling(tmp_path):
+    (problem, _) = load_problems(1)
+    scaling = measure_scaling(problem, [10, 20], tmp_path)
+    assert [m.size for m in scaling.measurements] == [10, 20]
+    assert all(m.elapsed_s > 0 for m in scaling.measurements)
+    assert scaling.stopped is None
+    assert scaling.exponent is not None
+
+
+def test_measure_scaling_predicted_timeout(tmp_path):
+    (problem, _) = load_problems(1)
+    scaling = measure_scaling(problem, [10, 10**9], tmp_path, timeout_s=1.0)
+    assert [m.size for m in scaling.measurements] == [10]
+    assert scaling.stopped == f"Predicted to time out at {10 ** 9}"
+    assert not scaling.failed
+
+
+@pytest.mark.skipif(not can_limit_time(), reason="Requires time limits.")
+def test_time_limits_repeats():
+    calls = []
+
+    def solve():
+        # Only the first call is fast, so the repeats are what time out.
+        calls.append(None)
+        if len(calls) > 1:
+            sleep(5)
+
+    with pytest.raises(Timeout):
+        _time(solve, 0.5)
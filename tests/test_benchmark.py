@@ -0,0 +1,159 @@
+from dataclasses import replace
+from itertools import count, cycle
+
+import pytest
+
+from aoc21.benchmark import BenchmarkSettings, sample, timer_overhead, warm_up
+from aoc21.days import load_problems
+from aoc21.runner import (
+    _solve_once,
+    _solve_timed,
+    _subtract_overhead,
+    _with_gc_as_cell,
+)
+from aoc21.solution import Solution, format_elapsed
+
+
+class FakeTimer:
+    """
+    A timer which takes the given total times for each call, in turn.
+    """
+
+    def __init__(self, *times: float):
+        self._times = cycle(times)
+        self.calls = 0
+
+    def timeit(self, number: int) -> float:
+        self.calls += 1
+        return next(self._times)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Each reading of the clock is a second after the last one.
+    ticks = count()
+    monkeypatch.setattr("aoc21.benchmark.perf_counter", lambda: float(next(ticks)))
+
+
+def test_sample_fixed(clock):
+    timers = [FakeTimer(2.0), FakeTimer(4.0, 6.0)]
+    samples = sample(timers, 2, BenchmarkSettings(repeat=3))
+
+    assert samples == [(1.0, 2.0), (1.0, 3.0), (1.0, 2.0)]
+
+
+def test_sample_invalid_repeat():
+    with pytest.raises(ValueError):
+        sample([FakeTimer(1.0)], 1, BenchmarkSettings(repeat=0))
+
+
+def test_sample_adaptive_until_narrow(clock):
+    # The interval of the median is only finite once there are 8 samples, and is
+    # then empty as every sample is the same.
+    settings = BenchmarkSettings(repeat=3, adaptive=True, budget_s=100)
+    samples = sample([FakeTimer(1.0)], 1, settings)
+
+    assert len(samples) == 8
+
+
+def test_sample_adaptive_at_least_repeat(clock):
+    settings = BenchmarkSettings(repeat=12, adaptive=True, budget_s=100)
+    samples = sample([FakeTimer(1.0)], 1, settings)
+
+    assert len(samples) == 12
+
+
+def test_sample_adaptive_max_repeat(clock):
+    # Times alternate between two values, so the interval never gets narrow enough.
+    settings = BenchmarkSettings(repeat=3, adaptive=True, budget_s=100, max_repeat=20)
+    samples = sample([FakeTimer(1.0, 2.0)], 1, settings)
+
+    assert len(samples) == 20
+
+
+def test_sample_adaptive_budget(clock):
+    # The clock is read once before sampling and once after each repeat is checked,
+    # so the budget runs out on the third check.
+    settings = BenchmarkSettings(repeat=3, adaptive=True, budget_s=2.5)
+    samples = sample([FakeTimer(1.0, 2.0)], 1, settings)
+
+    assert len(samples) == 5
+
+
+def test_sample_not_adaptive_ignores_budget(clock):
+    settings = BenchmarkSettings(repeat=10, budget_s=0)
+    samples = sample([FakeTimer(1.0, 2.0)], 1, settings)
+
+    assert len(samples) == 10
+
+
+def test_solve_timed():
+    (problem, _) = load_problems(1)
+    solution = _solve_timed(problem, BenchmarkSettings(repeat=3))
+
+    assert solution.exception is None
+    assert solution.value == _solve_once(problem).value
+    assert solution.runs >= 1
+    assert len(solution.samples_s) == 3
+    assert solution.elapsed_s == solution.parse_s + solution.solve_s
+    # The fastest of each phase may come from different repeats.
+    assert solution.elapsed_s <= min(solution.samples_s)
+    assert solution.with_gc_s is None
+    assert solution.overhead_s is None
+
+
+def test_solve_timed_adaptive():
+    (problem, _) = load_problems(1)
+    settings = BenchmarkSettings(repeat=3, adaptive=True, max_repeat=4, target=0)
+    solution = _solve_timed(problem, settings)
+
+    assert len(solution.samples_s) == 4
+
+
+def test_solve_timed_failed():
+    (problem, _) = load_problems(1)
+
+    def fail(data):
+        raise ValueError("Failed")
+
+    solution = _solve_timed(replace(problem, solve=fail), BenchmarkSettings(repeat=3))
+
+    assert isinstance(solution.exception, ValueError)
+    assert solution.samples_s == ()
+
+
+def test_warm_up():
+    timers = [FakeTimer(1.0), FakeTimer(2.0)]
+    warm_up(timers, 10, 3)
+
+    assert [t.calls for t in timers] == [3, 3]
+
+
+def test_timer_overhead():
+    overhead_s = timer_overhead(1000)
+
+    assert 0 < overhead_s < 1e-3
+
+
+def test_subtract_overhead():
+    samples = _subtract_overhead([(3.0, 1.0), (2.0, 0.5)], 1.0)
+
+    assert samples == [(2.0, 0.0), (1.0, 0.0)]
+
+
+def test_solve_timed_stable():
+    (problem, _) = load_problems(1)
+    settings = BenchmarkSettings(repeat=3, gc="both", stable=True, warmup=1)
+    solution = _solve_timed(problem, settings)
+
+    assert solution.overhead_s > 0
+    assert len(solution.samples_s) == 3
+    assert solution.with_gc_s is not None
+    assert all(s >= 0 for s in solution.samples_s)
+
+
+def test_with_gc_as_cell_without_elapsed_time():
+    (problem, _) = load_problems(1)
+    solution = Solution(problem, 1, None, 0.0, 1, with_gc_s=2e-6, overhead_s=1e-6)
+
+    assert _with_gc_as_cell(solution) == format_elapsed(2e-6)
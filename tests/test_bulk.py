@@ -0,0 +1,34 @@
+from io import BytesIO, StringIO, TextIOWrapper
+
+import pytest
+
+from aoc21.bulk import digit_grid, ints, read_buffer, split_blocks, split_ints
+
+
+def test_read_buffer_from_text():
+    assert read_buffer(StringIO("1\n2\n")) == b"1\n2\n"
+    assert read_buffer(TextIOWrapper(BytesIO(b"1\n2\n"))) == b"1\n2\n"
+
+
+def test_read_buffer_from_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"3,4,3,1,2\n")
+
+    with path.open() as f:
+        assert read_buffer(f) == b"3,4,3,1,2\n"
+
+
+def test_ints():
+    assert split_ints(b"3,4,3,1,2\n") == (3, 4, 3, 1, 2)
+    assert ints(b"199\n200\r\n 208\n") == (199, 200, 208)
+
+
+def test_digit_grid():
+    assert digit_grid(b"2199\n3987\n") == ((2, 1, 9, 9), (3, 9, 8, 7))
+    with pytest.raises(ValueError):
+        digit_grid(b"2199\n39a7\n")
+
+
+def test_split_blocks():
+    data = b"7,4,9\n\n22 13\n 8  2\n\n3 15\r\n\r\n9 18\n\n"
+    assert split_blocks(data) == [b"7,4,9", b"22 13\n 8  2", b"3 15", b"9 18"]
@@ -0,0 +1,74 @@
+from aoc21.cache import DiskCache, dependencies, source_digest
+from aoc21.days import load_problems
+from aoc21.limits import Limits
+from aoc21.runner import execute
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path / "cache")
+    assert cache.get("a") == (False, None)
+
+    cache.put("a", (1, "two"))
+    assert cache.get("a") == (True, (1, "two"))
+
+    cache.clear()
+    assert cache.get("a") == (False, None)
+
+
+def test_disk_cache_unreadable(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("a", 1)
+    (tmp_path / "a.pickle").write_bytes(b"not a pickle")
+
+    assert cache.get("a") == (False, None)
+    assert not (tmp_path / "a.pickle").exists()
+
+
+def test_disk_cache_evicts(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    cache.put("a", b"x" * 40)
+    cache.put("b", b"x" * 40)
+    cache.put("c", b"x" * 40)
+
+    assert sum(found for found, _ in map(cache.get, "abc")) < 3
+    assert cache.get("c")[0]
+
+
+def test_dependencies():
+    found = dependencies("aoc21.days.day09")
+    assert "aoc21.days.day09" in found
+    assert "aoc21.bulk" in found
+    assert "aoc21.inputs" in found
+    # Dependencies of dependencies are included too.
+    assert "aoc21.cache" in found
+    assert source_digest("aoc21.days.day09") != source_digest("aoc21.days.day01")
+
+
+def test_execute_uses_cache(tmp_path):
+    cache = DiskCache(tmp_path)
+    problems = load_problems(1)
+
+    first = execute(problems, parallel=False, result_cache=cache)
+    assert not any(s.cached for s in first)
+
+    second = execute(problems, parallel=False, result_cache=cache)
+    assert all(s.cached for s in second)
+    assert [s.value for s in second] == [s.value for s in first]
+
+
+def test_execute_skips_cache_when_measuring(tmp_path):
+    cache = DiskCache(tmp_path)
+    problems = load_problems(1)
+    execute(problems, parallel=False, result_cache=cache)
+
+    solutions = execute(problems, parallel=False, result_cache=cache, memory=True)
+    assert not any(s.cached for s in solutions)
+    assert all(s.peak_bytes is not None for s in solutions)
+
+    solutions = execute(problems, parallel=False, result_cache=cache, usage=True)
+    assert not any(s.cached for s in solutions)
+    assert all(s.cpu_user_s is not None for s in solutions)
+
+    limits = Limits(timeout_s=10)
+    solutions = execute(problems, parallel=False, result_cache=cache, limits=limits)
+    assert not any(s.cached for s in solutions)
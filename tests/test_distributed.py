@@ -0,0 +1,124 @@
+import os
+from multiprocessing import get_context
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+from aoc21.distributed import (
+    RemoteError,
+    WorkerLost,
+    create_server,
+    distribute,
+    parse_address,
+)
+from aoc21.days import get_problems
+from aoc21.inputs import set_input_paths
+from aoc21.runner import execute
+
+
+def _square(x):
+    return x * x
+
+
+def _slow_square(x):
+    # Longer than the heartbeat timeout, so only finishes if heartbeats are sent.
+    sleep(0.5)
+    return x * x
+
+
+def _fail(x):
+    raise ValueError(x)
+
+
+def _exit(x):
+    os._exit(1)
+
+
+def _failed(item, error):
+    return error
+
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork.")
+
+
+@pytest.fixture
+def address():
+    # The worker runs in another process, like it would on another host, so its
+    # processes do not inherit connections opened by the tests.
+    server = create_server(("localhost", 0))
+    process = get_context("fork").Process(target=server.serve_forever, daemon=True)
+    process.start()
+    server.socket.close()
+    yield server.server_address[:2]
+    process.terminate()
+    process.join()
+
+
+def test_parse_address():
+    assert parse_address("localhost:4021") == ("localhost", 4021)
+    assert parse_address("[::1]:4021") == ("::1", 4021)
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+def test_distribute(address):
+    results = dict(distribute(_square, range(10), [address, address], _failed))
+
+    assert results == {i: i * i for i in range(10)}
+
+
+def test_distribute_heartbeats(address):
+    results = dict(distribute(_slow_square, [3], [address], _failed, heartbeat_s=0.1))
+
+    assert results == {0: 9}
+
+
+def test_distribute_remote_error(address):
+    ((index, result),) = distribute(_fail, [1], [address], _failed)
+
+    assert index == 0
+    assert isinstance(result, RemoteError)
+
+
+def test_distribute_lost_worker(address):
+    results = dict(distribute(_exit, [1], [address] * 3, _failed, retries=1))
+
+    assert isinstance(results[0], WorkerLost)
+
+
+def test_distribute_no_workers():
+    # Nothing listens on the port reserved for the discard protocol.
+    results = dict(distribute(_square, [1, 2], [("localhost", 9)], _failed))
+
+    assert all(isinstance(r, WorkerLost) for r in results.values())
+
+
+def test_execute_remote(address):
+    solutions = execute(get_problems([1]), remote=[address, address])
+
+    assert [(s.problem.part, s.exception) for s in solutions] == [(1, None), (2, None)]
+
+
+def test_execute_remote_input_file(address, tmp_path, monkeypatch):
+    # The path is relative to this process, which the worker does not share.
+    (tmp_path / "input.txt").write_text("199\n200\n208\n210\n200\n207\n240\n269\n")
+    monkeypatch.chdir(tmp_path)
+    set_input_paths({1: Path("input.txt")})
+    try:
+        solutions = execute(get_problems([1]), remote=[address])
+    finally:
+        set_input_paths({})
+
+    assert [(s.value, s.exception) for s in solutions] == [(6, None), (3, None)]
+
+
+def test_distribute_initial_send_fails(address, monkeypatch, caplog):
+    def send(self, value):
+        raise OSError("Broken pipe")
+
+    monkeypatch.setattr("aoc21.distributed._Connection.send", send)
+    results = dict(distribute(_square, [1, 2], [address], _failed))
+
+    assert all(isinstance(r, WorkerLost) for r in results.values())
+    assert "Lost worker" in caplog.text
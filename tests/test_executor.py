@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aoc21.days import get_problems
+from aoc21.executor import ExecutorSettings, create_executor
+from aoc21.runner import execute
+
+
+def test_create_thread_executor():
+    with create_executor(ExecutorSettings("thread"), 2) as pool:
+        assert isinstance(pool, ThreadPoolExecutor)
+        assert pool.submit(sum, [1, 2]).result() == 3
+
+
+def test_create_unknown_executor():
+    with pytest.raises(ValueError):
+        create_executor(ExecutorSettings("fibre"), 2)
+
+
+def test_inline_is_not_parallel():
+    assert ExecutorSettings().parallel
+    assert not ExecutorSettings("inline").parallel
+
+
+def test_execute_with_threads():
+    problems = get_problems([1, 2])
+    threaded = execute(problems, workers=2, executor=ExecutorSettings("thread"))
+    inline = execute(problems, executor=ExecutorSettings("inline"))
+
+    assert [s.problem for s in threaded] == problems
+    assert [s.value for s in threaded] == [s.value for s in inline]
@@ -0,0 +1,90 @@
+from aoc21.history import (
+    Comparison,
+    append_record,
+    compare,
+    create_record,
+    find_baseline,
+    read_records,
+)
+from aoc21.problem import Problem
+from aoc21.runner import _comparison_as_row
+from aoc21.solution import Solution
+
+
+def _solution(day: int, part: int, samples):
+    problem = Problem(day, part, lambda: None)
+    return Solution(problem, 0, None, min(samples), 1, samples_s=tuple(samples))
+
+
+def _record(revision, problems):
+    return {"timestamp": "", "revision": revision, "problems": problems}
+
+
+def test_find_baseline(tmp_path):
+    path = tmp_path / "history.jsonl"
+    assert find_baseline(path) is None
+
+    append_record(path, _record("abc123", {}))
+    append_record(path, _record("def456", {}))
+
+    assert find_baseline(path)["revision"] == "def456"
+    assert find_baseline(path, "abc")["revision"] == "abc123"
+    assert find_baseline(path, "xyz") is None
+
+
+def test_compare():
+    baseline = _record(
+        None,
+        {
+            "1.1": {"min_s": 1.0, "median_s": 1.0},
+            "1.2": {"min_s": 1.0, "median_s": 1.0},
+            "2.1": {"min_s": 1.0, "median_s": 1.0},
+        },
+    )
+    solutions = [
+        _solution(1, 1, [1.05, 1.05, 1.05]),
+        _solution(1, 2, [1.0, 1.5, 1.5]),
+        _solution(2, 1, [1.5, 1.5, 1.5]),
+        _solution(3, 1, [2.0]),
+    ]
+
+    comparisons = compare(baseline, solutions, 0.1)
+    assert [(c.name, c.regressed) for c in comparisons] == [
+        ("1.1", False),
+        ("1.2", True),
+        ("2.1", True),
+    ]
+
+
+def test_create_record():
+    solutions = [
+        _solution(1, 1, [1.0, 2.0, 3.0]),
+        Solution(Problem(1, 2, lambda: None), None, ValueError(), 1.0, 1),
+        Solution(Problem(2, 1, lambda: None), 0, None, 1.0, 0, cached=True),
+    ]
+
+    record = create_record(solutions)
+    assert set(record) == {"timestamp", "revision", "python", "problems"}
+    assert list(record["problems"]) == ["1.1"]
+    assert record["problems"]["1.1"]["min_s"] == 1.0
+    assert record["problems"]["1.1"]["median_s"] == 2.0
+    assert record["problems"]["1.1"]["samples_s"] == [1.0, 2.0, 3.0]
+
+
+def test_read_records(tmp_path):
+    path = tmp_path / "history.jsonl"
+    first = create_record([_solution(1, 1, [1.0, 2.0])])
+    second = _record("abc123", {})
+    append_record(path, first)
+    with path.open("a", encoding="utf-8") as f:
+        f.write("not json\n\n")
+    append_record(path, second)
+
+    assert list(read_records(path)) == [first, second]
+    assert list(read_records(tmp_path / "missing.jsonl")) == []
+
+
+def test_comparison_without_baseline_time():
+    comparison = Comparison("1.1", 0.0, 1e-6, 0.0, 1e-6, True)
+
+    assert _comparison_as_row(comparison)[5] == ""
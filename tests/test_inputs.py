@@ -0,0 +1,102 @@
+from aoc21.cache import DiskCache
+from aoc21.days import day01
+from aoc21.inputs import (
+    InputCache,
+    input_digest,
+    invalidate_input,
+    load_input,
+    read_input,
+    set_disk_cache,
+    set_input_paths,
+)
+
+
+def test_input_cache_loads_once():
+    cache = InputCache()
+    loaded = []
+
+    def load():
+        loaded.append(1)
+        return (1, 2, 3)
+
+    assert cache.get(1, "day01.txt", load) == (1, 2, 3)
+    assert cache.get(1, "day01.txt", load) == (1, 2, 3)
+    assert len(loaded) == 1
+
+
+def test_input_cache_evicts_least_recently_used():
+    cache = InputCache(max_size=2)
+    cache.get(1, "a", lambda: 1)
+    cache.get(2, "a", lambda: 2)
+    cache.get(1, "a", lambda: 1)
+    cache.get(3, "a", lambda: 3)
+
+    assert (1, "a") in cache
+    assert (2, "a") not in cache
+    assert (3, "a") in cache
+
+
+def test_input_cache_invalidate():
+    cache = InputCache()
+    cache.get(1, "a", lambda: 1)
+    cache.get(1, "b", lambda: 1)
+    cache.get(2, "a", lambda: 2)
+
+    cache.invalidate(1, "a")
+    assert len(cache) == 2
+
+    cache.invalidate(1)
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_input_paths_override_packaged_input(tmp_path):
+    path = tmp_path / "day01.txt"
+    path.write_text("1\n2\n3\n")
+    packaged = input_digest(1)
+
+    set_input_paths({1: path})
+    try:
+        assert read_input(1, day01.parse) == (1, 2, 3)
+        assert load_input(1, day01.parse) == (1, 2, 3)
+        assert input_digest(1) != packaged
+    finally:
+        set_input_paths({})
+        invalidate_input(1)
+
+    assert input_digest(1) == packaged
+
+
+def test_disk_cache_reuses_parsed_input(tmp_path):
+    parsed = []
+
+    def parse(f):
+        parsed.append(1)
+        return day01.parse(f)
+
+    # Keys include the parser's module and name, so look like the real parser.
+    parse.__module__ = day01.parse.__module__
+    parse.__qualname__ = day01.parse.__qualname__
+
+    path = tmp_path / "day01.txt"
+    path.write_text("1\n2\n3\n")
+    set_disk_cache(DiskCache(tmp_path / "cache"))
+    set_input_paths({1: path})
+    try:
+        assert load_input(1, parse) == (1, 2, 3)
+        # Only the copy in this process is discarded, as if another process loaded it.
+        invalidate_input(1)
+        assert load_input(1, parse) == (1, 2, 3)
+        assert len(parsed) == 1
+
+        # Changing the input changes the key, so it is parsed again.
+        path.write_text("1\n2\n3\n4\n")
+        invalidate_input(1)
+        assert load_input(1, parse) == (1, 2, 3, 4)
+        assert len(parsed) == 2
+    finally:
+        set_disk_cache(None)
+        set_input_paths({})
+        invalidate_input(1)
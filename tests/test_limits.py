@@ -0,0 +1,51 @@
+from itertools import count
+
+import pytest
+
+from aoc21.limits import Limits, Timeout, can_limit_memory, can_limit_time, limited
+from aoc21.problem import Problem
+from aoc21.runner import execute
+
+_calls = count()
+
+
+def _slow_after_first_call() -> int:
+    if next(_calls) > 0:
+        for _ in count():
+            pass
+    return 1
+
+
+@pytest.mark.skipif(not can_limit_time(), reason="Timeouts are not supported.")
+def test_timeout():
+    with pytest.raises(Timeout):
+        with limited(Limits(timeout_s=0.05)):
+            for _ in count():
+                pass
+
+
+@pytest.mark.skipif(not can_limit_memory(), reason="Memory limits are not supported.")
+def test_memory_limit():
+    with pytest.raises(MemoryError):
+        with limited(Limits(max_bytes=50 * 2**20)):
+            bytearray(500 * 2**20)
+
+    # The limit is removed afterwards.
+    assert len(bytearray(100 * 2**20)) == 100 * 2**20
+
+
+@pytest.mark.skipif(not can_limit_time(), reason="Timeouts are not supported.")
+def test_timeout_while_measuring():
+    # The first run is within the limit, but the extra run measuring memory is not.
+    problem = Problem(0, 1, _slow_after_first_call)
+    limits = Limits(timeout_s=0.5)
+    (solution,) = execute([problem], parallel=False, memory=True, limits=limits)
+
+    assert isinstance(solution.exception, Timeout)
+    assert solution.value is None
+
+
+def test_no_limits():
+    assert not Limits().enabled
+    with limited(Limits()):
+        pass
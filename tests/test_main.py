@@ -0,0 +1,26 @@
+import pytest
+
+from aoc21.history import append_record, read_records
+from aoc21.main import main_fn
+
+
+@pytest.mark.parametrize("option", ["-p", "--flamegraph"])
+def test_remote_rejects_profiling(option, capsys):
+    with pytest.raises(SystemExit) as raised:
+        main_fn(["1", "--remote", "localhost:9", option])
+
+    assert raised.value.code == 2
+    assert "not compatible with profiling" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("baseline_s, code", [(1e-12, 1), (1e3, 0)])
+def test_compare(baseline_s, code, tmp_path, capsys):
+    times = {"min_s": baseline_s, "median_s": baseline_s}
+    history = tmp_path / "history.jsonl"
+    append_record(history, {"revision": None, "problems": {"1.1": times}})
+    args = ["1", "-s", "-b", "-r", "1", "--cache-dir", str(tmp_path)]
+
+    assert main_fn([*args, "--history", str(history), "--compare"]) == code
+    regressed = "1 solution(s) regressed" in capsys.readouterr().out
+    assert regressed == bool(code)
+    assert len(list(read_records(history))) == 2
@@ -0,0 +1,32 @@
+from tracemalloc import is_tracing
+
+import pytest
+
+from aoc21.memory import current_rss, measure_memory
+
+
+def _allocate() -> int:
+    data = bytearray(4 * 1024 * 1024)
+    return len(data)
+
+
+def _fail():
+    raise ValueError("Failed.")
+
+
+def test_measure_memory():
+    result, usage = measure_memory(_allocate)
+    assert result == 4 * 1024 * 1024
+    assert usage.peak_bytes >= 4 * 1024 * 1024
+    assert not is_tracing()
+
+
+def test_measure_memory_raises():
+    with pytest.raises(ValueError):
+        measure_memory(_fail)
+    assert not is_tracing()
+
+
+def test_current_rss():
+    rss = current_rss()
+    assert rss is None or rss > 0
@@ -0,0 +1,58 @@
+from csv import DictReader
+from io import StringIO
+from json import loads
+
+from aoc21.output import FIELDS, write_csv, write_json, write_ndjson
+from aoc21.problem import Problem
+from aoc21.solution import Solution
+
+
+SOLUTIONS = [
+    Solution(Problem(1, 1, lambda: None), 7, None, 0.002, 10, samples_s=(0.002, 0.004)),
+    Solution(Problem(1, 2, lambda: None), None, ValueError("bad input"), 0.001, 1),
+    Solution(Problem(2, 1, lambda: None), ("a", 1), None, 0.003, 1, cached=True),
+]
+
+
+def test_write_json():
+    f = StringIO()
+    write_json(SOLUTIONS, 0.5, f)
+    record = loads(f.getvalue())
+
+    assert record["wall_s"] == 0.5
+    first, failed, cached = record["solutions"]
+    assert first["value"] == 7
+    assert first["repeats"] == 2
+    assert first["median_s"] == 0.003
+    assert first["samples_s"] == [0.002, 0.004]
+    assert failed["exception_type"] == "ValueError"
+    assert failed["exception_message"] == "bad input"
+    assert failed["median_s"] is None
+    # Values which cannot be serialised are written as strings.
+    assert cached["value"] == "('a', 1)"
+    assert cached["cached"] is True
+
+
+def test_write_ndjson():
+    f = StringIO()
+    for solution in SOLUTIONS:
+        write_ndjson(solution, f)
+
+    lines = f.getvalue().splitlines()
+    assert [(r["day"], r["part"]) for r in map(loads, lines)] == [
+        (1, 1),
+        (1, 2),
+        (2, 1),
+    ]
+
+
+def test_write_csv():
+    f = StringIO()
+    write_csv(SOLUTIONS, f)
+    f.seek(0)
+    reader = DictReader(f)
+
+    assert tuple(reader.fieldnames) == FIELDS
+    rows = list(reader)
+    assert [r["value"] for r in rows] == ["7", "", "('a', 1)"]
+    assert rows[0]["elapsed_s"] == "0.002"
@@ -0,0 +1,35 @@
+from aoc21.profiling import find_hotspots, profile_call, profile_path
+
+
+def _inner() -> int:
+    return sum(range(10000))
+
+
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+def test_profile_path(tmp_path):
+    assert profile_path(tmp_path, 1, 2, ".prof") == tmp_path / "day01-part2.prof"
+
+
+def test_profile_call(tmp_path):
+    path = tmp_path / "nested" / "outer.prof"
+    assert profile_call(_outer, path) == 2 * sum(range(10000))
+    assert path.exists()
+
+    hotspots = find_hotspots(path)
+    functions = [h.function for h in hotspots]
+    outer = next(h for h in hotspots if h.function.endswith("(_outer)"))
+    inner = next(h for h in hotspots if h.function.endswith("(_inner)"))
+    assert functions.index(outer.function) < functions.index(inner.function)
+    assert outer.calls == 1
+    assert inner.calls == 2
+    assert not any("disable" in f for f in functions)
+
+
+def test_find_hotspots_top(tmp_path):
+    path = tmp_path / "outer.prof"
+    profile_call(_outer, path)
+
+    assert len(find_hotspots(path, top=1)) == 1
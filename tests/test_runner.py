@@ -0,0 +1,77 @@
+from threading import Event
+
+from aoc21.days import get_problems
+from aoc21.executor import ExecutorSettings
+from aoc21.inputs import INPUT_CACHE
+from aoc21.problem import Problem
+from aoc21.runner import _print_makespan, _solve_once, execute, run
+from aoc21.solution import Solution
+
+
+def test_execute_streams_solutions():
+    released = Event()
+    streamed = []
+
+    def on_solution(solution):
+        streamed.append(solution.problem.day)
+        released.set()
+
+    # The slow problem only finishes quickly if the fast one is streamed first.
+    slow = Problem(1, 1, lambda: released.wait(10))
+    fast = Problem(2, 1, lambda: "fast")
+    solutions = execute(
+        [slow, fast],
+        workers=2,
+        on_solution=on_solution,
+        executor=ExecutorSettings("thread"),
+    )
+
+    assert streamed == [2, 1]
+    assert [(s.problem, s.value) for s in solutions] == [(slow, True), (fast, "fast")]
+
+
+def test_run_streams_then_prints_table(capsys):
+    assert run([1], parallel=False, stream=True)
+
+    lines = capsys.readouterr().out.splitlines()
+    streamed = [i for i, line in enumerate(lines) if line.startswith("1.")]
+    rows = [i for i, line in enumerate(lines) if line.startswith("|   1.")]
+    assert len(streamed) == len(rows) == len(get_problems([1]))
+    assert max(streamed) < min(rows)
+
+
+def test_solve_once_phases():
+    part1, part2 = get_problems([1])
+    INPUT_CACHE.invalidate(1)
+
+    first = _solve_once(part1)
+    assert not first.parse_cached
+    assert first.parse_s > 0 and first.solve_s > 0
+    assert first.elapsed_s >= first.parse_s + first.solve_s
+
+    # The second part reuses the input parsed for the first.
+    second = _solve_once(part2)
+    assert second.parse_cached
+    assert second.parse_s is None and second.solve_s > 0
+    assert second.parse_elapsed == "cached"
+
+
+def test_solve_once_without_phases():
+    solution = _solve_once(Problem(1, 1, lambda: 1))
+
+    assert solution.value == 1
+    assert (solution.parse_s, solution.solve_s) == (None, None)
+    assert solution.parse_elapsed == solution.solve_elapsed == ""
+
+
+def test_print_makespan_uses_busy_workers(capsys):
+    solutions = [
+        Solution(Problem(1, 1, lambda: None), 1, None, 1.0, 1),
+        Solution(Problem(2, 1, lambda: None), 2, None, 1.0, 1),
+        Solution(Problem(3, 1, lambda: None), 3, None, 2.0, 1),
+    ]
+    _print_makespan(solutions, 2.5, 8)
+
+    out = capsys.readouterr().out
+    assert "with 3 workers" in out
+    assert "(ideal 2000.0 ms, 80% efficient)" in out
@@ -0,0 +1,53 @@
+from threading import Thread
+
+import pytest
+
+from aoc21.sampling import SamplingProfiler, sample_call
+
+
+def _busy():
+    return sum(i * i for i in range(20000))
+
+
+def _outer():
+    return _busy()
+
+
+def _sampled(profiler):
+    return profiler.run(_outer, duration=0.05)
+
+
+def _check_stacks(profiler):
+    assert profiler.count > 0
+    for stack in profiler.stacks:
+        # Stacks start from the profiled function, not the profiler.
+        assert stack[0].startswith("_outer (test_sampling.py:")
+
+
+def test_sample_with_signal():
+    profiler = SamplingProfiler(1e-3)
+    assert _sampled(profiler) == _busy()
+    _check_stacks(profiler)
+
+
+def test_sample_with_thread():
+    # Signals can only be handled by the main thread.
+    profiler = SamplingProfiler(1e-3)
+    thread = Thread(target=_sampled, args=(profiler,))
+    thread.start()
+    thread.join()
+    _check_stacks(profiler)
+
+
+def test_sample_call(tmp_path):
+    path = tmp_path / "stacks" / "day01-part1.folded"
+    result, count = sample_call(_outer, path, 1e-3, 0.05)
+
+    assert result == _busy()
+    lines = path.read_text().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == count
+
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        SamplingProfiler(0)
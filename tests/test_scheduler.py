@@ -0,0 +1,56 @@
+from aoc21.problem import Problem
+from aoc21.scheduler import (
+    group_problems,
+    ideal_makespan,
+    list_makespan,
+    schedule,
+)
+
+
+def _parse(f):
+    return f.read()
+
+
+def _solve(data):
+    return data
+
+
+PROBLEMS = [
+    Problem(1, 1, lambda: None, _parse, _solve),
+    Problem(1, 2, lambda: None, _parse, _solve),
+    Problem(2, 1, lambda: None),
+    Problem(2, 2, lambda: None),
+    Problem(3, 1, lambda: None, _parse, _solve),
+]
+
+
+def test_group_problems():
+    groups = group_problems(PROBLEMS)
+    assert [[(p.day, p.part) for p in g] for g in groups] == [
+        [(1, 1), (1, 2)],
+        [(2, 1)],
+        [(2, 2)],
+        [(3, 1)],
+    ]
+
+
+def test_schedule_longest_first():
+    estimates = {"1.1": 1.0, "1.2": 2.0, "2.1": 0.5, "2.2": 4.0}
+    jobs = schedule(PROBLEMS, estimates)
+
+    # Day 3 part 1 has no estimate so is assumed to be the most expensive problem.
+    assert [(j.problems[0].day, j.problems[0].part) for j in jobs] == [
+        (2, 2),
+        (3, 1),
+        (1, 1),
+        (2, 1),
+    ]
+    assert [j.cost_s for j in jobs] == [4.0, 4.0, 3.0, 0.5]
+
+
+def test_makespan():
+    costs = [5.0, 4.0, 3.0, 3.0, 3.0]
+    assert ideal_makespan(costs, 2) == 9.0
+    assert list_makespan(costs, 2) == 10.0
+    assert list_makespan(costs, 10) == 5.0
+    assert ideal_makespan([], 2) == 0.0
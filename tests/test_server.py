@@ -0,0 +1,67 @@
+from threading import Thread
+
+import pytest
+
+from aoc21.inputs import set_input_paths
+from aoc21.server import SolverServer, query
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = SolverServer(tmp_path / "server.sock")
+    thread = Thread(target=server.run)
+    thread.start()
+    yield server
+    query(server.path, [{"command": "shutdown"}])
+    thread.join()
+
+
+def test_solve(server):
+    (response,) = query(server.path, [{"day": 1, "part": 2}])
+
+    assert response["ok"]
+    assert [(s["day"], s["part"]) for s in response["solutions"]] == [(1, 2)]
+    assert response["solutions"][0]["exception_type"] is None
+
+
+def test_input_file(server, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+    first = query(server.path, [{"day": 1, "part": 1, "input": str(path)}])
+
+    path.write_text("1\n2\n3\n4\n")
+    second = query(server.path, [{"day": 1, "part": 1, "input": str(path)}])
+
+    assert first[0]["solutions"][0]["value"] == 2
+    assert second[0]["solutions"][0]["value"] == 3
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [{"day": 99}, {"day": "1"}, {"day": 1, "part": 3}, {"command": "nope"}, [1]],
+)
+def test_errors(server, request_):
+    (response,) = query(server.path, [request_])
+
+    assert not response["ok"]
+    assert response["error"]
+
+
+def test_already_listening(server):
+    with pytest.raises(ValueError):
+        SolverServer(server.path)
+
+
+def test_preloaded_input_changed(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+    server = SolverServer(tmp_path / "server.sock", {1: path})
+    try:
+        server.preload()
+        path.write_text("1\n2\n3\n4\n")
+        response = server.respond({"day": 1, "part": 1})
+    finally:
+        server.server_close()
+        set_input_paths({})
+
+    assert response["solutions"][0]["value"] == 3
@@ -0,0 +1,46 @@
+from aoc21.days import day01, day11
+from aoc21.problem import Problem
+from aoc21.scheduler import group_problems
+from aoc21.shared import attach, is_shareable, publish, release
+
+
+def test_is_shareable():
+    assert is_shareable((1, 2, 3))
+    assert is_shareable(((1, 2), (3, 4)))
+    assert not is_shareable(())
+    assert not is_shareable([1, 2, 3])
+    assert not is_shareable(((1, 2), (3,)))
+    assert not is_shareable(("a", "b"))
+    assert not is_shareable((1 << 64,))
+
+
+def test_publish_and_attach_numbers():
+    measurements = (199, 200, 208, 210, 200, 207, 240, 269, 260, 263)
+    memory, shared = publish(measurements)
+    try:
+        view = attach(shared)
+        assert tuple(view) == measurements
+        assert day01.solve1(view) == 7
+        assert day01.solve2(view) == 5
+    finally:
+        release(memory)
+
+
+def test_publish_and_attach_grid():
+    levels = ((1, 1, 1, 1, 1), (1, 9, 9, 9, 1), (1, 9, 1, 9, 1), (1, 1, 1, 1, 1))
+    memory, shared = publish(levels)
+    try:
+        rows = attach(shared)
+        assert tuple(map(tuple, rows)) == levels
+        assert day11.solve1(rows) == day11.solve1(levels)
+    finally:
+        release(memory)
+
+
+def test_group_problems_split_days():
+    problems = [
+        Problem(1, 1, lambda: None, day01.parse, day01.solve1),
+        Problem(1, 2, lambda: None, day01.parse, day01.solve2),
+    ]
+    assert len(group_problems(problems)) == 1
+    assert len(group_problems(problems, split_days={1})) == 2
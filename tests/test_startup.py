@@ -0,0 +1,32 @@
+from os import environ
+from pathlib import Path
+from subprocess import check_output
+from sys import executable
+
+import aoc21
+from aoc21.startup import ImportTime, parse_import_times
+
+
+def test_parse_import_times():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   _io",
+        "import time:       300 |        420 | io",
+        "some other output",
+        "import time:      1000 |       5000 |     aoc21.days.day01",
+    ]
+    assert parse_import_times(lines) == [
+        ImportTime("_io", 1, 120, 120),
+        ImportTime("io", 0, 300, 420),
+        ImportTime("aoc21.days.day01", 2, 1000, 5000),
+    ]
+
+
+def test_slow_modules_not_imported():
+    # Modules only some commands need must not be imported when starting up.
+    code = "import sys, aoc21.main; print(' '.join(sys.modules))"
+    env = {**environ, "PYTHONPATH": str(Path(aoc21.__file__).parents[1])}
+    imported = check_output([executable, "-c", code], env=env, text=True).split()
+
+    slow = ["asyncio", "cProfile", "platform", "pstats", "socket", "tabulate"]
+    assert [m for m in slow if m in imported] == []
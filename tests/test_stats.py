@@ -0,0 +1,40 @@
+from math import inf
+
+import pytest
+
+from aoc21.stats import (
+    coefficient_of_variation,
+    median_interval,
+    percentile,
+    relative_interval_width,
+    standard_deviation,
+)
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [(0, 1.0), (50, 3.0), (95, 4.8), (100, 5.0)],
+)
+def test_percentile(q, expected):
+    assert percentile([5.0, 1.0, 3.0, 2.0, 4.0], q) == pytest.approx(expected)
+
+
+def test_standard_deviation_single_sample():
+    assert standard_deviation([1.0]) == 0.0
+
+
+def test_coefficient_of_variation():
+    assert coefficient_of_variation([2.0, 4.0]) == pytest.approx(2**0.5 / 3)
+    assert coefficient_of_variation([0.0, 0.0]) == 0.0
+
+
+def test_median_interval_too_few_samples():
+    assert median_interval([1.0, 2.0, 3.0]) == (-inf, inf)
+    assert relative_interval_width([1.0, 2.0, 3.0]) == inf
+
+
+def test_median_interval():
+    samples = [float(i) for i in range(1, 101)]
+    lower, upper = median_interval(samples)
+    assert lower < 50.5 < upper
+    assert (lower, upper) == (40.0, 61.0)
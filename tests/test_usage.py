@@ -0,0 +1,24 @@
+from gc import collect
+
+from aoc21.usage import UsageMeter
+
+
+def test_usage_meter():
+    with UsageMeter() as meter:
+        collect()
+        sum(range(100000))
+
+    usage = meter.usage
+    assert usage.cpu_user_s >= 0
+    assert usage.cpu_sys_s >= 0
+    assert usage.gc_collections[2] >= 1
+    assert usage.gc_s > 0
+
+
+def test_usage_meter_stops_counting():
+    with UsageMeter() as meter:
+        pass
+    collect()
+
+    assert meter.usage.gc_collections == (0, 0, 0)
+    assert meter.usage.gc_s == 0
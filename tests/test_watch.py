@@ -0,0 +1,20 @@
+from aoc21.inputs import set_input_paths
+from aoc21.watch import Watcher
+
+
+def test_watcher(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n")
+    set_input_paths({1: path})
+    try:
+        watcher = Watcher([1, 2])
+        assert not watcher.poll().days
+
+        path.write_text("1\n2\n3\n")
+        changes = watcher.poll()
+        assert changes.inputs == {1}
+        assert not changes.modules
+
+        assert not watcher.poll().days
+    finally:
+        set_input_paths({})